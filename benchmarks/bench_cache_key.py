@@ -0,0 +1,64 @@
+# Cost of the request keys of the cache, the subscriptions and the coalesced calls: the canonical request_key against
+# the pickle based key it replaced, which depends on the field order. A key is built and looked up in a dict, as the
+# callers do. The two keys are measured in turns and the best run of each is compared, so a slow moment of the machine
+# does not decide the result. Exits with an error when the canonical key of a flat request is not cheaper than its
+# pickled key. Nested requests are only reported: their nested dicts are sorted too, which pickling does not do.
+# run it like PYTHONPATH=. python3 benchmarks/bench_cache_key.py
+import pickle
+import sys
+import time
+
+from deriv_api.utils import request_key
+
+CALLS = 20000
+REPEATS = 9
+
+REQUESTS = {
+    'ticks': {'ticks': 'R_100', 'subscribe': 1, 'req_id': 1},
+    'proposal': {'proposal': 1, 'amount': 10, 'basis': 'stake', 'contract_type': 'CALL', 'currency': 'USD',
+                 'duration': 5, 'duration_unit': 't', 'symbol': 'R_100', 'req_id': 1},
+    'buy': {'buy': 1, 'price': 10, 'parameters': {'amount': 10, 'basis': 'stake', 'contract_type': 'CALL',
+                                                  'currency': 'USD', 'duration': 5, 'duration_unit': 't',
+                                                  'symbol': 'R_100'}, 'req_id': 1},
+}
+
+
+def pickle_key(obj):
+    cloned_obj = obj.copy()
+    for key in ['req_id', 'passthrough', 'subscribe']:
+        cloned_obj.pop(key, None)
+    return pickle.dumps(cloned_obj)
+
+
+def run(make_key, request, store):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        assert make_key(request) in store
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+def measure(request):
+    pickle_store = {pickle_key(request): True}
+    canonical_store = {request_key(request): True}
+    pickled = canonical = float('inf')
+    for _ in range(REPEATS):
+        pickled = min(pickled, run(pickle_key, request, pickle_store))
+        canonical = min(canonical, run(request_key, request, canonical_store))
+    return pickled, canonical
+
+
+def main():
+    failed = False
+    for name, request in REQUESTS.items():
+        pickled, canonical = measure(request)
+        ratio = canonical / pickled
+        print(f'{name:<10}pickle {pickled:6.2f} us/key   canonical {canonical:6.2f} us/key   x{ratio:.2f}')
+        flat = all(type(value) not in (dict, list) for value in request.values())
+        if flat and canonical >= pickled:
+            print(f'{name}: the canonical key is not cheaper than the pickled key')
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Import time of the package and of the generated API methods module, measured with `python -X importtime`.
+# Every import runs in a fresh interpreter and the best of the runs is reported. The bytecode is cached in a temporary
+# directory by a first run, as it is for an installed package. Exits with an error when the generated module takes
+# longer than its budget: the whole table of the API methods is loaded, the methods are only built when used.
+# run it like PYTHONPATH=. python3 benchmarks/bench_import.py
+import os
+import subprocess
+import sys
+import tempfile
+
+RUNS = 10
+
+MODULES = ['deriv_api', 'deriv_api.deriv_api_calls']
+# the budget of the self time of the generated module in ms, it took about 4 ms when every method was defined in it
+BUDGET = {'deriv_api.deriv_api_calls': 2.5}
+
+
+def import_times(env):
+    # the lines look like `import time:  self [us] | cumulative | imported package`
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import deriv_api'], capture_output=True,
+                            text=True, check=True, env=env).stderr
+    times = {}
+    for line in stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() in MODULES:
+            times[fields[2].strip()] = (int(fields[0].split(':')[1]), int(fields[1]))
+    return times
+
+
+def main():
+    with tempfile.TemporaryDirectory() as pycache:
+        env = {**os.environ, 'PYTHONPYCACHEPREFIX': pycache}
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        import_times(env)
+        runs = [import_times(env) for _ in range(RUNS)]
+    failed = False
+    for module in MODULES:
+        self_time = min(run[module][0] for run in runs) / 1e3
+        cumulative = min(run[module][1] for run in runs) / 1e3
+        print(f'import {module:<32}self {self_time:8.2f} ms    cumulative {cumulative:8.2f} ms')
+        if module in BUDGET and self_time > BUDGET[module]:
+            print(f'{module}: the import takes more than {BUDGET[module]} ms')
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# Per-call overhead of one-shot requests: the reactivex pipeline against the Future fast path.
+# run it like PYTHONPATH=. python3 benchmarks/bench_send.py
+import asyncio
+import json
+import time
+
+from reactivex import operators as op
+
+from deriv_api import DerivAPI
+
+CALLS = 20000
+
+
+class EchoConnection:
+    """A connection that answers every request immediately"""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+
+    async def send(self, data):
+        request = json.loads(data)
+        self.queue.put_nowait(json.dumps({'echo_req': request, 'msg_type': 'ping', 'ping': 'pong',
+                                          'req_id': request['req_id']}))
+
+    async def recv(self):
+        return await self.queue.get()
+
+    async def close(self):
+        pass
+
+
+async def rx_pipeline(api: DerivAPI):
+    # the path send used before: a Subject per request piped to a future
+    return await api.send_and_get_source({'ping': 1}).pipe(op.first(), op.to_future())
+
+
+async def future_path(api: DerivAPI):
+    return await api.send_and_get_future({'ping': 1})
+
+
+async def measure(name, call, api):
+    for _ in range(100):
+        await call(api)
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        await call(api)
+    elapsed = time.perf_counter() - start
+    print(f'{name:<24}{elapsed / CALLS * 1e6:8.2f} us/call')
+
+
+def measure_setup():
+    # cost of building the response plumbing only, without any I/O
+    from reactivex.subject import Subject
+    loop = asyncio.new_event_loop()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        Subject().pipe(op.first(), op.to_future())
+    rx_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        loop.create_future()
+    future_elapsed = time.perf_counter() - start
+    loop.close()
+    print(f'{"setup: reactivex":<24}{rx_elapsed / CALLS * 1e6:8.2f} us/call')
+    print(f'{"setup: future":<24}{future_elapsed / CALLS * 1e6:8.2f} us/call')
+
+
+async def main():
+    api = DerivAPI(connection=EchoConnection(), codec=json)
+    await measure('round trip: reactivex', rx_pipeline, api)
+    await measure('round trip: future', future_path, api)
+    await api.clear()
+
+
+if __name__ == '__main__':
+    measure_setup()
+    asyncio.run(main())
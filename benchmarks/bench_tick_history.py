@@ -0,0 +1,53 @@
+# Memory and cost of keeping the last ticks of a symbol and reading the last ones on every tick: a TickHistory against
+# a bounded deque of the tick dicts.
+# run it like PYTHONPATH=. python3 benchmarks/bench_tick_history.py
+import json
+import time
+import tracemalloc
+from collections import deque
+
+from deriv_api.tick_history import TickHistory
+
+SIZE = 10000
+TICKS = 50000
+WINDOW = 20
+
+
+def frames():
+    # decoded frames, as the subscription delivers them
+    return [json.loads(json.dumps({'msg_type': 'tick', 'tick': {
+        'ask': 1000 + i / 100 + 0.1, 'bid': 1000 + i / 100 - 0.1, 'epoch': 1700000000 + i, 'id': f'id-{i}',
+        'pip_size': 2, 'quote': 1000 + i / 100, 'symbol': 'R_100'}})) for i in range(TICKS)]
+
+
+def measure(label, make, append, window):
+    responses = frames()
+    kept = make()
+    start = time.perf_counter()
+    for response in responses:
+        append(kept, response['tick'])
+        window(kept)
+    elapsed = time.perf_counter() - start
+
+    # the memory is traced in a second run, tracing slows the first one down
+    del responses, kept
+    tracemalloc.start()
+    responses = frames()
+    kept = make()
+    for response in responses:
+        append(kept, response['tick'])
+    del responses
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f'{label:<12}{elapsed / TICKS * 1e6:8.2f} us/tick  {memory / 1e6:8.2f} MB kept for {SIZE} ticks')
+
+
+def main():
+    measure('deque', lambda: deque(maxlen=SIZE), deque.append,
+            lambda kept: [kept[i]['quote'] for i in range(-min(WINDOW, len(kept)), 0)])
+    measure('TickHistory', lambda: TickHistory(SIZE), TickHistory.append,
+            lambda kept: kept.last(WINDOW)['quote'])
+
+
+if __name__ == '__main__':
+    main()
@@ -10,5 +10,7 @@ __pdoc__ = {
 }
 
 from .deriv_api import DerivAPI
-from .errors import AddedTaskError, APIError, ConstructionError, ResponseError
+from .connection_pool import ConnectionPool
+from .sync_deriv_api import SyncDerivAPI
+from .errors import AddedTaskError, APIError, ConstructionError, RequestTimeoutError, ResponseError
 
@@ -0,0 +1,185 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from reactivex import Observable
+from reactivex import operators as op
+
+from deriv_api.backpressure import BufferedSource
+from deriv_api.deriv_api_calls import DerivAPICalls, takes_loginid
+from deriv_api.errors import APIError
+
+if TYPE_CHECKING:
+    from deriv_api import DerivAPI
+
+__pdoc__ = {
+    'deriv_api.accounts.Account.send': False,
+}
+
+
+class Accounts:
+    """
+        Accounts - several accounts authorized on one connection
+
+        `authorize` sends the extra tokens in the `tokens` field of the authorize call, so all the accounts share the
+        connection of the API. The account calls of an account, like `buy` or `statement`, are sent with its `loginid`.
+        The other calls, like `ticks` or `time`, are sent as they are.
+
+        The balance of all the accounts is one `balance` stream with `account: 'all'`, every account receives its own
+        updates from it. The `transaction` and `proposal_open_contract` streams are subscribed per account.
+
+        Example
+        -------
+        >>> await api.accounts.authorize(token, *client_tokens)
+        >>> account = api.accounts.account('CR90000001')
+        >>> await account.buy({'buy': 1, 'price': 10, 'parameters': {...}})
+        >>> balance = await account.subscribe({'balance': 1})
+
+        Parameters
+        ----------
+            api : deriv_api.DerivAPI
+
+        Properties
+        ----------
+        loginids : List[str]
+            The authorized accounts, the first one is the account of the main token
+        """
+
+    def __init__(self, api: DerivAPI) -> None:
+        self.api = api
+        self.loginids: List[str] = []
+        self.accounts: Dict[str, Account] = {}
+
+    async def authorize(self, token: str, *tokens: str) -> dict:
+        """
+        Authorize the main token and the additional ones on the connection
+
+        Parameters
+        ----------
+        token : str
+            The main token, the calls that do not have a loginid act on its account
+        *tokens : str
+            The tokens of the additional accounts
+
+        Returns
+        -------
+            The authorize response
+        """
+        request = {'authorize': token}
+        if tokens:
+            request['tokens'] = list(tokens)
+        # The generated authorize method does not know the tokens field yet, so the request is sent as it is
+        response = await self.api.send(request)
+        authorize = response['authorize']
+        loginids = [authorize['loginid']]
+        for account in authorize.get('account_list', []):
+            if account['loginid'] not in loginids:
+                loginids.append(account['loginid'])
+        self.loginids = loginids
+        self.accounts = {loginid: account for loginid, account in self.accounts.items() if loginid in loginids}
+        return response
+
+    def account(self, loginid: str) -> Account:
+        """
+        Get the API of an authorized account
+
+        Parameters
+        ----------
+        loginid : str
+            The account loginid
+
+        Returns
+        -------
+            Account
+        """
+        if loginid not in self.loginids:
+            raise APIError(f'Account {loginid} is not authorized')
+        if loginid not in self.accounts:
+            self.accounts[loginid] = Account(self, loginid)
+        return self.accounts[loginid]
+
+    async def balances(self, replay: int = 0) -> Observable:
+        """
+        The balance stream of all the accounts
+
+        Parameters
+        ----------
+        replay : int
+            The number of the last messages delivered to every new observer, see DerivAPI.subscribe
+
+        Returns
+        -------
+            Observable of the balance responses, `response['balance']['loginid']` is the account of an update
+        """
+        # the subscription manager shares one stream between the callers and subscribes again once it is forgotten
+        return await self.api.subscribe({'balance': 1, 'account': 'all'}, replay=replay)
+
+
+class Account(DerivAPICalls):
+    """
+        Account - the API calls of one account of Accounts
+
+        All the API methods are available. The methods that act on an account are sent with the loginid of the account.
+
+        Parameters
+        ----------
+            accounts : Accounts
+            loginid : str
+
+        Properties
+        ----------
+        loginid : str
+            The account loginid
+        """
+
+    def __init__(self, accounts: Accounts, loginid: str) -> None:
+        self.accounts = accounts
+        self.loginid = loginid
+
+    async def send(self, request: dict) -> dict:
+        """
+        Send the API call, with the loginid of the account if the call acts on an account
+
+        Parameters
+        ----------
+        request : dict
+            API request
+
+        Returns
+        -------
+            API response
+        """
+        return await self.accounts.api.send(self.__with_loginid(request))
+
+    async def subscribe(self, request: dict, policy: Optional[str] = None, buffer_size: int = 100,
+                        replay: int = 0) -> Observable:
+        """
+        Subscribe to a given request of the account
+
+        Parameters
+        ----------
+            request : dict
+                Subscribe request
+            policy : str
+                Buffer policy for slow consumers, see DerivAPI.subscribe
+            buffer_size : int
+                The buffer bound of the 'drop-oldest' and 'block' policies
+            replay : int
+                The number of the last messages delivered to every new observer, see DerivAPI.subscribe. The balance
+                updates are replayed from the stream of all the accounts, so fewer may be delivered
+
+        Returns
+        -------
+            Observable
+        """
+        if 'balance' in request and 'account' not in request:
+            balances = await self.accounts.balances(replay)
+            source = balances.pipe(op.filter(lambda response: response['balance'].get('loginid') == self.loginid))
+            if policy:
+                return BufferedSource(self.accounts.api, source, policy, buffer_size)
+            return source
+        return await self.accounts.api.subscribe(self.__with_loginid(request), policy, buffer_size, replay)
+
+    def __with_loginid(self, request: dict) -> dict:
+        if takes_loginid(request):
+            return {**request, 'loginid': self.loginid}
+        return request
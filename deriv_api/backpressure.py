@@ -0,0 +1,147 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any, Optional
+
+import reactivex
+from reactivex import Observable, abc
+from reactivex import operators as op
+from reactivex.disposable import Disposable
+
+if TYPE_CHECKING:
+    from deriv_api import DerivAPI
+
+__pdoc__ = {
+    'deriv_api.backpressure.policies': False,
+}
+
+policies = ['latest-only', 'drop-oldest', 'block']
+
+
+class BufferedSource(Observable):
+    """
+        BufferedSource - a subscription stream with a buffer between the connection and the consumers
+
+        The receive loop only appends the messages to the buffer, a separate task delivers them to the consumers.
+        When the consumers are slower than the stream the buffer policy decides what happens:
+
+        - `latest-only`: only the newest message is kept, older ones that were not delivered yet are conflated
+        - `drop-oldest`: at most `buffer_size` messages are kept, the oldest ones are dropped
+        - `block`: the receive loop stops reading the connection while `buffer_size` messages are waiting
+
+        Example
+        -------
+        >>> proposals = await api.subscribe(request, policy='latest-only')
+        >>> proposals.subscribe(price)
+        >>> print(proposals.conflated)
+
+        Parameters
+        ----------
+            api : deriv_api.DerivAPI
+            source : Observable
+                The subscription stream
+            policy : str
+                One of 'latest-only', 'drop-oldest' and 'block'
+            buffer_size : int
+                The buffer bound of the 'drop-oldest' and 'block' policies
+
+        Properties
+        ----------
+        conflated : int
+            Number of messages replaced by a newer one with the 'latest-only' policy
+        dropped : int
+            Number of messages dropped with the 'drop-oldest' policy
+        blocked : int
+            Number of times the receive loop was paused with the 'block' policy
+        """
+
+    def __init__(self, api: DerivAPI, source: Observable, policy: str, buffer_size: int = 100) -> None:
+        if policy not in policies:
+            raise ValueError(f'Unknown buffer policy {policy}, expected one of: {", ".join(policies)}')
+        if buffer_size < 1:
+            raise ValueError(f'buffer_size must be a positive number, passed: {buffer_size}')
+        super().__init__()
+        self.api = api
+        self.source = source
+        self.policy = policy
+        self.buffer_size = buffer_size if policy != 'latest-only' else 1
+        self.conflated = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.shared: Observable = reactivex.create(self.__connect).pipe(op.share())
+
+    def _subscribe_core(self, observer: abc.ObserverBase, scheduler: Optional[abc.SchedulerBase] = None
+                        ) -> abc.DisposableBase:
+        return self.shared.subscribe(observer, scheduler=scheduler)
+
+    def __connect(self, observer: abc.ObserverBase, _scheduler: Optional[abc.SchedulerBase] = None) -> Disposable:
+        loop = asyncio.get_event_loop()
+        buffer: deque = deque()
+        state: dict = {'ready': None, 'space': None, 'end': None}
+
+        def wake() -> None:
+            ready = state['ready']
+            if ready and not ready.done():
+                ready.set_result(None)
+
+        def release() -> None:
+            space = state['space']
+            if space:
+                state['space'] = None
+                self.api.blocked_streams.discard(space)
+                if not space.done():
+                    space.set_result(None)
+
+        def on_next(value: Any) -> None:
+            if len(buffer) >= self.buffer_size:
+                if self.policy == 'latest-only':
+                    buffer.popleft()
+                    self.conflated += 1
+                elif self.policy == 'drop-oldest':
+                    buffer.popleft()
+                    self.dropped += 1
+            buffer.append(value)
+            if self.policy == 'block' and len(buffer) >= self.buffer_size and not state['space']:
+                self.blocked += 1
+                state['space'] = loop.create_future()
+                self.api.blocked_streams.add(state['space'])
+            wake()
+
+        def on_error(err: Exception) -> None:
+            state['end'] = lambda: observer.on_error(err)
+            wake()
+
+        def on_completed() -> None:
+            state['end'] = observer.on_completed
+            wake()
+
+        async def drain() -> None:
+            while True:
+                if not buffer:
+                    release()
+                    if state['end']:
+                        state['end']()
+                        return
+                    state['ready'] = loop.create_future()
+                    await state['ready']
+                    continue
+                value = buffer.popleft()
+                if len(buffer) < self.buffer_size:
+                    release()
+                # noinspection PyBroadException
+                try:
+                    observer.on_next(value)
+                except Exception as err:
+                    self.api.sanity_errors.on_next(err)
+                # let the receive loop run, newer messages may conflate the buffered ones
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(drain(), name='deriv_api:buffered source drain')
+        subscription = self.source.subscribe(on_next, on_error, on_completed)
+
+        def dispose() -> None:
+            subscription.dispose()
+            task.cancel()
+            release()
+
+        return Disposable(dispose)
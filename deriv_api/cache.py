@@ -5,7 +5,7 @@ if TYPE_CHECKING:
     from deriv_api import DerivAPI
 from deriv_api.deriv_api_calls import DerivAPICalls
 from deriv_api.errors import ConstructionError
-from deriv_api.utils import dict_to_cache_key
+from deriv_api.utils import dict_to_cache_key, request_key
 from deriv_api.in_memory import InMemory
 
 __pdoc__ = {
@@ -49,6 +49,8 @@ class Cache(DerivAPICalls):
         super().__init__()
         self.api = api
         self.storage = storage
+        # the in memory storage keeps the hashable key as it is, any other storage may persist it so it gets bytes
+        self.key = request_key if isinstance(storage, InMemory) else dict_to_cache_key
 
     async def send(self, request: dict) -> dict:
         """Check if there is a cache for the request. If so then return that value.
@@ -82,7 +84,7 @@ class Cache(DerivAPICalls):
         -------
             Returns true if the request exists
         """
-        return self.storage.has(dict_to_cache_key(request))
+        return self.storage.has(self.key(request))
 
     async def get(self, request: dict) -> dict:
         """Redirected to the method defined by the storage
@@ -96,7 +98,7 @@ class Cache(DerivAPICalls):
         -------
             API response stored in
         """
-        return self.storage.get(dict_to_cache_key(request))
+        return self.storage.get(self.key(request))
 
     async def get_by_msg_type(self, msg_type: str) -> dict:
         """Redirected to the method defined by the storage
@@ -122,4 +124,4 @@ class Cache(DerivAPICalls):
         response : dict
             API response
         """
-        return self.storage.set(dict_to_cache_key(request), response)
+        return self.storage.set(self.key(request), response)
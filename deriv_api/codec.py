@@ -0,0 +1,42 @@
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__pdoc__ = {
+    'deriv_api.codec.OrjsonCodec.dumps': False,
+    'deriv_api.codec.OrjsonCodec.loads': False,
+}
+
+
+class OrjsonCodec:
+    """
+    JSON codec backed by orjson. Requests that orjson can not encode (e.g. non-string keys in passthrough) fall back to
+    the standard json module.
+    """
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(obj: Any) -> str:
+        try:
+            # the API expects text frames
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            return json.dumps(obj)
+
+
+def default_codec():
+    """
+    Returns the fastest available codec, orjson if it is installed otherwise the standard json module
+
+    Returns
+    -------
+        An object with `loads` and `dumps` callables
+    """
+    return OrjsonCodec() if orjson else json
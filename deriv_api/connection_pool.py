@@ -0,0 +1,198 @@
+import asyncio
+from bisect import bisect
+from typing import List, Optional
+
+import reactivex
+from reactivex import Observable
+
+from deriv_api.cache import Cache
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.deriv_api_calls import DerivAPICalls
+from deriv_api.errors import ConstructionError
+from deriv_api.in_memory import InMemory
+from deriv_api.utils import request_key
+
+__pdoc__ = {
+    'deriv_api.connection_pool.ConnectionPool.api_for_key': False,
+    'deriv_api.connection_pool.ConnectionPool.least_loaded': False,
+    'deriv_api.connection_pool.ConnectionPool.send': False,
+}
+
+# points of every connection on the hash ring, more points spread the subscriptions more evenly
+_ring_replicas = 64
+# these requests change the state of the connection, so they are sent on all the connections
+_broadcast_calls = ['authorize', 'logout']
+
+
+class ConnectionPool(DerivAPICalls):
+    """
+        ConnectionPool - spreads the requests of one application over several connections
+
+        Subscriptions are assigned to the connections by consistent hashing of their request, so the same
+        subscription always lands on the same connection. One-shot calls go to the connection with the fewest
+        requests in flight. `authorize` and `logout` are sent on all the connections.
+
+        Examples
+        --------
+        >>> pool = ConnectionPool(pool_size=4, app_id=1234)
+        >>> await pool.authorize(token)
+        >>> ticks = await pool.subscribe({'ticks': 'R_100'})
+
+        Parameters
+        ----------
+            pool_size : int
+                Number of connections. Default is 2
+            options : dict
+                The options of DerivAPI. Pass `connections` with a list of ready connections instead of `connection`
+
+        Properties
+        ----------
+        apis : List[DerivAPI]
+            The API object of every connection
+        cache : Cache
+            Temporary cache default to InMemory
+        events : Observable
+            The events of all the connections
+        sanity_errors : Observable
+            The sanity errors of all the connections
+        """
+
+    def __init__(self, pool_size: int = 2, **options) -> None:
+        if options.get('connection'):
+            raise ConstructionError('A connection can not be shared by a pool, pass connections instead')
+        connections = options.pop('connections', None)
+        if connections:
+            self.apis: List[DerivAPI] = [DerivAPI(connection=connection, **options) for connection in connections]
+        else:
+            if pool_size < 1:
+                raise ConstructionError(f'pool_size must be a positive number, passed: {pool_size}')
+            self.apis: List[DerivAPI] = [DerivAPI(**options) for _ in range(pool_size)]
+
+        ring = sorted((hash(f'{index}:{replica}'), index)
+                      for index in range(len(self.apis)) for replica in range(_ring_replicas))
+        self.ring_hashes = [point for point, _ in ring]
+        self.ring_apis = [self.apis[index] for _, index in ring]
+        self.cache = Cache(self, options.get('cache', InMemory()))
+        self.events: Observable = reactivex.merge(*[api.events for api in self.apis])
+        self.sanity_errors: Observable = reactivex.merge(*[api.sanity_errors for api in self.apis])
+
+    def api_for_key(self, key: tuple) -> DerivAPI:
+        """
+        Find the connection of a request key on the hash ring
+
+        Parameters
+        ----------
+        key : tuple
+            Request key made by request_key
+
+        Returns
+        -------
+            DerivAPI
+        """
+        position = bisect(self.ring_hashes, hash(key)) % len(self.ring_hashes)
+        return self.ring_apis[position]
+
+    def least_loaded(self) -> DerivAPI:
+        """
+        Find the connection with the fewest requests in flight
+
+        Returns
+        -------
+            DerivAPI
+        """
+        return min(self.apis, key=lambda api: len(api.pending_requests) + len(api.send_queue))
+
+    async def send(self, request: dict) -> dict:
+        """
+        Send the API call on the least loaded connection and returns response
+
+        Parameters
+        ----------
+        request : dict
+            API request
+
+        Returns
+        -------
+            API response
+        """
+        if any(call in request for call in _broadcast_calls):
+            responses = await asyncio.gather(*[api.send(request.copy()) for api in self.apis])
+            return responses[0]
+        return await self.least_loaded().send(request)
+
+    async def subscribe(self, request: dict, policy: Optional[str] = None, buffer_size: int = 100,
+                        replay: int = 0) -> Observable:
+        """
+        Subscribe to a given request on the connection that owns it
+
+        Parameters
+        ----------
+            request : dict
+                Subscribe request
+            policy : str
+                Buffer policy for slow consumers, see DerivAPI.subscribe
+            buffer_size : int
+                The buffer bound of the 'drop-oldest' and 'block' policies
+            replay : int
+                The number of the last messages delivered to every new observer, see DerivAPI.subscribe
+
+        Returns
+        -------
+            Observable
+        """
+        return await self.api_for_key(request_key(request)).subscribe(request, policy, buffer_size, replay)
+
+    async def forget(self, subs_id: str) -> dict:
+        """
+        Forget / unsubscribe the specific subscription.
+
+        Parameters
+        ----------
+            subs_id : str
+                subscription id
+
+        Returns
+        -------
+            Returns dict
+        """
+        for api in self.apis:
+            if subs_id in api.subscription_manager.subs_id_to_key:
+                return await api.forget(subs_id)
+        # not known, it may be a subscription that was not made by subscribe
+        responses = await asyncio.gather(*[api.forget(subs_id) for api in self.apis], return_exceptions=True)
+        for response in responses:
+            if isinstance(response, dict) and response.get('forget'):
+                return response
+        if isinstance(responses[0], Exception):
+            raise responses[0]
+        return responses[0]
+
+    async def forget_all(self, *types) -> dict:
+        """
+        Forget / unsubscribe the subscriptions of given types on all the connections.
+
+        Parameter
+        ---------
+            *types : Any number of non-keyword arguments
+
+        Returns
+        -------
+            Returns the dict, `forget_all` lists the forgotten subscription ids of all the connections
+        """
+        responses = await asyncio.gather(*[api.forget_all(*types) for api in self.apis])
+        response = dict(responses[0])
+        response['forget_all'] = [subs_id for r in responses for subs_id in r['forget_all']]
+        return response
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect all the connections
+        """
+        await asyncio.gather(*[api.disconnect() for api in self.apis])
+
+    async def clear(self) -> None:
+        """
+        Disconnect and cancel all the tasks
+        """
+        for api in self.apis:
+            await api.clear()
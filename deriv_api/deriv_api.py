@@ -1,25 +1,36 @@
 import asyncio
-import json
+import concurrent.futures
+import itertools
 import logging
+import random
 import re
 from asyncio import Future
-from typing import Dict, Optional, Union, Coroutine
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Tuple, Union, Coroutine
 
 import websockets
 from reactivex import operators as op
 from reactivex.subject import Subject
-from reactivex import Observable
+from reactivex import Observable, abc
+from reactivex.disposable import Disposable
 from websockets.legacy.client import WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosedOK, ConnectionClosed
 from websockets.frames import Close
 
+from deriv_api.accounts import Accounts
 from deriv_api.cache import Cache
+from deriv_api.codec import default_codec
 from deriv_api.easy_future import EasyFuture
-from deriv_api.deriv_api_calls import DerivAPICalls
+from deriv_api.deriv_api_calls import DerivAPICalls, api_method_of
 from deriv_api.errors import APIError, ConstructionError, ResponseError, AddedTaskError
+from deriv_api.events import Events
 from deriv_api.in_memory import InMemory
+from deriv_api.lazy_response import LazyResponse, peek_msg_type, peek_req_id
+from deriv_api.pending_requests import PendingRequests, Source, reject_source
+from deriv_api.rate_limiter import RateLimiter
+from deriv_api.send_queue import SendQueue, priorities
 from deriv_api.subscription_manager import SubscriptionManager
-from deriv_api.utils import is_valid_url
+from deriv_api.tick_history import TickHistory
+from deriv_api.utils import is_valid_url, request_key
 from deriv_api.middlewares import MiddleWares
 
 # TODO NEXT subscribe is not calling deriv_api_calls. that's , args not verified. can we improve it ?
@@ -31,6 +42,9 @@ logging.basicConfig(
 
 __pdoc__ = {
     'deriv_api.deriv_api.DerivAPI.send_and_get_source': False,
+    'deriv_api.deriv_api.DerivAPI.send_and_get_future': False,
+    'deriv_api.deriv_api.DerivAPI.write_request': False,
+    'deriv_api.deriv_api.DerivAPI.process_request': False,
     'deriv_api.deriv_api.DerivAPI.api_connect': False,
     'deriv_api.deriv_api.DerivAPI.get_url': False,
     'deriv_api.deriv_api.DerivAPI.add_task': False,
@@ -41,6 +55,10 @@ __pdoc__ = {
     'deriv_api.deriv_api.DerivAPI.storage': False,
 }
 
+_validate_modes = ['full', 'sampled', 'off']
+# read-only calls that are coalesced by default
+_coalesce_calls = ['active_symbols', 'contracts_for', 'trading_times', 'ticks_history', 'landing_company']
+
 
 class DerivAPI(DerivAPICalls):
     """
@@ -72,14 +90,65 @@ class DerivAPI(DerivAPICalls):
             middleware : MiddleWares
                 middlewares to call on certain API actions. Now two middlewares are supported: sendWillBeCalled and
                 sendIsCalled
+            request_timeout : float
+                Seconds to wait for the response of a request before failing it with RequestTimeoutError.
+                Default is None, wait forever
+            auto_reconnect : bool
+                Reconnect when the connection created by the API drops, authorize again and revive the subscriptions.
+                Default is True
+            reconnect_delay : float
+                Seconds to wait before the first reconnection attempt, it is doubled after every failed attempt.
+                A random jitter is applied to every wait. Default is 1
+            reconnect_max_delay : float
+                The upper bound of the wait between the reconnection attempts. Default is 30
+            max_reconnect_attempts : int
+                Give up after this number of failed attempts. Default is None, never give up
+            codec : Object
+                JSON codec with `loads` and `dumps` callables, like the json module. `dumps` should return a str.
+                Default is orjson if it is installed, otherwise json
+            coalesce : List[str]
+                Calls that share one response when identical requests are sent while the first one is waiting.
+                Default is active_symbols, contracts_for, trading_times, ticks_history and landing_company.
+                Pass an empty list to turn it off
+            lazy_decode : bool
+                Route the frames of subscription streams by peeking their req_id and push them as LazyResponse objects
+                which are decoded on first read. The raw frame is available as `response.raw`. Default is False
+            validate : str
+                Client side validation of the arguments of the API methods. 'full' validates every call, 'sampled'
+                validates one call in `validate_sample` of every method and reports the failures to `sanity_errors`
+                instead of raising them, 'off' sends the arguments as they are. Default is 'full'
+            validate_sample : int
+                One call in this number is validated in the 'sampled' mode. Default is 100
+            priorities : dict
+                Priority classes of the calls by call name. The requests of a class are sent before the ones of the
+                classes after it: 'trade' (buy, sell, cancel, contract_update), 'pricing' (proposal,
+                proposal_open_contract), 'normal' and 'bulk' (ticks_history, contracts_for, statement and the other
+                bulk data calls). `send` can also be called with a priority
+            rate_limit : Union[bool, dict]
+                Queue the requests that would exceed the call limits of the server instead of sending them. True reads
+                the limits from `website_status` after connecting, a dict is used as `api_call_limits`.
+                Default is False
+            subscription_linger : float
+                Seconds to keep a subscription after its last observer is disposed before forgetting it. Subscribing
+                to the same request in that time reuses the live subscription. Default is 0, forget at once
+            tick_history : int
+                Keep the last ticks of every symbol of the `ticks` subscriptions in a TickHistory of this size, read
+                it with `api.tick_history(symbol)`. Default is 0, no ticks are kept
     Properties
     ----------
     cache: Cache
         Temporary cache default to InMemory
     storage : Cache
         If specified, uses a more persistent cache (local storage, etc.)
-    events: Observable
-        An Observable object that will send data when events like 'connect', 'send', 'message' happen
+    events: Events
+        An Observable object that will send data when events like 'connect', 'send', 'message' happen.
+        `api.events.on('message')` observes one event only
+    pending_requests: PendingRequests
+        The requests waiting for a response, `len(api.pending_requests)` is the number of them
+    accounts: Accounts
+        Several accounts authorized on the connection with `api.accounts.authorize(token, *tokens)`
+    rate_limiter: RateLimiter
+        The call limits, `api.rate_limiter.levels()` returns the number of calls that can be made now
     """
 
     storage: None
@@ -91,10 +160,28 @@ class DerivAPI(DerivAPICalls):
         cache = options.get('cache', InMemory())
         storage: any = options.get('storage')
         self.middlewares: MiddleWares = options.get('middlewares', MiddleWares())
+        self.codec = options.get('codec') or default_codec()
+        self.lazy_decode = options.get('lazy_decode', False)
+        self.validate: str = options.get('validate', 'full')
+        if self.validate not in _validate_modes:
+            raise ConstructionError(f'validate must be one of: {", ".join(_validate_modes)}, passed: {self.validate}')
+        self.validate_sample: int = options.get('validate_sample', 100)
+        # calls of every method since its last validated call in the 'sampled' mode
+        self.validate_counts: dict = {}
+        self.coalesce_calls: set = set(options.get('coalesce', _coalesce_calls))
+        self.in_flight: dict = {}
+        self.rate_limit: Union[bool, dict] = options.get('rate_limit', False)
+        self.rate_limiter: RateLimiter = RateLimiter(self.rate_limit if isinstance(self.rate_limit, dict) else None)
         self.wsconnection: Optional[WebSocketClientProtocol] = None
         self.wsconnection_from_inside = True
         self.shouldReconnect = False
-        self.events: Subject = Subject()
+        self.auto_reconnect = options.get('auto_reconnect', True)
+        self.reconnect_delay: float = options.get('reconnect_delay', 1)
+        self.reconnect_max_delay: float = options.get('reconnect_max_delay', 30)
+        self.max_reconnect_attempts: Optional[int] = options.get('max_reconnect_attempts')
+        self.reconnecting = False
+        self.authorize_request: Optional[dict] = None
+        self.events: Events = Events()
         if options.get('connection'):
             self.wsconnection: Optional[WebSocketClientProtocol] = options.get('connection')
             self.wsconnection_from_inside = False
@@ -117,37 +204,75 @@ class DerivAPI(DerivAPICalls):
         # If we have the storage look that one up
         self.cache = Cache(self.storage if self.storage else self, cache)
 
-        self.req_id = 0
-        self.pending_requests: Dict[str, Subject] = {}
+        self.loop = asyncio.get_event_loop()
+        # next() of a count is atomic, req_ids can be taken in any thread
+        self.req_ids = itertools.count(1)
+        self.pending_requests: PendingRequests = PendingRequests(self, options.get('request_timeout'))
+        self.send_queue: SendQueue = SendQueue(self, options.get('priorities'))
+        # buffered sources with the 'block' policy that are full, the receive loop waits for them
+        self.blocked_streams: set = set()
         # resolved: connected  rejected: disconnected  pending: not connected yet
         self.connected = EasyFuture()
-        self.subscription_manager: SubscriptionManager = SubscriptionManager(self)
+        self.subscription_manager: SubscriptionManager = SubscriptionManager(self,
+                                                                             options.get('subscription_linger', 0),
+                                                                             options.get('tick_history', 0))
+        self.accounts: Accounts = Accounts(self)
         self.sanity_errors: Subject = Subject()
         self.expect_response_types = {}
         self.wait_data_task = EasyFuture().set_result(1)
         self.add_task(self.api_connect(), 'api_connect')
         self.add_task(self.__wait_data(), 'wait_data')
+        self.add_task(self.send_queue.run(), 'writer')
+        if self.rate_limit is True:
+            self.add_task(self.website_status({'website_status': 1}), 'rate_limit')
 
     async def __wait_data(self):
         await self.connected
-        while self.connected.is_resolved():
+        loads = self.codec.loads
+        while self.connected.is_resolved() or self.reconnecting:
+            while self.blocked_streams:
+                await next(iter(self.blocked_streams))
             try:
                 data = await self.wsconnection.recv()
             except ConnectionClosed as err:
-                if self.connected.is_resolved():
+                if (self.connected.is_resolved() or self.reconnecting) and self.auto_reconnect and self.shouldReconnect:
+                    self.sanity_errors.on_next(err)
+                    if await self.__reconnect(err):
+                        continue
+                if self.connected.is_pending():
+                    self.connected.reject(err)
+                    self.connected.exception()
+                elif self.connected.is_resolved():
                     self.connected = EasyFuture().reject(err)
                     self.connected.exception()  # call it to hide the warning of 'exception never retrieved'
                 self.sanity_errors.on_next(err)
+                self.pending_requests.reject_all(err)
                 break
             except Exception as err:
                 self.sanity_errors.on_next(err)
                 continue
-            response = json.loads(data)
 
-            self.events.on_next({'name': 'message', 'data': response})
+            if self.lazy_decode and isinstance(data, str):
+                req_id = peek_req_id(data)
+                pending = self.pending_requests.get(req_id) if req_id else None
+                if isinstance(pending, Subject) and not pending.is_stopped and not self.__is_expected(data):
+                    self.pending_requests.response_received(req_id)
+                    response = LazyResponse(data, loads, req_id)
+                    self.events.emit('message', response)
+                    pending.on_next(response)
+                    continue
+
+            response = loads(data)
+
+            self.events.emit('message', response)
             # TODO NEXT onopen onclose, can be set by await connection
             req_id = response.get('req_id', None)
-            if not req_id or req_id not in self.pending_requests:
+            pending: Optional[Source] = self.pending_requests.response_received(req_id) if req_id else None
+            if pending is None:
+                if response.get('subscription'):
+                    # The source was already completed and removed. Forget the stream that nobody listens to.
+                    self.add_task(self.forget(response['subscription']['id']), 'forget subscription')
+                    continue
                 self.sanity_errors.on_next(APIError("Extra response"))
                 continue
             expect_response: Future = self.expect_response_types.get(response['msg_type'])
@@ -162,18 +287,112 @@ class DerivAPI(DerivAPICalls):
             is_parent_subscription = request and request.get('proposal_open_contract') and not request.get(
                 'contract_id')
             if response.get('error') and not is_parent_subscription:
-                self.pending_requests[req_id].on_error(ResponseError(response))
+                self.pending_requests.remove(req_id)
+                reject_source(pending, ResponseError(response))
+                continue
+
+            if isinstance(pending, Future):
+                if not pending.done():
+                    pending.set_result(response)
                 continue
 
             # on_error will stop a subject object
-            if self.pending_requests[req_id].is_stopped and response.get('subscription'):
+            if pending.is_stopped and response.get('subscription'):
                 # Source is already marked as completed. In this case we should
                 # send a forget request with the subscription id and ignore the response received.
                 subs_id = response['subscription']['id']
                 self.add_task(self.forget(subs_id), 'forget subscription')
                 continue
 
-            self.pending_requests[req_id].on_next(response)
+            pending.on_next(response)
+
+    def __is_expected(self, data: str) -> bool:
+        """
+        Check if a response frame may resolve a Future of expect_response, it has to be fully decoded then
+
+        Parameters
+        ----------
+        data : str
+            Raw response frame
+
+        Returns
+        -------
+            True if a Future of expect_response is waiting for the msg_type of the frame
+        """
+        if not self.expect_response_types:
+            return False
+        msg_type = peek_msg_type(data)
+        if msg_type is None:
+            return any(not future.done() for future in self.expect_response_types.values())
+        future = self.expect_response_types.get(msg_type)
+        return future is not None and not future.done()
+
+    async def __reconnect(self, err: ConnectionClosed) -> bool:
+        """
+        Open a new connection with exponential backoff and jitter. Requests that were waiting for a response are failed,
+        the subscriptions are kept to be revived on the new connection.
+
+        Parameters
+        ----------
+        err : ConnectionClosed
+            The error that closed the connection
+
+        Returns
+        -------
+            True if a new connection is opened
+        """
+        self.reconnecting = True
+        if not self.connected.is_pending():
+            self.connected = EasyFuture()
+        # the queued requests are not written to the new connection: the failed ones are retried by their callers and
+        # the kept subscriptions are sent again by resubscribe
+        self.send_queue.discard(self.pending_requests.entries.values())
+        self.pending_requests.reject_all(err, keep=self.subscription_manager.orig_sources.values())
+        delay = self.reconnect_delay
+        attempt = 0
+        while self.shouldReconnect:
+            if self.max_reconnect_attempts is not None and attempt >= self.max_reconnect_attempts:
+                break
+            attempt += 1
+            await asyncio.sleep(random.uniform(0, delay))
+            delay = min(delay * 2, self.reconnect_max_delay)
+            if not self.shouldReconnect:
+                break
+            self.events.emit('reconnect', {'attempt': attempt})
+            try:
+                self.wsconnection = await websockets.connect(self.api_url)
+            except Exception as error:
+                self.sanity_errors.on_next(error)
+                continue
+            self.add_task(self.__restore_session(), 'restore_session')
+            return True
+
+        self.reconnecting = False
+        return False
+
+    async def __restore_session(self) -> None:
+        """
+        Authorize the new connection again and revive the subscriptions. The requests sent while reconnecting are
+        released after the authorization.
+        """
+        connection = self.wsconnection
+        if self.authorize_request:
+            request = self.authorize_request.copy()
+            response_future = self.send_and_get_future(request, send=False)
+            try:
+                await connection.send(self.codec.dumps(request))
+                await response_future
+            except ConnectionClosed:
+                # __wait_data will start over with a new connection
+                return
+            except Exception as err:
+                self.sanity_errors.on_next(err)
+
+        if connection is not self.wsconnection or not self.connected.is_pending():
+            return
+        self.reconnecting = False
+        self.connected.resolve(True)
+        self.subscription_manager.resubscribe()
 
     def __set_api_url(self, connection_argument: dict) -> None:
         """
@@ -232,7 +451,7 @@ class DerivAPI(DerivAPICalls):
             Returns websockets.WebSocketClientProtocol
         """
         if not self.wsconnection and self.shouldReconnect:
-            self.events.on_next({'name': 'connect'})
+            self.events.emit('connect')
             self.wsconnection = await websockets.connect(self.api_url)
         if self.connected.is_pending():
             self.connected.resolve(True)
@@ -240,7 +459,7 @@ class DerivAPI(DerivAPICalls):
             self.connected = EasyFuture().resolve(True)
         return self.wsconnection
 
-    async def send(self, request: dict) -> dict:
+    async def send(self, request: dict, timeout: Optional[float] = None, priority: Optional[str] = None) -> dict:
         """
         Send the API call and returns response
 
@@ -248,20 +467,45 @@ class DerivAPI(DerivAPICalls):
         ----------
         request : dict
             API request
+        timeout : float
+            Seconds to wait for the response, defaults to the request_timeout option
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
 
         Returns
         -------
             API response
         """
 
+        if priority is not None and priority not in priorities:
+            raise ValueError(f'Unknown priority {priority}, expected one of: {", ".join(priorities)}')
+
         send_will_be_called = self.middlewares.call('sendWillBeCalled', {'request': request})
         if send_will_be_called:
             return send_will_be_called
 
-        self.events.on_next({'name': 'send', 'data': request})
-        response_future = self.send_and_get_source(request).pipe(op.first(), op.to_future())
-
-        response = await response_future
+        if request.get('subscribe'):
+            if self.rate_limiter.buckets:
+                await self.rate_limiter.acquire(request)
+            self.events.emit('send', request)
+            response_future = self.send_and_get_source(request, timeout, priority=priority).pipe(op.first(),
+                                                                                                 op.to_future())
+            response = await response_future
+        elif self.coalesce_calls and not self.coalesce_calls.isdisjoint(request) and 'req_id' not in request \
+                and 'passthrough' not in request:
+            response = await self.__send_coalesced(request, timeout, priority)
+        else:
+            if self.rate_limiter.buckets:
+                await self.rate_limiter.acquire(request)
+            self.events.emit('send', request)
+            response = await self.send_and_get_future(request, timeout, priority=priority)
+
+        if 'authorize' in request or 'logout' in request:
+            self.__track_authorize(request)
+        elif 'website_status' in request and self.rate_limit is True:
+            api_call_limits = (response.get('website_status') or {}).get('api_call_limits')
+            if api_call_limits:
+                self.rate_limiter.configure(api_call_limits)
         self.cache.set(request, response)
         if self.storage:
             self.storage.set(request, response)
@@ -271,7 +515,211 @@ class DerivAPI(DerivAPICalls):
         return response
 
 
-    def send_and_get_source(self, request: dict) -> Subject:
+    def __track_authorize(self, request: dict) -> None:
+        """
+        Remember the last authorize request to authorize again after reconnecting, forget it after logout
+
+        Parameters
+        ----------
+        request : dict
+            The answered API request
+        """
+        if 'authorize' in request:
+            self.authorize_request = {k: v for k, v in request.items() if k != 'req_id'}
+        elif 'logout' in request:
+            self.authorize_request = None
+
+    async def __send_coalesced(self, request: dict, timeout: Optional[float], priority: Optional[str]) -> dict:
+        """
+        Send a request unless an identical one is already waiting for its response, in which case that response is
+        shared. All the callers get the same response object.
+
+        Parameters
+        ----------
+        request : dict
+            API request
+        timeout : float
+            Seconds to wait for the response
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
+
+        Returns
+        -------
+            API response
+        """
+        key = request_key(request)
+        response_future = self.in_flight.get(key)
+        if response_future is None or response_future.done():
+            if self.rate_limiter.buckets:
+                response_future = asyncio.ensure_future(self.__send_when_allowed(request, timeout, priority))
+            else:
+                self.events.emit('send', request)
+                response_future = self.send_and_get_future(request, timeout, priority=priority)
+            self.in_flight[key] = response_future
+
+            def remove_in_flight(future: Future) -> None:
+                if self.in_flight.get(key) is future:
+                    del self.in_flight[key]
+
+            response_future.add_done_callback(remove_in_flight)
+        # shield the shared future, a cancelled caller should not cancel the others
+        return await asyncio.shield(response_future)
+
+    async def __send_when_allowed(self, request: dict, timeout: Optional[float], priority: Optional[str]) -> dict:
+        """
+        Wait for the rate limiter and send the request
+
+        Parameters
+        ----------
+        request : dict
+            API request
+        timeout : float
+            Seconds to wait for the response
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
+
+        Returns
+        -------
+            API response
+        """
+        await self.rate_limiter.acquire(request)
+        self.events.emit('send', request)
+        return await self.send_and_get_future(request, timeout, priority=priority)
+
+    async def process_request(self, all_args: dict) -> dict:
+        """
+        Validate the arguments of an API method according to the validate option and send the request
+
+        Parameters
+        ----------
+        all_args : dict
+            The method name, arguments, config and checker of the API method
+
+        Returns
+        -------
+            API response
+        """
+        if self.validate == 'full':
+            return await super().process_request(all_args)
+
+        method = all_args['method']
+        args = all_args['args']
+        if not isinstance(args, dict):
+            args = {method: args}
+        if self.validate == 'sampled':
+            count = self.validate_counts.get(method, 0) + 1
+            if count >= self.validate_sample:
+                count = 0
+                # noinspection PyBroadException
+                try:
+                    parsed_args, error = all_args['check'](args)
+                except Exception as err:
+                    parsed_args, error = None, str(err)
+                if error:
+                    self.sanity_errors.on_next(APIError(f'Invalid arguments of {method}: {error}'))
+                elif parsed_args is not None:
+                    args = parsed_args
+            self.validate_counts[method] = count
+        if method not in args:
+            args[method] = 1
+        return await self.send(args)
+
+    async def send_many(self, requests: Iterable[dict], concurrency: int = 10) -> List[Union[dict, Exception]]:
+        """
+        Send a batch of API calls with at most `concurrency` of them waiting for a response at a time
+
+        Every request is sent by the API method of its call, e.g. `contracts_for`, so it is validated the same way.
+        The call is found from the keys of the request, a call name that is a parameter of the call like
+        `landing_company` of `active_symbols` is taken as the parameter. Subscriptions are failed with an APIError,
+        they are sent by `subscribe`.
+
+        Example
+        -------
+        >>> responses = await api.send_many([{'contracts_for': symbol} for symbol in symbols], concurrency=20)
+
+        Parameters
+        ----------
+        requests : Iterable[dict]
+            API requests
+        concurrency : int
+            The maximum number of requests in flight. Default is 10
+
+        Returns
+        -------
+            The responses in the order of the requests. A failed request has its error, usually a ResponseError,
+            instead of the response
+        """
+        requests = list(requests)
+        responses: List[Union[dict, Exception, None]] = [None] * len(requests)
+        async for index, response in self.send_many_as_completed(requests, concurrency):
+            responses[index] = response
+        return responses
+
+    async def send_many_as_completed(self, requests: Iterable[dict], concurrency: int = 10
+                                     ) -> AsyncIterator[Tuple[int, Union[dict, Exception]]]:
+        """
+        Send a batch of API calls like `send_many` and yield the responses as they are received
+
+        Example
+        -------
+        >>> async for index, response in api.send_many_as_completed(proposals, concurrency=20):
+        ...     if not isinstance(response, Exception):
+        ...         print(proposals[index], response['proposal']['ask_price'])
+
+        Parameters
+        ----------
+        requests : Iterable[dict]
+            API requests
+        concurrency : int
+            The maximum number of requests in flight. Default is 10
+
+        Returns
+        -------
+            Async iterator of (index, response) tuples, the index is the position of the request in `requests`.
+            A failed request has its error instead of the response
+        """
+        if concurrency < 1:
+            raise ValueError(f'concurrency must be a positive number, passed: {concurrency}')
+        pending_requests = enumerate(requests)
+        in_flight: dict = {}
+        try:
+            while True:
+                for index, request in pending_requests:
+                    in_flight[asyncio.ensure_future(self.__call(request))] = index
+                    if len(in_flight) >= concurrency:
+                        break
+                if not in_flight:
+                    return
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = in_flight.pop(task)
+                    yield index, task.exception() or task.result()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def __call(self, request: dict) -> dict:
+        """
+        Call the API method of a request
+
+        Parameters
+        ----------
+        request : dict
+            API request
+
+        Returns
+        -------
+            API response
+        """
+        if request.get('subscribe'):
+            raise APIError('Subscriptions can not be sent in a batch, use subscribe')
+        name = api_method_of(request)
+        if name is None:
+            raise APIError(f'No API call is found in the request: {", ".join(request)}')
+        return await getattr(self, name)(request.copy())
+
+    def send_and_get_source(self, request: dict, timeout: Optional[float] = None, send: bool = True,
+                            priority: Optional[str] = None) -> Subject:
         """
         Send message and returns Subject
 
@@ -279,6 +727,12 @@ class DerivAPI(DerivAPICalls):
         ----------
         request : dict
             API request
+        timeout : float
+            Seconds to wait for the first response, defaults to the request_timeout option
+        send : bool
+            If False the source is only registered, the caller is responsible for sending the request
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
 
         Returns
         -------
@@ -286,21 +740,162 @@ class DerivAPI(DerivAPICalls):
         """
         pending = Subject()
         if 'req_id' not in request:
-            self.req_id += 1
-            request['req_id'] = self.req_id
-        self.pending_requests[request['req_id']] = pending
+            request['req_id'] = next(self.req_ids)
+        self.pending_requests.add(request['req_id'], pending, bool(request.get('subscribe')), timeout)
+        if send:
+            self.write_request(request, pending, priority)
+        return pending
+
+    def send_and_get_future(self, request: dict, timeout: Optional[float] = None, send: bool = True,
+                            priority: Optional[str] = None) -> Future:
+        """
+        Send a one-shot request and returns a Future of its response. It is lighter than `send_and_get_source` for
+        requests that are not subscriptions
+
+        Parameters
+        ----------
+        request : dict
+            API request
+        timeout : float
+            Seconds to wait for the response, defaults to the request_timeout option
+        send : bool
+            If False the future is only registered, the caller is responsible for sending the request
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
+
+        Returns
+        -------
+            Returns the Future
+        """
+        pending = asyncio.get_event_loop().create_future()
+        if 'req_id' not in request:
+            request['req_id'] = next(self.req_ids)
+        self.pending_requests.add(request['req_id'], pending, False, timeout)
+        if send:
+            self.send_queue.put(request, pending, priority)
+        return pending
+
+    def write_request(self, request: dict, source: Source, priority: Optional[str] = None) -> None:
+        """
+        Queue the request to be sent on the connection once it is connected. The request should already have a req_id
+        which is registered with the source
+
+        Parameters
+        ----------
+        request : dict
+            API request
+        source : Subject or Future
+            The source registered for the request, sending errors are pushed to it
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
+        """
+        self.send_queue.put(request, source, priority)
+
+    def submit_threadsafe(self, request: dict, timeout: Optional[float] = None,
+                          priority: Optional[str] = None) -> concurrent.futures.Future:
+        """
+        Send a one-shot API call from any thread. The request is handed to the writer of the connection without
+        waiting for the event loop to run a coroutine, unless it has to wait for the rate limiter. The middlewares and
+        the cache are not used.
+
+        Example
+        -------
+        >>> future = api.submit_threadsafe({'buy': 1, 'price': 10, 'parameters': parameters}, priority='trade')
+        >>> print(future.result()['buy']['contract_id'])
 
-        async def send_message():
+        Parameters
+        ----------
+        request : dict
+            API request, it is not changed
+        timeout : float
+            Seconds to wait for the response, defaults to the request_timeout option
+        priority : str
+            Priority class of the request: 'trade', 'pricing', 'normal' or 'bulk'. Default is the class of the call
+
+        Returns
+        -------
+            concurrent.futures.Future of the response
+        """
+        if request.get('subscribe'):
+            raise APIError('Use subscribe_threadsafe for subscriptions')
+        if priority is not None and priority not in priorities:
+            raise ValueError(f'Unknown priority {priority}, expected one of: {", ".join(priorities)}')
+        request = {**request, 'req_id': request.get('req_id') or next(self.req_ids)}
+        concurrent_future: concurrent.futures.Future = concurrent.futures.Future()
+
+        def transfer(future: Future) -> None:
+            if future.cancelled():
+                concurrent_future.set_exception(asyncio.CancelledError())
+            elif future.exception():
+                concurrent_future.set_exception(future.exception())
+            else:
+                self.__track_authorize(request)
+                concurrent_future.set_result(future.result())
+
+        def submit() -> None:
+            if not concurrent_future.set_running_or_notify_cancel():
+                return
             try:
-                await self.connected
-                await self.wsconnection.send(json.dumps(request))
+                if self.rate_limiter.buckets:
+                    future = asyncio.ensure_future(self.__send_when_allowed(request, timeout, priority))
+                else:
+                    self.events.emit('send', request)
+                    future = self.send_and_get_future(request, timeout, priority=priority)
             except Exception as err:
-                pending.on_error(err)
+                concurrent_future.set_exception(err)
+                return
+            future.add_done_callback(transfer)
 
-        self.add_task(send_message(), 'send_message')
-        return pending
+        self.loop.call_soon_threadsafe(submit)
+        return concurrent_future
+
+    def subscribe_threadsafe(self, request: dict, on_next: Callable[[dict], None],
+                             on_error: Optional[Callable[[Exception], None]] = None,
+                             on_completed: Optional[Callable[[], None]] = None,
+                             executor: Optional[concurrent.futures.Executor] = None) -> concurrent.futures.Future:
+        """
+        Subscribe to a given request from any thread
+
+        Example
+        -------
+        >>> executor = ThreadPoolExecutor(max_workers=1)
+        >>> subscription = api.subscribe_threadsafe({'ticks': 'R_100'}, on_tick, executor=executor).result()
+        >>> subscription.dispose()
+
+        Parameters
+        ----------
+        request : dict
+            Subscribe request
+        on_next : Callable
+            Called with every message
+        on_error : Callable
+            Called with the error of the subscription
+        on_completed : Callable
+            Called when the subscription is completed
+        executor : concurrent.futures.Executor
+            The callbacks are submitted to it, so slow callbacks do not hold the event loop. The messages are only
+            delivered in order by an executor with one worker. Default is None, the callbacks are called in the
+            thread of the event loop
 
-    async def subscribe(self, request: dict) -> Observable:
+        Returns
+        -------
+            concurrent.futures.Future of a Disposable, disposing it from any thread stops the callbacks
+        """
+
+        def dispatch(callback: Optional[Callable]) -> Optional[Callable]:
+            if callback is None or executor is None:
+                return callback
+            return lambda *args: executor.submit(callback, *args)
+
+        async def subscribe() -> abc.DisposableBase:
+            source = await self.subscribe(request)
+            disposable = source.subscribe(dispatch(on_next), dispatch(on_error), dispatch(on_completed))
+            return Disposable(lambda: self.loop.call_soon_threadsafe(disposable.dispose))
+
+        return asyncio.run_coroutine_threadsafe(subscribe(), self.loop)
+
+    async def subscribe(self, request: dict, policy: Optional[str] = None, buffer_size: int = 100,
+                        replay: int = 0) -> Observable:
         """
         Subscribe to a given request
 
@@ -308,6 +903,16 @@ class DerivAPI(DerivAPICalls):
         ----------
             request : dict
                 Subscribe request
+            policy : str
+                Buffer policy for slow consumers: 'latest-only', 'drop-oldest' or 'block'. See BufferedSource.
+                Default is None, the messages are pushed to the consumers as soon as they are received
+            buffer_size : int
+                The buffer bound of the 'drop-oldest' and 'block' policies
+            replay : int
+                Deliver the last messages of the subscription, up to this number, to every observer when it
+                subscribes. A consumer that joins a live `balance` or `website_status` stream gets the current state at
+                once instead of waiting for the next push. The last message is always kept, more are kept from the
+                first subscribe that asks for them. Default is 0, only the new messages
 
         Example
         -------
@@ -318,7 +923,31 @@ class DerivAPI(DerivAPICalls):
             Observable
         """
 
-        return await self.subscription_manager.subscribe(request)
+        return await self.subscription_manager.subscribe(request, policy, buffer_size, replay)
+
+    def tick_history(self, symbol: str) -> Optional[TickHistory]:
+        """
+        The last ticks of a symbol received by the `ticks` subscriptions. The history is kept after the subscriptions
+        are forgotten.
+
+        Example
+        -------
+        >>> api = DerivAPI(app_id=1234, tick_history=1000)
+        >>> await api.subscribe({'ticks': 'R_100'})
+        >>> quotes = api.tick_history('R_100').last(20)['quote']
+
+        Parameters
+        ----------
+            symbol : str
+                The symbol of the ticks
+
+        Returns
+        -------
+            TickHistory, None if no tick of the symbol is received
+        """
+        if not self.subscription_manager.tick_history_size:
+            raise APIError('Tick history is not kept, pass tick_history to DerivAPI to keep it')
+        return self.subscription_manager.tick_histories.get(symbol)
 
     async def forget(self, subs_id: str) -> dict:
         """
@@ -361,14 +990,18 @@ class DerivAPI(DerivAPICalls):
         Disconnect the websockets connection
 
         """
-        if not self.connected.is_resolved():
+        if not self.connected.is_resolved() and not self.reconnecting:
             return
-        self.connected = EasyFuture().reject(ConnectionClosedOK(None, Close(1000, 'Closed by disconnect')))
+        err = ConnectionClosedOK(None, Close(1000, 'Closed by disconnect'))
+        if self.connected.is_pending():
+            self.connected.reject(err)
+        else:
+            self.connected = EasyFuture().reject(err)
         self.connected.exception()  # fetch exception to avoid the warning of 'exception never retrieved'
+        self.reconnecting = False
         if self.wsconnection_from_inside:
-            # TODO NEXT reconnect feature
             self.shouldReconnect = False
-            self.events.on_next({'name': 'close'})
+            self.events.emit('close')
             await self.wsconnection.close()
 
     def expect_response(self, *msg_types):
@@ -1,6979 +1,1206 @@
 # This file was automatically generated by scripts/regen-py.pl at 20231004-000733
 
 
+from abc import ABCMeta, abstractmethod
 from numbers import Number
+from types import MappingProxyType
 
 # =======================
 # ----- API Methods -----
 # =======================
 
+# One row for every API method: (method, description, needs_method_arg, params), every param is
+# (name, type, required, description). The methods are built from their rows when they are first used.
+_api_methods = (
+    ("active_symbols", "Retrieve a list of all currently active symbols (underlying markets upon which contracts are available for trading).", "1", (
+        ("active_symbols", "string", 1, "If you use brief, only a subset of fields will be returned."),
+        ("landing_company", "string", 0, "Deprecated - replaced by landing_company_short."),
+        ("landing_company_short", "string", 0, "[Optional] If you specify this field, only symbols available for trading by that landing company will be returned. If you are logged in, only symbols available for trading by your landing company will be returned regardless of what you specify in this field."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("product_type", "string", 0, "[Optional] If you specify this field, only symbols that can be traded through that product type will be returned."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("api_token", "This call manages API tokens", "1", (
+        ("api_token", "integer", 1, "Must be 1"),
+        ("delete_token", "string", 0, "[Optional] The token to remove."),
+        ("new_token", "string", 0, "[Optional] The name of the created token."),
+        ("new_token_scopes", None, 0, "[Optional] List of permission scopes to provide with the token."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("valid_for_current_ip_only", "integer", 0, "[Optional] If you set this parameter during token creation, then the token created will only work for the IP address that was used to create the token"),
+    )),
+    ("app_delete", "The request for deleting an application.", "1", (
+        ("app_delete", "integer", 1, "Application app_id"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("app_get", "To get the information of the OAuth application specified by 'app_id'", "1", (
+        ("app_get", "integer", 1, "Application app_id"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("app_list", "List all of the account's OAuth applications", "1", (
+        ("app_list", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("app_markup_details", "Retrieve details of `app_markup` according to criteria specified.", "1", (
+        ("app_id", "integer", 0, "[Optional] Specific application app_id to report on."),
+        ("app_markup_details", "integer", 1, "Must be 1"),
+        ("client_loginid", "string", 0, "[Optional] Specific client loginid to report on, like CR12345"),
+        ("date_from", "string", 1, "Start date (epoch or YYYY-MM-DD HH:MM:SS). Results are inclusive of this time."),
+        ("date_to", "string", 1, "End date (epoch or YYYY-MM-DD HH::MM::SS). Results are inclusive of this time."),
+        ("description", "integer", 0, "[Optional] If set to 1, will return app_markup transaction details."),
+        ("limit", "numeric", 0, "[Optional] Apply upper limit to count of transactions received."),
+        ("offset", "integer", 0, "[Optional] Number of transactions to skip."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sort", "string", 0, "[Optional] Sort direction on transaction_time. Other fields sort order is ASC."),
+        ("sort_fields", None, 0, "[Optional] One or more of the specified fields to sort on. Default sort field is by transaction_time."),
+    )),
+    ("app_markup_statistics", "Retrieve statistics of `app_markup`.", "1", (
+        ("app_markup_statistics", "integer", 1, "Must be 1"),
+        ("date_from", "string", 1, "Start date (epoch or YYYY-MM-DD HH:MM:SS). Results are inclusive of this time."),
+        ("date_to", "string", 1, "End date (epoch or YYYY-MM-DD HH::MM::SS). Results are inclusive of this time."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("app_register", "Register a new OAuth application", "1", (
+        ("app_markup_percentage", "numeric", 0, "[Optional] Markup to be added to contract prices (as a percentage of contract payout). Max markup: 3%."),
+        ("app_register", "integer", 1, "Must be 1"),
+        ("appstore", "string", 0, "[Optional] Application's App Store URL (if applicable)."),
+        ("github", "string", 0, "[Optional] Application's GitHub page (for open-source projects)."),
+        ("googleplay", "string", 0, "[Optional] Application's Google Play URL (if applicable)."),
+        ("homepage", "string", 0, "[Optional] Application's homepage URL."),
+        ("name", "string", 1, "Application name."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("redirect_uri", "string", 0, "[Optional] The URL to redirect to after a successful login. Required if charging markup percentage"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("scopes", None, 1, "List of permission scopes to grant the application."),
+        ("verification_uri", "string", 0, "[Optional] Used when verify_email called. If available, a URL containing the verification token will be sent to the client's email, otherwise only the token will be sent."),
+    )),
+    ("app_update", "Update a new OAuth application", "1", (
+        ("app_markup_percentage", "numeric", 0, "[Optional] Markup to be added to contract prices (as a percentage of contract payout). Max markup: 3%."),
+        ("app_update", "integer", 1, "Application app_id."),
+        ("appstore", "string", 0, "[Optional] Application's App Store URL (if applicable)."),
+        ("github", "string", 0, "[Optional] Application's GitHub page (for open-source projects)."),
+        ("googleplay", "string", 0, "[Optional] Application's Google Play URL (if applicable)."),
+        ("homepage", "string", 0, "[Optional] Application's homepage URL."),
+        ("name", "string", 1, "Application name."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("redirect_uri", "string", 0, "[Optional] The URL to redirect to after a successful login. Required if charging markup percentage."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("scopes", None, 1, "Change scopes will revoke all user's grants and log them out."),
+        ("verification_uri", "string", 0, "[Optional] Used when verify_email called. If available, a URL containing the verification token will send to the client's email, otherwise only the token will be sent."),
+    )),
+    ("asset_index", "Retrieve a list of all available underlyings and the corresponding contract types and duration boundaries. If the user is logged in, only the assets available for that user's landing company will be returned.", "1", (
+        ("asset_index", "integer", 1, "Must be 1"),
+        ("landing_company", "string", 0, "Deprecated - replaced by landing_company_short."),
+        ("landing_company_short", "string", 0, "[Optional] If specified, will return only the underlyings for the specified landing company."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("authorize", "Authorize current WebSocket session to act on behalf of the owner of a given token. Must precede requests that need to access client account, for example purchasing and selling contracts or viewing portfolio.", "1", (
+        ("add_to_login_history", "integer", 0, "[Optional] Send this when you use api tokens for authorization and want to track activity using login_history call."),
+        ("authorize", "string", 1, "Authentication token. May be retrieved from https://www.binary.com/en/user/security/api_tokenws.html"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("balance", "Get user account balance", "1", (
+        ("account", "string", 0, "[Optional] If set to all, return the balances of all accounts one by one; if set to current, return the balance of current account; if set as an account id, return the balance of that account."),
+        ("balance", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever the balance changes."),
+    )),
+    ("buy", "Buy a Contract", "1", (
+        ("buy", "string", 1, "Either the ID received from a Price Proposal (proposal call), or 1 if contract buy parameters are passed in the parameters field."),
+        ("parameters", None, 0, None),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("price", "numeric", 1, "Maximum price at which to purchase the contract."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] 1 to stream."),
+    )),
+    ("buy_contract_for_multiple_accounts", "Buy a Contract for multiple Accounts specified by the `tokens` parameter. Note, although this is an authorized call, the contract is not bought for the authorized account.", "1", (
+        ("buy_contract_for_multiple_accounts", "string", 1, "Either the ID received from a Price Proposal (proposal call), or 1 if contract buy parameters are passed in the parameters field."),
+        ("parameters", None, 0, None),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("price", "numeric", 1, "Maximum price at which to purchase the contract."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("tokens", None, 1, "List of API tokens identifying the accounts for which the contract is bought. Note: If the same token appears multiple times or if multiple tokens designate the same account, the contract is bought multiple times for this account."),
+    )),
+    ("cancel", "Cancel contract with contract id", "1", (
+        ("cancel", "integer", 1, "Value should be the contract_id which received from the portfolio call."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("cashier", "Request the cashier info for the specified type.", "1", (
+        ("address", "string", 0, "[Optional] Address for crypto withdrawal. Only applicable for api type."),
+        ("amount", "numeric", 0, "[Optional] Amount for crypto withdrawal. Only applicable for api type."),
+        ("cashier", "string", 1, "Operation which needs to be requested from cashier"),
+        ("dry_run", "integer", 0, "[Optional] If set to 1, only validation is performed. Only applicable for withdraw using crypto provider and api type."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("provider", "string", 0, "[Optional] Cashier provider. crypto will be default option for crypto currency accounts."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("type", "string", 0, "[Optional] Data need to be returned from cashier. api is supported only for crypto provider."),
+        ("verification_code", "string", 0, "[Optional] Email verification code (received from a verify_email call, which must be done first)"),
+    )),
+    ("contract_update", "Update a contract condition.", "1", (
+        ("contract_id", "integer", 1, "Internal unique contract identifier."),
+        ("contract_update", "integer", 1, "Must be 1"),
+        ("limit_order", None, 0, None),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("contract_update_history", "Request for contract update history.", "1", (
+        ("contract_id", "integer", 1, "Internal unique contract identifier."),
+        ("contract_update_history", "integer", 1, "Must be 1"),
+        ("limit", "numeric", 0, "[Optional] Maximum number of historical updates to receive."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("contracts_for", "For a given symbol, get the list of currently available contracts, and the latest barrier and duration limits for each contract.", "1", (
+        ("contracts_for", "string", 1, "The short symbol name (obtained from active_symbols call)."),
+        ("currency", "string", 0, "[Optional] Currency of the contract's stake and payout (obtained from payout_currencies call)."),
+        ("landing_company", "string", 0, "Deprecated - Replaced by landing_company_short."),
+        ("landing_company_short", "string", 0, "[Optional] Indicates which landing company to get a list of contracts for. If you are logged in, your account's landing company will override this field. Note that when landing_company_short is set to 'virtual', landing_company will take precendce until the deprecated field is removed from the api."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("product_type", "string", 0, "[Optional] If you specify this field, only contracts tradable through that contract type will be returned."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("copy_start", "Start copy trader bets", "1", (
+        ("assets", None, 0, "[Optional] Used to set assets to be copied. E.x [\"frxUSDJPY\", \"R_50\"]"),
+        ("copy_start", "string", 1, "API tokens identifying the accounts of trader which will be used to copy trades"),
+        ("max_trade_stake", "numeric", 0, "[Optional] Used to set maximum trade stake to be copied."),
+        ("min_trade_stake", "numeric", 0, "[Optional] Used to set minimal trade stake to be copied."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trade_types", None, 0, "[Optional] Used to set trade types to be copied. E.x [\"CALL\", \"PUT\"]"),
+    )),
+    ("copy_stop", "Stop copy trader bets", "1", (
+        ("copy_stop", "string", 1, "API tokens identifying the accounts which needs not to be copied"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("copytrading_list", "Retrieves a list of active copiers and/or traders for Copy Trading", "1", (
+        ("copytrading_list", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("copytrading_statistics", "Retrieve performance, trading, risk and copiers statistics of trader.", "1", (
+        ("copytrading_statistics", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trader_id", "string", 1, "The ID of the target trader."),
+    )),
+    ("crypto_config", "The request for cryptocurrencies configuration.", "1", (
+        ("crypto_config", "integer", 1, "Must be 1"),
+        ("currency_code", "string", 0, "[Optional] Cryptocurrency code. Sending request with currency_code provides crypto config for the sent cryptocurrency code only."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("document_upload", "Request KYC information from client", "1", (
+        ("document_format", "string", 1, "Document file format"),
+        ("document_id", "string", 0, "[Optional] Document ID (required for Passport, Proof of ID and Driver's License)"),
+        ("document_issuing_country", "string", 0, "2-letter country code, mandatory for POI only"),
+        ("document_type", "string", 1, "Document type"),
+        ("document_upload", "integer", 1, "Must be 1"),
+        ("expected_checksum", "string", 1, "The checksum of the file to be uploaded"),
+        ("expiration_date", "string", 0, "[Optional] Document expiration date (required for Passport, Proof of ID and Driver's License)"),
+        ("file_size", "integer", 1, "Document size (should be less than 10MB)"),
+        ("lifetime_valid", "integer", 0, "[Optional] Boolean value that indicates whether this document is lifetime valid (only applies to POI document types, cancels out the expiration_date given if any)"),
+        ("page_type", "string", 0, "[Optional] To determine document side"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("proof_of_ownership", None, 0, None),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("economic_calendar", "Specify a currency to receive a list of events related to that specific currency. For example, specifying USD will return a list of USD-related events. If the currency is omitted, you will receive a list for all currencies.", "1", (
+        ("currency", "string", 0, "[Optional] Currency symbol."),
+        ("economic_calendar", "integer", 1, "Must be 1"),
+        ("end_date", "integer", 0, "[Optional] End date."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("start_date", "integer", 0, "[Optional] Start date."),
+    )),
+    ("exchange_rates", "Retrieves the exchange rates from a base currency to all currencies supported by the system.", "1", (
+        ("base_currency", "string", 1, "Base currency (can be obtained from payout_currencies call)"),
+        ("exchange_rates", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] 1 - to initiate a realtime stream of exchange rates relative to base currency."),
+        ("target_currency", "string", 0, "[Optional] Local currency"),
+    )),
+    ("forget", "Immediately cancel the real-time stream of messages with a specific ID.", "1", (
+        ("forget", "string", 1, "ID of the real-time stream of messages to cancel."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("forget_all", "Immediately cancel the real-time streams of messages of given type.", "1", (
+        ("forget_all", None, 1, "Cancel all streams by type. The value can be either a single type e.g. \"ticks\", or an array of multiple types e.g. [\"candles\", \"ticks\"]."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("get_account_status", "Get Account Status", "1", (
+        ("get_account_status", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("get_financial_assessment", "This call gets the financial assessment details. The 'financial assessment' is a questionnaire that clients of certain Landing Companies need to complete, due to regulatory and KYC (know your client) requirements.", "1", (
+        ("get_financial_assessment", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("get_limits", "Trading and Withdrawal Limits for a given user", "1", (
+        ("get_limits", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("get_self_exclusion", "Allows users to exclude themselves from the website for certain periods of time, or to set limits on their trading activities. This facility is a regulatory requirement for certain Landing Companies.", "1", (
+        ("get_self_exclusion", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("get_settings", "Get User Settings (email, date of birth, address etc)", "1", (
+        ("get_settings", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("identity_verification_document_add", "Adds document information such as issuing country, id and type for identity verification processes.", "1", (
+        ("document_additional", "string", 0, "[Optional] Additional info required by some document types."),
+        ("document_number", "string", 1, "The identification number of the document."),
+        ("document_type", "string", 1, "The type of the document based on provided issuing_country (can obtained from residence_list call)."),
+        ("identity_verification_document_add", "integer", 1, "Must be 1"),
+        ("issuing_country", "string", 1, "2-letter country code (can obtained from residence_list call)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("kyc_auth_status", "Get KYC Authentication Status", "1", (
+        ("kyc_auth_status", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("landing_company", "The company has a number of licensed subsidiaries in various jurisdictions, which are called Landing Companies. This call will return the appropriate Landing Company for clients of a given country. The landing company may differ for Gaming contracts (Synthetic Indices) and Financial contracts (Forex, Stock Indices, Commodities).", "1", (
+        ("landing_company", "string", 1, "Client's 2-letter country code (obtained from residence_list call)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("landing_company_details", "The company has a number of licensed subsidiaries in various jurisdictions, which are called Landing Companies (and which are wholly owned subsidiaries of the Deriv Group). This call provides information about each Landing Company.", "1", (
+        ("country", "string", 0, "[Optional] Will return an extra field tin_not_mandatory indicating if the landing company does not require tax identification number for the provided country."),
+        ("landing_company_details", "string", 1, "Landing company shortcode."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("login_history", "Retrieve a summary of login history for user.", "1", (
+        ("limit", "integer", 0, "[Optional] Apply limit to count of login history records."),
+        ("login_history", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("logout", "Logout the session", "1", (
+        ("logout", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("mt5_deposit", "This call allows deposit into MT5 account from Binary account.", "1", (
+        ("amount", "numeric", 0, "Amount to deposit (in the currency of from_binary); min = $1 or an equivalent amount, max = $20000 or an equivalent amount"),
+        ("from_binary", "string", 0, "Binary account loginid to transfer money from"),
+        ("mt5_deposit", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("to_mt5", "string", 1, "MT5 account login to deposit money to"),
+    )),
+    ("mt5_get_settings", "Get MT5 user account settings", "1", (
+        ("login", "string", 1, "MT5 user login"),
+        ("mt5_get_settings", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("mt5_login_list", "Get list of MT5 accounts for client", "1", (
+        ("mt5_login_list", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("mt5_new_account", "This call creates new MT5 user, either demo or real money user.", "1", (
+        ("account_type", "string", 1, "Account type. If set to 'financial', setting 'mt5_account_type' is also required."),
+        ("address", "string", 0, "[Optional] The address of the user. The maximum length of this address field is 128 characters."),
+        ("city", "string", 0, "[Optional] User's city of residence."),
+        ("company", "string", 0, "[Optional] Name of the client's company. The maximum length of the company name is 64 characters."),
+        ("country", "string", 0, "[Optional] 2-letter country code (value received from residence_list call)."),
+        ("currency", "string", 0, "[Optional] MT5 account currency, the default value will be the qualified account currency."),
+        ("dry_run", "integer", 0, "[Optional] If set to 1, only validation is performed."),
+        ("email", "string", 1, "Email address"),
+        ("investPassword", "string", 0, "[Optional] The investor password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)."),
+        ("leverage", "numeric", 1, "Client leverage (from 1 to 1000)."),
+        ("mainPassword", "string", 1, "The master password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address). This field is required."),
+        ("mt5_account_category", "string", 0, "[Optional] To choose whether account is conventional or swap_free. Unavailable for financial_stp MT5_account_type"),
+        ("mt5_account_type", "string", 0, "[Optional] Financial: Variable spreads, High leverage. Financial STP: Variable spreads, Medium Leverage, more products. If 'account_type' set to 'financial', setting 'mt5_account_type' is also required."),
+        ("mt5_new_account", "integer", 1, "Must be 1"),
+        ("name", "string", 1, "Client's name. The maximum length here is 101 characters."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("phone", None, 0, "[Optional] User's phone number."),
+        ("phonePassword", "string", 0, "[Optional] The user's phone password."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("server", None, 0, "[Optional] Trade server."),
+        ("state", "string", 0, "[Optional] User's state (region) of residence."),
+        ("sub_account_category", "string", 0, "[Optional] Indicate the sub account category that we have in the cfd group naming convention."),
+        ("zipCode", "string", 0, "[Optional] User's zip code."),
+    )),
+    ("mt5_password_change", "To change passwords of the MT5 account.", "1", (
+        ("login", "string", 1, "MT5 user login"),
+        ("mt5_password_change", "integer", 1, "Must be 1"),
+        ("new_password", "string", 1, "New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)."),
+        ("old_password", "string", 1, "Old password for validation (non-empty string, accepts any printable ASCII character)"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("password_type", "string", 0, "[Optional] Type of the password to change."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("mt5_password_check", "This call validates the main password for the MT5 user", "1", (
+        ("login", "string", 1, "MT5 user login"),
+        ("mt5_password_check", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("password", "string", 1, "The password of the account."),
+        ("password_type", "string", 0, "[Optional] Type of the password to check."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("mt5_password_reset", "To reset the password of MT5 account.", "1", (
+        ("login", "string", 1, "MT5 user login"),
+        ("mt5_password_reset", "integer", 1, "Must be 1"),
+        ("new_password", "string", 1, "New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("password_type", "string", 0, "[Optional] Type of the password to reset."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("verification_code", "string", 1, "Email verification code (received from a verify_email call, which must be done first)"),
+    )),
+    ("mt5_withdrawal", "This call allows withdrawal from MT5 account to Binary account.", "1", (
+        ("amount", "numeric", 1, "Amount to withdraw (in the currency of the MT5 account); min = $1 or an equivalent amount, max = $20000 or an equivalent amount."),
+        ("from_mt5", "string", 1, "MT5 account login to withdraw money from"),
+        ("mt5_withdrawal", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("to_binary", "string", 1, "Binary account loginid to transfer money to"),
+    )),
+    ("new_account_maltainvest", "This call opens a new real-money account with the `maltainvest` Landing Company. This call can be made from a virtual-money account or real-money account at Deriv (Europe) Limited. If it is the latter, client information fields in this call will be ignored and data from your existing real-money account will be used.", "1", (
+        ("accept_risk", "integer", 0, "Show whether client has accepted risk disclaimer."),
+        ("account_opening_reason", "string", 0, "[Optional] Purpose and reason for requesting the account opening."),
+        ("account_turnover", "string", 0, "[Optional] The anticipated account turnover."),
+        ("address_city", "string", 1, "Within 100 characters"),
+        ("address_line_1", "string", 1, "Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-"),
+        ("address_line_2", "string", 0, "[Optional] Within 70 characters."),
+        ("address_postcode", "string", 0, "[Optional] Within 20 characters and may not contain '+'."),
+        ("address_state", "string", 0, "[Optional] Possible value receive from states_list call."),
+        ("affiliate_token", "string", 0, "[Optional] Affiliate token, within 32 characters."),
+        ("cfd_experience", "string", 0, "How much experience do you have in CFD trading?"),
+        ("cfd_frequency", "string", 0, "How many CFD trades have you placed in the past 12 months?"),
+        ("cfd_trading_definition", "string", 0, "In your understanding, CFD trading allows you to:"),
+        ("citizen", "string", 0, "[Optional] Country of legal citizenship, 2-letter country code. Possible value receive from residence_list call."),
+        ("client_type", "string", 0, "[Optional] Indicates whether this is for a client requesting an account with professional status."),
+        ("currency", "string", 0, "[Optional] To set currency of the account. List of supported currencies can be acquired with payout_currencies call."),
+        ("date_of_birth", "string", 1, "Date of birth format: yyyy-mm-dd."),
+        ("education_level", "string", 0, "Level of Education"),
+        ("employment_industry", "string", 0, "Industry of Employment."),
+        ("employment_status", "string", 1, "Employment Status."),
+        ("estimated_worth", "string", 0, "Estimated Net Worth."),
+        ("first_name", "string", 1, "Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes."),
+        ("income_source", "string", 0, "Income Source."),
+        ("last_name", "string", 1, "Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes."),
+        ("leverage_impact_trading", "string", 0, "How does leverage affect CFD trading?"),
+        ("leverage_trading_high_risk_stop_loss", "string", 0, "Leverage trading is high-risk, so it's a good idea to use risk management features such as stop loss. Stop loss allows you to"),
+        ("net_income", "string", 0, "Net Annual Income."),
+        ("new_account_maltainvest", "integer", 1, "Must be 1"),
+        ("non_pep_declaration", "integer", 0, "[Optional] Indicates client's self-declaration of not being a PEP/RCA."),
+        ("occupation", "string", 0, "Occupation."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("phone", None, 0, "[Optional] Starting with + followed by 9-35 digits, hyphens or space."),
+        ("place_of_birth", "string", 0, "[Optional] Place of birth, 2-letter country code."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("required_initial_margin", "string", 0, "When would you be required to pay an initial margin?"),
+        ("residence", "string", 1, "2-letter country code, possible value receive from residence_list call."),
+        ("risk_tolerance", "string", 0, "Do you understand that you could potentially lose 100% of the money you use to trade?"),
+        ("salutation", "string", 1, "Accept any value in enum list."),
+        ("secret_answer", "string", 0, "[Optional] Answer to secret question, within 4-50 characters."),
+        ("secret_question", "string", 0, "[Optional] Accept any value in enum list."),
+        ("source_of_experience", "string", 0, "How much knowledge and experience do you have in relation to online trading?"),
+        ("source_of_wealth", "string", 0, "[Optional] Source of wealth."),
+        ("tax_identification_number", "string", 1, "Tax identification number. Only applicable for real money account. Required for maltainvest landing company."),
+        ("tax_residence", "string", 1, "Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company."),
+        ("trading_experience_financial_instruments", "string", 0, "How much experience do you have with other financial instruments?"),
+        ("trading_frequency_financial_instruments", "string", 0, "How many trades have you placed with other financial instruments in the past 12 months?"),
+    )),
+    ("new_account_real", "This call opens a new real-money account. This call can be made from a virtual-money or a real-money account. If it is the latter, client information fields in this call will be ignored and data from your existing real-money account will be used.", "1", (
+        ("account_opening_reason", "string", 0, "[Optional] Purpose and reason for requesting the account opening."),
+        ("account_turnover", "string", 0, "[Optional] The anticipated account turnover."),
+        ("address_city", "string", 0, "[Optional] Within 100 characters."),
+        ("address_line_1", "string", 0, "Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-"),
+        ("address_line_2", "string", 0, "[Optional] Within 70 characters."),
+        ("address_postcode", "string", 0, "[Optional] Within 20 characters and may not contain '+'."),
+        ("address_state", "string", 0, "[Optional] Possible value receive from states_list call."),
+        ("affiliate_token", "string", 0, "[Optional] Affiliate token, within 32 characters."),
+        ("citizen", None, 0, "[Optional] Country of legal citizenship, 2-letter country code."),
+        ("client_type", "string", 0, "[Optional] Indicates whether this is for a client requesting an account with professional status."),
+        ("currency", "string", 0, "[Optional] To set currency of the account. List of supported currencies can be acquired with payout_currencies call."),
+        ("date_of_birth", "string", 0, "Date of birth format: yyyy-mm-dd."),
+        ("first_name", "string", 0, "Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes."),
+        ("last_name", "string", 0, "Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes."),
+        ("new_account_real", "integer", 1, "Must be 1"),
+        ("non_pep_declaration", "integer", 0, "[Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("phone", None, 0, "[Optional] Starting with + followed by 9-35 digits, hyphens or space."),
+        ("place_of_birth", "string", 0, "[Optional] Place of birth, 2-letter country code."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("residence", "string", 0, "2-letter country code, possible value receive from residence_list call."),
+        ("salutation", "string", 0, "[Optional] Accept any value in enum list."),
+        ("secret_answer", "string", 0, "[Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client open another account."),
+        ("secret_question", "string", 0, "[Optional] Accept any value in enum list. Required for new account and existing client details will be used if client open another account."),
+        ("tax_identification_number", "string", 0, "[Optional] Tax identification number. Only applicable for real money account. Required for maltainvest landing company."),
+        ("tax_residence", "string", 0, "[Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company."),
+    )),
+    ("new_account_virtual", "Create a new virtual-money account.", "1", (
+        ("affiliate_token", "string", 0, "[Optional] Affiliate token, within 32 characters."),
+        ("client_password", "string", 0, "Password (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)."),
+        ("date_first_contact", "string", 0, "[Optional] Date of first contact, format: yyyy-mm-dd in GMT timezone."),
+        ("email_consent", "integer", 0, "[Optional] Boolean value: 1 or 0, indicating whether the client has given consent for marketing emails."),
+        ("gclid_url", "string", 0, "[Optional] Google Click Identifier to track source."),
+        ("new_account_virtual", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("residence", "string", 0, "2-letter country code (obtained from residence_list call)."),
+        ("signup_device", "string", 0, "[Optional] Show whether user has used mobile or desktop."),
+        ("type", "string", 0, "Account type"),
+        ("utm_ad_id", None, 0, "[Optional] Identifier of particular ad. Value must match Regex pattern to be recorded"),
+        ("utm_adgroup_id", None, 0, "[Optional] Identifier of ad group in the campaign. Value must match Regex pattern to be recorded"),
+        ("utm_adrollclk_id", None, 0, "[Optional] Unique identifier of click on AdRoll ads platform. Value must match Regex pattern to be recorded"),
+        ("utm_campaign", None, 0, "[Optional] Identifies a specific product promotion or strategic campaign such as a spring sale or other promotions. Value must match Regex pattern to be recorded"),
+        ("utm_campaign_id", None, 0, "[Optional] Identifier of paid ad campaign. Value must match Regex pattern to be recorded"),
+        ("utm_content", None, 0, "[Optional] Used to differentiate similar content, or links within the same ad. Value must match Regex pattern to be recorded"),
+        ("utm_fbcl_id", None, 0, "[Optional] Unique identifier of click on Facebook ads platform. Value must match Regex pattern to be recorded"),
+        ("utm_gl_client_id", None, 0, "[Optional] Unique visitor identifier on Google Ads platform. Value must match Regex pattern to be recorded"),
+        ("utm_medium", None, 0, "[Optional] Identifies the medium the link was used upon such as: email, CPC, or other methods of sharing. Value must match Regex pattern to be recorded"),
+        ("utm_msclk_id", None, 0, "[Optional] Unique click identifier on Microsoft Bing ads platform. Value must match Regex pattern to be recorded"),
+        ("utm_source", None, 0, "[Optional] Identifies the source of traffic such as: search engine, newsletter, or other referral. Value must match Regex pattern to be recorded"),
+        ("utm_term", None, 0, "[Optional] Used to send information related to the campaign term like paid search keywords. Value must match Regex pattern to be recorded"),
+        ("verification_code", "string", 0, "Email verification code (received from a verify_email call, which must be done first)."),
+    )),
+    ("oauth_apps", "List all my used OAuth applications.", "1", (
+        ("oauth_apps", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_advert_create", "Creates a P2P (Peer to Peer) advert. Can only be used by an approved P2P advertiser.", "1", (
+        ("amount", "numeric", 1, "The total amount of the advert, in advertiser's account currency."),
+        ("block_trade", "integer", 0, "[Optional] Indicates if this is block trade ad or not. Default: 0."),
+        ("contact_info", "string", 0, "[Optional] Advertiser contact information."),
+        ("description", "string", 0, "[Optional] General information about the advert."),
+        ("local_currency", "string", 0, "[Optional] Local currency for this advert. If not provided, will use the currency of client's residence by default."),
+        ("max_order_amount", "numeric", 1, "Maximum allowed amount for the orders of this advert, in advertiser's account_currency. Should be more than or equal to min_order_amount"),
+        ("min_order_amount", "numeric", 1, "Minimum allowed amount for the orders of this advert, in advertiser's account_currency. Should be less than or equal to max_order_amount."),
+        ("p2p_advert_create", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_info", "string", 0, "[Optional] Payment instructions."),
+        ("payment_method", "string", 0, "[Optional] Payment method name (deprecated)."),
+        ("payment_method_ids", None, 0, "IDs of previously saved payment methods as returned from p2p_advertiser_payment_methods, only applicable for sell ads."),
+        ("payment_method_names", None, 0, "Payment method identifiers as returned from p2p_payment_methods, only applicable for buy ads."),
+        ("rate", "numeric", 1, "Conversion rate from advertiser's account currency to local_currency. An absolute rate value (fixed), or percentage offset from current market rate (floating)."),
+        ("rate_type", "string", 0, "Type of rate, fixed or floating."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("type", "string", 1, "The advertisement represents the intention to perform this action on your Deriv account funds."),
+    )),
+    ("p2p_advert_info", "Retrieve information about a P2P advert.", "1", (
+        ("id", "string", 0, "[Optional] The unique identifier for this advert. Optional when subscribe is 1. If not provided, all advertiser adverts will be subscribed."),
+        ("p2p_advert_info", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates when changes occur. Optional when id is provided."),
+        ("use_client_limits", "integer", 0, "[Optional] If set to 1, the maximum order amount will be adjusted to the current balance and turnover limits of the account."),
+    )),
+    ("p2p_advert_list", "Returns available adverts for use with `p2p_order_create` .", "1", (
+        ("advertiser_id", "string", 0, "[Optional] ID of the advertiser to list adverts for."),
+        ("advertiser_name", "string", 0, "[Optional] Search for advertiser by name. Partial matches will be returned."),
+        ("amount", "numeric", 0, "[Optional] How much to buy or sell, used to calculate prices."),
+        ("block_trade", "integer", 0, "[Optional] Return block trade adverts when 1, non-block trade adverts when 0 (default)."),
+        ("counterparty_type", "string", 0, "[Optional] Filter the adverts by counterparty_type."),
+        ("favourites_only", "integer", 0, "[Optional] Only show adverts from favourite advertisers. Default is 0."),
+        ("limit", "integer", 0, "[Optional] Used for paging."),
+        ("local_currency", "string", 0, "[Optional] Currency to conduct payment transaction in. If not provided, only ads from country of residence will be returned."),
+        ("offset", "integer", 0, "[Optional] Used for paging."),
+        ("p2p_advert_list", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_method", None, 0, "[Optional] Search by supported payment methods."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sort_by", "string", 0, "[Optional] How the results are sorted."),
+        ("use_client_limits", "integer", 0, "[Optional] If set to 1, ads that exceed this account's balance or turnover limits will not be shown."),
+    )),
+    ("p2p_advert_update", "Updates a P2P advert. Can only be used by the advertiser.", "1", (
+        ("contact_info", "string", 0, "[Optional] Advertiser contact information."),
+        ("delete", "integer", 0, "[Optional] If set to 1, permanently deletes the advert."),
+        ("description", "string", 0, "[Optional] General information about the advert."),
+        ("id", "string", 1, "The unique identifier for this advert."),
+        ("is_active", "integer", 0, "[Optional] Activate or deactivate the advert."),
+        ("local_currency", "string", 0, "[Optional] Local currency for this advert."),
+        ("max_order_amount", "numeric", 0, "[Optional] Maximum allowed amount for the orders of this advert, in advertiser's account_currency. Should be more than or equal to min_order_amount."),
+        ("min_order_amount", "numeric", 0, "[Optional] Minimum allowed amount for the orders of this advert, in advertiser's account_currency. Should be less than or equal to max_order_amount."),
+        ("p2p_advert_update", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_info", "string", 0, "[Optional] Payment instructions."),
+        ("payment_method_ids", None, 0, "[Optional] IDs of previously saved payment methods as returned from p2p_advertiser_payment_methods, only applicable for sell ads. Exisiting methods will be replaced."),
+        ("payment_method_names", None, 0, "[Optional] Payment method identifiers as returned from p2p_payment_methods, only applicable for buy ads. Exisiting methods will be replaced."),
+        ("rate", "numeric", 0, "[Optional] Conversion rate from advertiser's account currency to local_currency. An absolute rate value (fixed), or percentage offset from current market rate (floating)."),
+        ("rate_type", "string", 0, "[Optional] Type of rate, fixed or floating."),
+        ("remaining_amount", "numeric", 0, "[Optional] The total available amount of the advert, in advertiser's account currency."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_advertiser_adverts", "Returns all P2P adverts created by the authorized client. Can only be used by a registered P2P advertiser.", "1", (
+        ("limit", "integer", 0, "[Optional] Used for paging. This value will also apply to subsription responses."),
+        ("offset", "integer", 0, "[Optional] Used for paging. This value will also apply to subsription responses."),
+        ("p2p_advertiser_adverts", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_advertiser_create", "Registers the client as a P2P advertiser.", "1", (
+        ("contact_info", "string", 0, "[Optional] Advertiser's contact information, to be used as a default for new sell adverts."),
+        ("default_advert_description", "string", 0, "[Optional] Default description that can be used every time an advert is created."),
+        ("name", "string", 1, "The advertiser's displayed name."),
+        ("p2p_advertiser_create", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_info", "string", 0, "[Optional] Advertiser's payment information, to be used as a default for new sell adverts."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever there is an update to advertiser"),
+    )),
+    ("p2p_advertiser_info", "Retrieve information about a P2P advertiser.", "1", (
+        ("id", "string", 0, "[Optional] The unique identifier for this advertiser. If not provided, returns advertiser information about the current account."),
+        ("p2p_advertiser_info", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever there is an update to advertiser"),
+    )),
+    ("p2p_advertiser_list", "Retrieve advertisers has/had trade with the current advertiser.", "1", (
+        ("advertiser_name", "string", 0, "[Optional] Search for advertiser by name. Partial matches will be returned."),
+        ("is_blocked", "integer", 0, "[Optional] Used to return only blocked or unblocked partners"),
+        ("limit", "integer", 0, "[Optional] Used for paging."),
+        ("offset", "integer", 0, "[Optional] Used for paging."),
+        ("p2p_advertiser_list", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sort_by", "string", 0, "[Optional] How the results are sorted."),
+        ("trade_partners", "integer", 0, "[Optional] Get all advertisers has/had trade."),
+    )),
+    ("p2p_advertiser_payment_methods", "Manage or list P2P advertiser payment methods.", "1", (
+        ("create", None, 0, "Contains new payment method entries."),
+        ("delete", None, 0, "Contains payment methods to delete."),
+        ("p2p_advertiser_payment_methods", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("update", None, 0, "Contains payment methods to update."),
+    )),
+    ("p2p_advertiser_relations", "Updates and returns favourite and blocked advertisers of the current user.", "1", (
+        ("add_blocked", None, 0, "IDs of advertisers to block."),
+        ("add_favourites", None, 0, "IDs of advertisers to add as favourites."),
+        ("p2p_advertiser_relations", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("remove_blocked", None, 0, "IDs of advertisers to remove from blocked."),
+        ("remove_favourites", None, 0, "IDs of advertisers to remove from favourites."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_advertiser_update", "Update the information of the P2P advertiser for the current account. Can only be used by an approved P2P advertiser.", "1", (
+        ("contact_info", "string", 0, "[Optional] Advertiser's contact information, to be used as a default for new sell adverts."),
+        ("default_advert_description", "string", 0, "[Optional] Default description that can be used every time an advert is created."),
+        ("is_listed", "integer", 0, "[Optional] Used to set if the advertiser's adverts could be listed. When 0, adverts won't be listed regardless of they are active or not. This doesn't change the is_active of each individual advert."),
+        ("p2p_advertiser_update", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_info", "string", 0, "[Optional] Advertiser's payment information, to be used as a default for new sell adverts."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("show_name", "integer", 0, "[Optional] When 1, the advertiser's real name will be displayed on to other users on adverts and orders."),
+        ("upgrade_limits", "integer", 0, "[Optional] Used to upgrade daily limits of eligible advertiser."),
+    )),
+    ("p2p_chat_create", "Creates a P2P chat for the specified order.", "1", (
+        ("order_id", "string", 1, "The unique identifier for the order to create the chat for."),
+        ("p2p_chat_create", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_order_cancel", "Cancel a P2P order.", "1", (
+        ("id", "string", 1, "The unique identifier for this order."),
+        ("p2p_order_cancel", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_order_confirm", "Confirm a P2P order.", "1", (
+        ("dry_run", "integer", 0, "[Optional] If set to 1, only validation is performed."),
+        ("id", "string", 1, "The unique identifier for this order."),
+        ("p2p_order_confirm", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("verification_code", "string", 0, "[Optional] Verification code received from email."),
+    )),
+    ("p2p_order_create", "Creates a P2P order for the specified advert.", "1", (
+        ("advert_id", "string", 1, "The unique identifier for the advert to create an order against."),
+        ("amount", "numeric", 1, "The amount of currency to be bought or sold."),
+        ("contact_info", "string", 0, "[Optional] Seller contact information. Only applicable for 'sell orders'."),
+        ("p2p_order_create", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_info", "string", 0, "[Optional] Payment instructions, only applicable for sell orders."),
+        ("payment_method_ids", None, 0, "IDs of payment methods, only applicable for sell orders."),
+        ("rate", "numeric", 0, "[Optional] Conversion rate from account currency to local currency, only applicable for floating rate adverts."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever there is an update to the order."),
+    )),
+    ("p2p_order_dispute", "Dispute a P2P order.", "1", (
+        ("dispute_reason", "string", 1, "The predefined dispute reason"),
+        ("id", "string", 1, "The unique identifier for this order."),
+        ("p2p_order_dispute", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_order_info", "Retrieves the information about a P2P order.", "1", (
+        ("id", "string", 1, "The unique identifier for the order."),
+        ("p2p_order_info", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever there is an update to order"),
+    )),
+    ("p2p_order_list", "List active orders.", "1", (
+        ("active", "numeric", 0, "[Optional] Should be 1 to list active, 0 to list inactive (historical)."),
+        ("advert_id", "string", 0, "[Optional] If present, lists orders applying to a specific advert."),
+        ("date_from", "string", 0, "[Optional] Filter the orders created after this date(included) format(epoch or YYYY-MM-DD)"),
+        ("date_to", "string", 0, "[Optional] Filter the orders created before this date(included) format(epoch or YYYY-MM-DD)"),
+        ("limit", "integer", 0, "[Optional] Used for paging."),
+        ("offset", "integer", 0, "[Optional] Used for paging."),
+        ("p2p_order_list", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever there is a change to any order belonging to you."),
+    )),
+    ("p2p_order_review", "Creates a review for the specified order.", "1", (
+        ("order_id", "string", 1, "The order identification number."),
+        ("p2p_order_review", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("rating", "integer", 1, "Rating for the transaction, 1 to 5."),
+        ("recommended", None, 0, "[Optional] 1 if the counterparty is recommendable to others, otherwise 0."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_payment_methods", "List all P2P payment methods.", "1", (
+        ("p2p_payment_methods", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("p2p_ping", "Keeps the connection alive and updates the P2P advertiser's online status. The advertiser will be considered offline 60 seconds after a call is made.", "1", (
+        ("p2p_ping", "integer", 1, "Must be 1"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("payment_methods", "Will return a list payment methods available for the given country. If the request is authenticated the client's residence country will be used.", "1", (
+        ("country", "string", 0, "[Optional] 2-letter country code (ISO standard)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_methods", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("paymentagent_create", "Saves client's payment agent details.", "1", (
+        ("affiliate_id", "string", 0, "[Optional] Client's My Affiliate id, if exists."),
+        ("code_of_conduct_approval", "integer", 1, "Indicates client's agreement with the Code of Conduct."),
+        ("commission_deposit", "numeric", 1, "Commission  (%) the agent wants to take on deposits"),
+        ("commission_withdrawal", "numeric", 1, "Commission  (%) the agent wants to take on withdrawals"),
+        ("email", "string", 1, "Payment agent's email address."),
+        ("information", "string", 1, "[Optional] Information about payment agent and their proposed service."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payment_agent_name", "string", 1, "The name with which the payment agent is going to be identified."),
+        ("paymentagent_create", "integer", 1, "Must be 1"),
+        ("phone_numbers", None, 0, "Payment agent's phone number(s) with country code."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("supported_payment_methods", None, 1, "A list of supported payment methods."),
+        ("urls", None, 1, "The URL(s) of payment agent's website(s)."),
+    )),
+    ("paymentagent_details", "Gets client's payment agent details.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("paymentagent_details", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("paymentagent_list", "Will return a list of Payment Agents for a given country for a given currency. Payment agents allow users to deposit and withdraw funds using local payment methods that might not be available via the main website's cashier system.", "1", (
+        ("currency", "string", 0, "[Optional] If specified, only payment agents that supports that currency will be returned (obtained from payout_currencies call)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("paymentagent_list", "string", 1, "Client's 2-letter country code (obtained from residence_list call)."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("paymentagent_transfer", "Payment Agent Transfer - this call is available only to accounts that are approved Payment Agents.", "1", (
+        ("amount", "numeric", 1, "The amount to transfer."),
+        ("currency", "string", 1, "Currency code."),
+        ("description", "string", 0, "[Optional] Remarks about the transfer."),
+        ("dry_run", "integer", 0, "[Optional] If set to 1, just do validation."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("paymentagent_transfer", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("transfer_to", "string", 1, "The loginid of the recipient account."),
+    )),
+    ("paymentagent_withdraw", "Initiate a withdrawal to an approved Payment Agent.", "1", (
+        ("amount", "numeric", 1, "The amount to withdraw to the payment agent."),
+        ("currency", "string", 1, "The currency code."),
+        ("description", "string", 0, "[Optional] Remarks about the withdraw. Only letters, numbers, space, period, comma, - ' are allowed."),
+        ("dry_run", "integer", 0, "[Optional] If set to 1, just do validation."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("paymentagent_loginid", "string", 1, "The payment agent loginid received from the paymentagent_list call."),
+        ("paymentagent_withdraw", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("verification_code", "string", 1, "Email verification code (received from a verify_email call, which must be done first)"),
+    )),
+    ("paymentagent_withdraw_justification", "Provide justification to perform withdrawal using a Payment Agent.", "1", (
+        ("message", "string", 0, "Reasons for needing to withdraw using a Payment Agent."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("paymentagent_withdraw_justification", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("payout_currencies", "Retrieve a list of available option payout currencies. If a user is logged in, only the currencies available for the account will be returned.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("payout_currencies", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("ping", "To send the ping request to the server. Mostly used to test the connection or to keep it alive.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("ping", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("portfolio", "Receive information about my current portfolio of outstanding options", "1", (
+        ("contract_type", None, 0, "Return only contracts of the specified types"),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("portfolio", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("profit_table", "Retrieve a summary of account Profit Table, according to given search criteria", "1", (
+        ("contract_type", None, 0, "Return only contracts of the specified types"),
+        ("date_from", "string", 0, "[Optional] Start date (epoch or YYYY-MM-DD)"),
+        ("date_to", "string", 0, "[Optional] End date (epoch or YYYY-MM-DD)"),
+        ("description", "integer", 0, "[Optional] If set to 1, will return full contracts description."),
+        ("limit", "numeric", 0, "[Optional] Apply upper limit to count of transactions received."),
+        ("offset", "integer", 0, "[Optional] Number of transactions to skip."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("profit_table", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sort", "string", 0, "[Optional] Sort direction."),
+    )),
+    ("proposal", "Gets latest price for a specific contract.", "1", (
+        ("amount", "numeric", 0, "[Optional] Proposed contract payout or stake, or multiplier (for lookbacks)."),
+        ("barrier", "string", 0, "[Optional] Barrier for the contract (or last digit prediction for digit contracts). Contracts less than 24 hours in duration would need a relative barrier (barriers which need +/-), where entry spot would be adjusted accordingly with that amount to define a barrier, except for Synthetic Indices as they support both relative and absolute barriers. Not needed for lookbacks."),
+        ("barrier2", "string", 0, "[Optional] Low barrier for the contract (for contracts with two barriers). Contracts less than 24 hours in duration would need a relative barrier (barriers which need +/-), where entry spot would be adjusted accordingly with that amount to define a barrier, except for Synthetic Indices as they support both relative and absolute barriers. Not needed for lookbacks."),
+        ("barrier_range", "string", 0, "[Optional] Barrier range for callputspread."),
+        ("basis", "string", 0, "[Optional] Indicates type of the amount."),
+        ("cancellation", "string", 0, "Cancellation duration option (only for MULTUP and MULTDOWN contracts)."),
+        ("contract_type", "string", 1, "The proposed contract type"),
+        ("currency", "string", 1, "This can only be the account-holder's currency (obtained from payout_currencies call)."),
+        ("date_expiry", "integer", 0, "[Optional] Epoch value of the expiry time of the contract. Either date_expiry or duration is required."),
+        ("date_start", "integer", 0, "[Optional] Indicates epoch value of the starting time of the contract. If left empty, the start time of the contract is now."),
+        ("duration", "integer", 0, "[Optional] Duration quantity. Either date_expiry or duration is required."),
+        ("duration_unit", "string", 0, "[Optional] Duration unit - s: seconds, m: minutes, h: hours, d: days, t: ticks."),
+        ("growth_rate", "numeric", 0, "[Optional] Growth rate of an accumulator contract."),
+        ("limit_order", None, 0, None),
+        ("multiplier", "numeric", 0, "[Optional] The multiplier for non-binary options. E.g. lookbacks."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("product_type", "string", 0, "[Optional] The product type."),
+        ("proposal", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("selected_tick", "integer", 0, "[Optional] The tick that is predicted to have the highest/lowest value - for TICKHIGH and TICKLOW contracts."),
+        ("subscribe", "integer", 0, "[Optional] 1 - to initiate a realtime stream of prices. Note that tick trades (without a user-defined barrier), digit trades and less than 24 hours at-the-money contracts for the following underlying symbols are not streamed: R_10, R_25, R_50, R_75, R_100, RDBULL, RDBEAR (this is because their price is constant)."),
+        ("symbol", "string", 1, "The short symbol name (obtained from active_symbols call)."),
+        ("trading_period_start", "integer", 0, "[Optional] Required only for multi-barrier trading. Defines the epoch value of the trading period start time."),
+    )),
+    ("proposal_open_contract", "Get latest price (and other information) for a contract in the user's portfolio", "1", (
+        ("contract_id", "integer", 0, "[Optional] Contract ID received from a portfolio request. If not set, you will receive stream of all open contracts."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("proposal_open_contract", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] 1 to stream."),
+    )),
+    ("reality_check", "Retrieve summary of client's trades and account for the Reality Check facility. A 'reality check' means a display of time elapsed since the session began, and associated client profit/loss. The Reality Check facility is a regulatory requirement for certain landing companies.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("reality_check", "integer", 1, "Must be 1"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+    )),
+    ("residence_list", "This call returns a list of countries and 2-letter country codes, suitable for populating the account opening form.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("residence_list", "integer", 1, "Must be 1"),
+    )),
+    ("revoke_oauth_app", "Used for revoking access of particular app.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("revoke_oauth_app", "integer", 1, "The application ID to revoke."),
+    )),
+    ("sell", "Sell a Contract as identified from a previous `portfolio` call.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("price", "numeric", 1, "Minimum price at which to sell the contract, or 0 for 'sell at market'."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sell", "integer", 1, "Pass contract_id received from the portfolio call."),
+    )),
+    ("sell_contract_for_multiple_accounts", "Sell contracts for multiple accounts simultaneously. Uses the shortcode response from `buy_contract_for_multiple_accounts` to identify the contract, and authorisation tokens to select which accounts to sell those contracts on. Note that only the accounts identified by the tokens will be affected. This will not sell the contract on the currently-authorised account unless you include the token for the current account.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("price", "numeric", 1, "Minimum price at which to sell the contract, or 0 for 'sell at market'."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sell_contract_for_multiple_accounts", "integer", 1, "Must be 1"),
+        ("shortcode", "string", 1, "An internal ID used to identify the contract which was originally bought. This is returned from the buy and buy_contract_for_multiple_accounts calls."),
+        ("tokens", None, 1, "Authorisation tokens which select the accounts to sell use for the affected accounts."),
+    )),
+    ("sell_expired", "This call will try to sell any expired contracts and return the number of sold contracts.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("sell_expired", "integer", 1, "Must be 1"),
+    )),
+    ("set_account_currency", "Set account currency, this will be default currency for your account i.e currency for trading, deposit. Please note that account currency can only be set once, and then can never be changed.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("set_account_currency", "string", 1, "Currency of the account. List of supported currencies can be acquired with payout_currencies call."),
+    )),
+    ("set_financial_assessment", "This call sets the financial assessment details based on the client's answers to analyze whether they possess the experience and knowledge to understand the risks involved with binary options trading.", "1", (
+        ("account_turnover", "string", 0, "[Optional] The anticipated account turnover."),
+        ("binary_options_trading_experience", "string", 0, "[Optional] Binary options trading experience."),
+        ("binary_options_trading_frequency", "string", 0, "[Optional] Binary options trading frequency."),
+        ("cfd_trading_experience", "string", 0, "[Optional] CFDs trading experience."),
+        ("cfd_trading_frequency", "string", 0, "[Optional] CFDs trading frequency."),
+        ("education_level", "string", 0, "[Optional] Level of Education."),
+        ("employment_industry", "string", 0, "[Optional] Industry of Employment."),
+        ("employment_status", "string", 0, "[Optional] Employment Status."),
+        ("estimated_worth", "string", 0, "[Optional] Estimated Net Worth."),
+        ("financial_information", None, 0, None),
+        ("forex_trading_experience", "string", 0, "[Optional] Forex trading experience."),
+        ("forex_trading_frequency", "string", 0, "[Optional] Forex trading frequency."),
+        ("income_source", "string", 0, "[Optional] Income Source."),
+        ("net_income", "string", 0, "[Optional] Net Annual Income."),
+        ("occupation", "string", 0, "[Optional] Occupation."),
+        ("other_instruments_trading_experience", "string", 0, "[Optional] Trading experience in other financial instruments."),
+        ("other_instruments_trading_frequency", "string", 0, "[Optional] Trading frequency in other financial instruments."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("set_financial_assessment", "integer", 1, "Must be 1"),
+        ("source_of_wealth", "string", 0, "[Optional] Source of wealth."),
+        ("trading_experience", None, 0, None),
+        ("trading_experience_regulated", None, 0, None),
+    )),
+    ("set_self_exclusion", "Set Self-Exclusion (this call should be used in conjunction with `get_self_exclusion`)", "1", (
+        ("exclude_until", None, 0, "[Optional] Exclude me from the website (for a minimum of 6 months, up to a maximum of 5 years). Note: uplifting this self-exclusion may require contacting the company."),
+        ("max_30day_deposit", None, 0, "[Optional] 7-day limit on deposits."),
+        ("max_30day_losses", None, 0, "[Optional] 30-day limit on losses."),
+        ("max_30day_turnover", None, 0, "[Optional] 30-day turnover limit."),
+        ("max_7day_deposit", None, 0, "[Optional] 7-day limit on deposits."),
+        ("max_7day_losses", None, 0, "[Optional] 7-day limit on losses."),
+        ("max_7day_turnover", None, 0, "[Optional] 7-day turnover limit."),
+        ("max_balance", None, 0, "[Optional] Maximum account cash balance."),
+        ("max_deposit", None, 0, "[Optional] Daily deposit limit."),
+        ("max_losses", None, 0, "[Optional] Daily limit on losses."),
+        ("max_open_bets", None, 0, "[Optional] Maximum number of open positions."),
+        ("max_turnover", None, 0, "[Optional] Daily turnover limit."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("session_duration_limit", None, 0, "[Optional] Session duration limit, in minutes."),
+        ("set_self_exclusion", "integer", 1, "Must be 1"),
+        ("timeout_until", None, 0, "[Optional] Exclude me from the website (for up to 6 weeks). Requires time in epoch format. Note: unlike exclude_until, this self-exclusion will be lifted automatically at the expiry of the timeout period."),
+    )),
+    ("set_settings", "Set User Settings (this call should be used in conjunction with `get_settings`)", "1", (
+        ("account_opening_reason", "string", 0, "[Optional] Purpose and reason for requesting the account opening. Only applicable for real money account. Required for clients that have not set it yet. Can only be set once."),
+        ("address_city", "string", 0, "[Optional] Note: not applicable for virtual account. Required field for real money account."),
+        ("address_line_1", "string", 0, "[Optional] Note: not applicable for virtual account. Required field for real money account."),
+        ("address_line_2", None, 0, "[Optional] Note: not applicable for virtual account. Optional field for real money account."),
+        ("address_postcode", "string", 0, "[Optional] Note: not applicable for virtual account. Optional field for real money account."),
+        ("address_state", "string", 0, "[Optional] Note: not applicable for virtual account. Optional field for real money account."),
+        ("allow_copiers", "integer", 0, "[Optional] Boolean value 1 or 0, indicating permission to allow others to follow your trades. Note: not applicable for Virtual account. Only allow for real money account."),
+        ("citizen", None, 0, "[Optional] Country of legal citizenship, 2-letter country code."),
+        ("date_of_birth", "string", 0, "[Optional] Date of birth format: yyyy-mm-dd (can only be changed on unauthenticated svg accounts)."),
+        ("dxtrade_user_exception", "integer", 0, "Boolean value 1 or 0, indicating if user email belong to dxtrade exception list."),
+        ("email_consent", "integer", 0, "[Optional] Boolean value 1 or 0, indicating permission to use email address for any contact which may include marketing"),
+        ("employment_status", "string", 0, "[Optional] Employment Status."),
+        ("feature_flag", None, 0, None),
+        ("first_name", "string", 0, "[Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes (can only be changed on unauthenticated svg accounts)."),
+        ("last_name", "string", 0, "[Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes (can only be changed on unauthenticated svg accounts)."),
+        ("non_pep_declaration", "integer", 0, "[Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates). Effective for real accounts only."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("phone", None, 0, "[Optional] Note: not applicable for virtual account. Starting with + followed by 9-35 digits, hyphens or space."),
+        ("place_of_birth", "string", 0, "[Optional] Place of birth, 2-letter country code."),
+        ("preferred_language", None, 0, "[Optional] User's preferred language, ISO standard language code"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("request_professional_status", "integer", 0, "[Optional] Required when client wants to be treated as professional. Applicable for financial accounts only."),
+        ("residence", None, 0, "[Optional] 2-letter country code. Note: not applicable for real money account. Only allow for Virtual account without residence set."),
+        ("salutation", "string", 0, "[Optional] Accept any value in enum list (can only be changed on unauthenticated svg accounts)."),
+        ("secret_answer", "string", 0, "[Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client opens another account."),
+        ("secret_question", "string", 0, "[Optional] Accept any value in enum list. Required for new account and existing client details will be used if client opens another account."),
+        ("set_settings", "integer", 1, "Must be 1"),
+        ("tax_identification_number", "string", 0, "[Optional] Tax identification number. Only applicable for real money account. Required for maltainvest landing company."),
+        ("tax_residence", "string", 0, "[Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company."),
+        ("trading_hub", "integer", 0, "[Optional] Enable/Disable Trading Hub dashboard"),
+    )),
+    ("statement", "Retrieve a summary of account transactions, according to given search criteria", "1", (
+        ("action_type", "string", 0, "[Optional] To filter the statement according to the type of transaction."),
+        ("date_from", "integer", 0, "[Optional] Start date (epoch)"),
+        ("date_to", "integer", 0, "[Optional] End date (epoch)"),
+        ("description", "integer", 0, "[Optional] If set to 1, will return full contracts description."),
+        ("limit", "numeric", 0, "[Optional] Maximum number of transactions to receive."),
+        ("offset", "integer", 0, "[Optional] Number of transactions to skip."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("statement", "integer", 1, "Must be 1"),
+    )),
+    ("states_list", "For a given country, returns a list of States of that country. This is useful to populate the account opening form.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("states_list", "string", 1, "Client's 2-letter country code (obtained from residence_list call)"),
+    )),
+    ("ticks", "Initiate a continuous stream of spot price updates for a given symbol.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] If set to 1, will send updates whenever a new tick is received."),
+        ("ticks", None, 1, "The short symbol name or array of symbols (obtained from active_symbols call)."),
+    )),
+    ("ticks_history", "Get historic tick data for a given symbol.", "1", (
+        ("adjust_start_time", "integer", 0, "[Optional] 1 - if the market is closed at the end time, or license limit is before end time, adjust interval backwards to compensate."),
+        ("count", "integer", 0, "[Optional] An upper limit on ticks to receive."),
+        ("end", "string", 1, "Epoch value representing the latest boundary of the returned ticks. If latest is specified, this will be the latest available timestamp."),
+        ("granularity", "integer", 0, "[Optional] Only applicable for style: candles. Candle time-dimension width setting. (default: 60)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("start", "integer", 0, "[Optional] Epoch value representing the earliest boundary of the returned ticks. \n- For \"style\": \"ticks\": this will default to 1 day ago.\n- For \"style\": \"candles\": it will default to 1 day ago if count or granularity is undefined."),
+        ("style", "string", 0, "[Optional] The tick-output style."),
+        ("subscribe", "integer", 0, "[Optional] 1 - to send updates whenever a new tick is received."),
+        ("ticks_history", "string", 1, "Short symbol name (obtained from the active_symbols call)."),
+    )),
+    ("time", "Request back-end server epoch time.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("time", "integer", 1, "Must be 1"),
+    )),
+    ("tnc_approval", "To approve the latest version of terms and conditions.", "1", (
+        ("affiliate_coc_agreement", "integer", 0, "[Optional] For Affiliate's Code of Conduct Agreement."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("tnc_approval", "numeric", 1, "Must be 1"),
+        ("ukgc_funds_protection", "integer", 0, "[Optional] For ASK_UK_FUNDS_PROTECTION in cashier."),
+    )),
+    ("topup_virtual", "When a virtual-money's account balance becomes low, it can be topped up using this call.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("topup_virtual", "integer", 1, "Must be 1"),
+    )),
+    ("trading_durations", "Retrieve a list of all available underlyings and the corresponding contract types and trading duration boundaries. If the user is logged in, only the assets available for that user's landing company will be returned.", "1", (
+        ("landing_company", "string", 0, "Deprecated - Replaced by landing_company_short."),
+        ("landing_company_short", "string", 0, "[Optional] If specified, will return only the underlyings for the specified landing company."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trading_durations", "integer", 1, "Must be 1"),
+    )),
+    ("trading_platform_investor_password_reset", "Reset the investor password of a Trading Platform Account", "1", (
+        ("account_id", "string", 1, "Trading account ID."),
+        ("new_password", "string", 1, "New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("platform", "string", 1, "Name of trading platform."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trading_platform_investor_password_reset", "integer", 1, "Must be 1"),
+        ("verification_code", "string", 1, "Email verification code (received from a verify_email call, which must be done first)"),
+    )),
+    ("trading_platform_password_reset", "Reset the password of a Trading Platform Account", "1", (
+        ("new_password", "string", 1, "New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address)."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("platform", "string", 1, "Name of trading platform."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trading_platform_password_reset", "integer", 1, "Must be 1"),
+        ("verification_code", "string", 1, "Email verification code (received from a verify_email call, which must be done first)"),
+    )),
+    ("trading_servers", "Get the list of servers for a trading platform.", "1", (
+        ("account_type", "string", 0, "[Optional] Trading account type."),
+        ("environment", "string", 0, "[Optional] Pass the environment (installation) instance. Currently, there are one demo and two real environments. Defaults to 'all'."),
+        ("market_type", "string", 0, "[Optional] Market type."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("platform", "string", 0, "[Optional] Pass the trading platform name, default to mt5"),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trading_servers", "integer", 1, "Must be 1"),
+    )),
+    ("trading_times", "Receive a list of market opening times for a given date.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("trading_times", "string", 1, "Date to receive market opening times for. (yyyy-mm-dd format. today can also be specified)."),
+    )),
+    ("transaction", "Subscribe to transaction notifications", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 1, "If set to 1, will send updates whenever there is an update to transactions. If not to 1 then it will not return any records."),
+        ("transaction", "integer", 1, "Must be 1"),
+    )),
+    ("transfer_between_accounts", "This call allows transfers between accounts held by a given user. Transfer funds between your fiat and cryptocurrency accounts (for a fee). Please note that account_from should be same as current authorized account.", "1", (
+        ("account_from", "string", 0, "[Optional] The loginid of the account to transfer funds from."),
+        ("account_to", "string", 0, "[Optional] The loginid of the account to transfer funds to."),
+        ("accounts", "string", 0, "[Optional] To control the list of accounts returned when account_from or account_to is not provided. brief (default value) means that accounts with mt5 account_type will be excluded; it will run faster. all means that all accounts with any account_type (including mt5) will be returned."),
+        ("amount", "numeric", 0, "[Optional] The amount to transfer."),
+        ("currency", "string", 0, "[Optional] Currency code."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("transfer_between_accounts", "integer", 1, "If account_from or account_to is not provided, it just returns the available accounts."),
+    )),
+    ("unsubscribe_email", "It unsubscribe user from the email subscription.", "1", (
+        ("binary_user_id", "numeric", 1, "Customer User ID."),
+        ("checksum", "string", 1, "The generated checksum for the customer."),
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("unsubscribe_email", "integer", 1, "Must be 1"),
+    )),
+    ("verify_email", "Verify an email address for various purposes. The system will send an email to the address containing a security code for verification.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("type", "string", 1, "Purpose of email verification, request_email and reset_password are the only two types restricted from all unoffical apps"),
+        ("url_parameters", None, 0, None),
+        ("verify_email", "string", 1, "Email address to be verified."),
+    )),
+    ("verify_email_cellxpert", "Verify an email address for Cellxpert. The system will send an email to the address containing a security code for verification.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("type", "string", 1, "Purpose of the email verification call."),
+        ("url_parameters", None, 0, None),
+        ("verify_email_cellxpert", "string", 1, "Email address to be verified."),
+    )),
+    ("website_status", "Request server status.", "1", (
+        ("passthrough", None, 0, "[Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes."),
+        ("req_id", "integer", 0, "[Optional] Used to map request to response."),
+        ("subscribe", "integer", 0, "[Optional] 1 to stream the server/website status updates."),
+        ("website_status", "integer", 1, "Must be 1"),
+    )),
+)
+
+# The methods that act on an account, auth_required in their schema. Their requests take the loginid of the account
+# when several accounts are authorized on the connection
+_account_methods = frozenset([
+    "api_token",
+    "app_delete",
+    "app_get",
+    "app_list",
+    "app_markup_details",
+    "app_markup_statistics",
+    "app_register",
+    "app_update",
+    "balance",
+    "buy",
+    "buy_contract_for_multiple_accounts",
+    "cancel",
+    "cashier",
+    "contract_update",
+    "contract_update_history",
+    "copy_start",
+    "copy_stop",
+    "copytrading_list",
+    "document_upload",
+    "get_account_status",
+    "get_financial_assessment",
+    "get_limits",
+    "get_self_exclusion",
+    "get_settings",
+    "identity_verification_document_add",
+    "kyc_auth_status",
+    "login_history",
+    "logout",
+    "mt5_deposit",
+    "mt5_get_settings",
+    "mt5_login_list",
+    "mt5_new_account",
+    "mt5_password_change",
+    "mt5_password_check",
+    "mt5_password_reset",
+    "mt5_withdrawal",
+    "new_account_maltainvest",
+    "new_account_real",
+    "oauth_apps",
+    "p2p_advert_create",
+    "p2p_advert_info",
+    "p2p_advert_list",
+    "p2p_advert_update",
+    "p2p_advertiser_adverts",
+    "p2p_advertiser_create",
+    "p2p_advertiser_info",
+    "p2p_advertiser_list",
+    "p2p_advertiser_payment_methods",
+    "p2p_advertiser_relations",
+    "p2p_advertiser_update",
+    "p2p_chat_create",
+    "p2p_order_cancel",
+    "p2p_order_confirm",
+    "p2p_order_create",
+    "p2p_order_dispute",
+    "p2p_order_info",
+    "p2p_order_list",
+    "p2p_order_review",
+    "p2p_payment_methods",
+    "p2p_ping",
+    "paymentagent_create",
+    "paymentagent_details",
+    "paymentagent_transfer",
+    "paymentagent_withdraw",
+    "paymentagent_withdraw_justification",
+    "portfolio",
+    "profit_table",
+    "proposal_open_contract",
+    "reality_check",
+    "revoke_oauth_app",
+    "sell",
+    "sell_contract_for_multiple_accounts",
+    "sell_expired",
+    "set_account_currency",
+    "set_financial_assessment",
+    "set_self_exclusion",
+    "set_settings",
+    "statement",
+    "tnc_approval",
+    "topup_virtual",
+    "trading_platform_investor_password_reset",
+    "trading_platform_password_reset",
+    "trading_servers",
+    "transaction",
+    "transfer_between_accounts",
+])
+
+_api_method_rows = {row[0]: row for row in _api_methods}
+_py_types = {'integer': 'int', 'numeric': 'Number', 'string': 'str', 'boolean': 'bool'}
+# the config and the argument checker of every method that was used
+_api_method_checks = {}
+
+
+class APIMethodsType(ABCMeta):
+    """
+    Metaclass that builds the API methods of a class when they are first looked up
+    """
 
-class DerivAPICalls:
-
-    async def active_symbols(self, args=None):
-        """
-        Retrieve a list of all currently active symbols (underlying markets upon which contracts are available for trading).
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                active_symbols : str
-                    If you use brief, only a subset of fields will be returned.
-                landing_company : str
-                    Deprecated - replaced by landing_company_short.
-                landing_company_short : str
-                    [Optional] If you specify this field, only symbols available for trading by that landing company will be returned. If you are logged in, only symbols available for trading by your landing company will be returned regardless of what you specify in this field.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                product_type : str
-                    [Optional] If you specify this field, only symbols that can be traded through that product type will be returned.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'active_symbols': {
-                'required': 1,
-                'type': 'string'
-            },
-            'landing_company': {
-                'type': 'string'
-            },
-            'landing_company_short': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'product_type': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'active_symbols',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def api_token(self, args=None):
-        """
-        This call manages API tokens
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                api_token : int
-                    Must be 1
-                delete_token : str
-                    [Optional] The token to remove.
-                new_token : str
-                    [Optional] The name of the created token.
-                new_token_scopes : Any
-                    [Optional] List of permission scopes to provide with the token.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                valid_for_current_ip_only : int
-                    [Optional] If you set this parameter during token creation, then the token created will only work for the IP address that was used to create the token
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'api_token': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'delete_token': {
-                'type': 'string'
-            },
-            'new_token': {
-                'type': 'string'
-            },
-            'new_token_scopes': {},
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'valid_for_current_ip_only': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'api_token',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_delete(self, args=None):
-        """
-        The request for deleting an application.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_delete : int
-                    Application app_id
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_delete': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'app_delete',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_get(self, args=None):
-        """
-        To get the information of the OAuth application specified by 'app_id'
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_get : int
-                    Application app_id
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_get': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'app_get',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_list(self, args=None):
-        """
-        List all of the account's OAuth applications
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_list : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_list': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'app_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_markup_details(self, args=None):
-        """
-        Retrieve details of `app_markup` according to criteria specified.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_id : int
-                    [Optional] Specific application app_id to report on.
-                app_markup_details : int
-                    Must be 1
-                client_loginid : str
-                    [Optional] Specific client loginid to report on, like CR12345
-                date_from : str
-                    Start date (epoch or YYYY-MM-DD HH:MM:SS). Results are inclusive of this time.
-                date_to : str
-                    End date (epoch or YYYY-MM-DD HH::MM::SS). Results are inclusive of this time.
-                description : int
-                    [Optional] If set to 1, will return app_markup transaction details.
-                limit : Number
-                    [Optional] Apply upper limit to count of transactions received.
-                offset : int
-                    [Optional] Number of transactions to skip.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                sort : str
-                    [Optional] Sort direction on transaction_time. Other fields sort order is ASC.
-                sort_fields : Any
-                    [Optional] One or more of the specified fields to sort on. Default sort field is by transaction_time.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_id': {
-                'type': 'integer'
-            },
-            'app_markup_details': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'client_loginid': {
-                'type': 'string'
-            },
-            'date_from': {
-                'required': 1,
-                'type': 'string'
-            },
-            'date_to': {
-                'required': 1,
-                'type': 'string'
-            },
-            'description': {
-                'type': 'integer'
-            },
-            'limit': {
-                'type': 'numeric'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'sort': {
-                'type': 'string'
-            },
-            'sort_fields': {}
-        }
-
-        all_args = {
-            'method': 'app_markup_details',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_markup_statistics(self, args=None):
-        """
-        Retrieve statistics of `app_markup`.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_markup_statistics : int
-                    Must be 1
-                date_from : str
-                    Start date (epoch or YYYY-MM-DD HH:MM:SS). Results are inclusive of this time.
-                date_to : str
-                    End date (epoch or YYYY-MM-DD HH::MM::SS). Results are inclusive of this time.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_markup_statistics': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'date_from': {
-                'required': 1,
-                'type': 'string'
-            },
-            'date_to': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'app_markup_statistics',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_register(self, args=None):
-        """
-        Register a new OAuth application
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_markup_percentage : Number
-                    [Optional] Markup to be added to contract prices (as a percentage of contract payout). Max markup: 3%.
-                app_register : int
-                    Must be 1
-                appstore : str
-                    [Optional] Application's App Store URL (if applicable).
-                github : str
-                    [Optional] Application's GitHub page (for open-source projects).
-                googleplay : str
-                    [Optional] Application's Google Play URL (if applicable).
-                homepage : str
-                    [Optional] Application's homepage URL.
-                name : str
-                    Application name.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                redirect_uri : str
-                    [Optional] The URL to redirect to after a successful login. Required if charging markup percentage
-                req_id : int
-                    [Optional] Used to map request to response.
-                scopes : Any
-                    List of permission scopes to grant the application.
-                verification_uri : str
-                    [Optional] Used when verify_email called. If available, a URL containing the verification token will be sent to the client's email, otherwise only the token will be sent.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_markup_percentage': {
-                'type': 'numeric'
-            },
-            'app_register': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'appstore': {
-                'type': 'string'
-            },
-            'github': {
-                'type': 'string'
-            },
-            'googleplay': {
-                'type': 'string'
-            },
-            'homepage': {
-                'type': 'string'
-            },
-            'name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'redirect_uri': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'scopes': {
-                'required': 1
-            },
-            'verification_uri': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'app_register',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def app_update(self, args=None):
-        """
-        Update a new OAuth application
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                app_markup_percentage : Number
-                    [Optional] Markup to be added to contract prices (as a percentage of contract payout). Max markup: 3%.
-                app_update : int
-                    Application app_id.
-                appstore : str
-                    [Optional] Application's App Store URL (if applicable).
-                github : str
-                    [Optional] Application's GitHub page (for open-source projects).
-                googleplay : str
-                    [Optional] Application's Google Play URL (if applicable).
-                homepage : str
-                    [Optional] Application's homepage URL.
-                name : str
-                    Application name.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                redirect_uri : str
-                    [Optional] The URL to redirect to after a successful login. Required if charging markup percentage.
-                req_id : int
-                    [Optional] Used to map request to response.
-                scopes : Any
-                    Change scopes will revoke all user's grants and log them out.
-                verification_uri : str
-                    [Optional] Used when verify_email called. If available, a URL containing the verification token will send to the client's email, otherwise only the token will be sent.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'app_markup_percentage': {
-                'type': 'numeric'
-            },
-            'app_update': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'appstore': {
-                'type': 'string'
-            },
-            'github': {
-                'type': 'string'
-            },
-            'googleplay': {
-                'type': 'string'
-            },
-            'homepage': {
-                'type': 'string'
-            },
-            'name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'redirect_uri': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'scopes': {
-                'required': 1
-            },
-            'verification_uri': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'app_update',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def asset_index(self, args=None):
-        """
-        Retrieve a list of all available underlyings and the corresponding contract types and duration boundaries. If the user is logged in, only the assets available for that user's landing company will be returned.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                asset_index : int
-                    Must be 1
-                landing_company : str
-                    Deprecated - replaced by landing_company_short.
-                landing_company_short : str
-                    [Optional] If specified, will return only the underlyings for the specified landing company.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'asset_index': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'landing_company': {
-                'type': 'string'
-            },
-            'landing_company_short': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'asset_index',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def authorize(self, args=None):
-        """
-        Authorize current WebSocket session to act on behalf of the owner of a given token. Must precede requests that need to access client account, for example purchasing and selling contracts or viewing portfolio.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                add_to_login_history : int
-                    [Optional] Send this when you use api tokens for authorization and want to track activity using login_history call.
-                authorize : str
-                    Authentication token. May be retrieved from https://www.binary.com/en/user/security/api_tokenws.html
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'add_to_login_history': {
-                'type': 'integer'
-            },
-            'authorize': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'authorize',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def balance(self, args=None):
-        """
-        Get user account balance
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account : str
-                    [Optional] If set to all, return the balances of all accounts one by one; if set to current, return the balance of current account; if set as an account id, return the balance of that account.
-                balance : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever the balance changes.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account': {
-                'type': 'string'
-            },
-            'balance': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'balance',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def buy(self, args=None):
-        """
-        Buy a Contract
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                buy : str
-                    Either the ID received from a Price Proposal (proposal call), or 1 if contract buy parameters are passed in the parameters field.
-                parameters : Any
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                price : Number
-                    Maximum price at which to purchase the contract.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] 1 to stream.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'buy': {
-                'required': 1,
-                'type': 'string'
-            },
-            'parameters': {
-                'amount': {
-                    'type': 'numeric'
-                },
-                'app_markup_percentage': {
-                    'type': 'numeric'
-                },
-                'barrier': {
-                    'type': 'string'
-                },
-                'barrier2': {
-                    'type': 'string'
-                },
-                'barrier_range': {
-                    'type': 'string'
-                },
-                'basis': {
-                    'type': 'string'
-                },
-                'cancellation': {
-                    'type': 'string'
-                },
-                'contract_type': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'currency': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'date_expiry': {
-                    'type': 'integer'
-                },
-                'date_start': {
-                    'type': 'integer'
-                },
-                'duration': {
-                    'type': 'integer'
-                },
-                'duration_unit': {
-                    'type': 'string'
-                },
-                'growth_rate': {
-                    'type': 'numeric'
-                },
-                'limit_order': {
-                    'stop_loss': {
-                        'type': 'numeric'
-                    },
-                    'take_profit': {
-                        'type': 'numeric'
-                    }
-                },
-                'multiplier': {
-                    'type': 'numeric'
-                },
-                'product_type': {
-                    'type': 'string'
-                },
-                'selected_tick': {
-                    'type': 'integer'
-                },
-                'symbol': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'trading_period_start': {
-                    'type': 'integer'
-                }
-            },
-            'passthrough': {},
-            'price': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'buy',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def buy_contract_for_multiple_accounts(self, args=None):
-        """
-        Buy a Contract for multiple Accounts specified by the `tokens` parameter. Note, although this is an authorized call, the contract is not bought for the authorized account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                buy_contract_for_multiple_accounts : str
-                    Either the ID received from a Price Proposal (proposal call), or 1 if contract buy parameters are passed in the parameters field.
-                parameters : Any
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                price : Number
-                    Maximum price at which to purchase the contract.
-                req_id : int
-                    [Optional] Used to map request to response.
-                tokens : Any
-                    List of API tokens identifying the accounts for which the contract is bought. Note: If the same token appears multiple times or if multiple tokens designate the same account, the contract is bought multiple times for this account.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'buy_contract_for_multiple_accounts': {
-                'required': 1,
-                'type': 'string'
-            },
-            'parameters': {
-                'amount': {
-                    'type': 'numeric'
-                },
-                'app_markup_percentage': {
-                    'type': 'numeric'
-                },
-                'barrier': {
-                    'type': 'string'
-                },
-                'barrier2': {
-                    'type': 'string'
-                },
-                'basis': {
-                    'type': 'string'
-                },
-                'contract_type': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'currency': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'date_expiry': {
-                    'type': 'integer'
-                },
-                'date_start': {
-                    'type': 'integer'
-                },
-                'duration': {
-                    'type': 'integer'
-                },
-                'duration_unit': {
-                    'type': 'string'
-                },
-                'multiplier': {
-                    'type': 'numeric'
-                },
-                'selected_tick': {
-                    'type': 'integer'
-                },
-                'symbol': {
-                    'required': 1,
-                    'type': 'string'
-                }
-            },
-            'passthrough': {},
-            'price': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'tokens': {
-                'required': 1
-            }
-        }
-
-        all_args = {
-            'method': 'buy_contract_for_multiple_accounts',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def cancel(self, args=None):
-        """
-        Cancel contract with contract id
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                cancel : int
-                    Value should be the contract_id which received from the portfolio call.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'cancel': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'cancel',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def cashier(self, args=None):
-        """
-        Request the cashier info for the specified type.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                address : str
-                    [Optional] Address for crypto withdrawal. Only applicable for api type.
-                amount : Number
-                    [Optional] Amount for crypto withdrawal. Only applicable for api type.
-                cashier : str
-                    Operation which needs to be requested from cashier
-                dry_run : int
-                    [Optional] If set to 1, only validation is performed. Only applicable for withdraw using crypto provider and api type.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                provider : str
-                    [Optional] Cashier provider. crypto will be default option for crypto currency accounts.
-                req_id : int
-                    [Optional] Used to map request to response.
-                type : str
-                    [Optional] Data need to be returned from cashier. api is supported only for crypto provider.
-                verification_code : str
-                    [Optional] Email verification code (received from a verify_email call, which must be done first)
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'address': {
-                'type': 'string'
-            },
-            'amount': {
-                'type': 'numeric'
-            },
-            'cashier': {
-                'required': 1,
-                'type': 'string'
-            },
-            'dry_run': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'provider': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'type': {
-                'type': 'string'
-            },
-            'verification_code': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'cashier',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def contract_update(self, args=None):
-        """
-        Update a contract condition.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contract_id : int
-                    Internal unique contract identifier.
-                contract_update : int
-                    Must be 1
-                limit_order : Any
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contract_id': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'contract_update': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'limit_order': {
-                'stop_loss': {},
-                'take_profit': {}
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'contract_update',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def contract_update_history(self, args=None):
-        """
-        Request for contract update history.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contract_id : int
-                    Internal unique contract identifier.
-                contract_update_history : int
-                    Must be 1
-                limit : Number
-                    [Optional] Maximum number of historical updates to receive.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contract_id': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'contract_update_history': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'limit': {
-                'type': 'numeric'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'contract_update_history',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def contracts_for(self, args=None):
-        """
-        For a given symbol, get the list of currently available contracts, and the latest barrier and duration limits for each contract.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contracts_for : str
-                    The short symbol name (obtained from active_symbols call).
-                currency : str
-                    [Optional] Currency of the contract's stake and payout (obtained from payout_currencies call).
-                landing_company : str
-                    Deprecated - Replaced by landing_company_short.
-                landing_company_short : str
-                    [Optional] Indicates which landing company to get a list of contracts for. If you are logged in, your account's landing company will override this field. Note that when landing_company_short is set to 'virtual', landing_company will take precendce until the deprecated field is removed from the api.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                product_type : str
-                    [Optional] If you specify this field, only contracts tradable through that contract type will be returned.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contracts_for': {
-                'required': 1,
-                'type': 'string'
-            },
-            'currency': {
-                'type': 'string'
-            },
-            'landing_company': {
-                'type': 'string'
-            },
-            'landing_company_short': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'product_type': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'contracts_for',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def copy_start(self, args=None):
-        """
-        Start copy trader bets
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                assets : Any
-                    [Optional] Used to set assets to be copied. E.x ["frxUSDJPY", "R_50"]
-                copy_start : str
-                    API tokens identifying the accounts of trader which will be used to copy trades
-                max_trade_stake : Number
-                    [Optional] Used to set maximum trade stake to be copied.
-                min_trade_stake : Number
-                    [Optional] Used to set minimal trade stake to be copied.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                trade_types : Any
-                    [Optional] Used to set trade types to be copied. E.x ["CALL", "PUT"]
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'assets': {},
-            'copy_start': {
-                'required': 1,
-                'type': 'string'
-            },
-            'max_trade_stake': {
-                'type': 'numeric'
-            },
-            'min_trade_stake': {
-                'type': 'numeric'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'trade_types': {}
-        }
-
-        all_args = {
-            'method': 'copy_start',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def copy_stop(self, args=None):
-        """
-        Stop copy trader bets
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                copy_stop : str
-                    API tokens identifying the accounts which needs not to be copied
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'copy_stop': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'copy_stop',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def copytrading_list(self, args=None):
-        """
-        Retrieves a list of active copiers and/or traders for Copy Trading
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                copytrading_list : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'copytrading_list': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'copytrading_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def copytrading_statistics(self, args=None):
-        """
-        Retrieve performance, trading, risk and copiers statistics of trader.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                copytrading_statistics : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                trader_id : str
-                    The ID of the target trader.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'copytrading_statistics': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'trader_id': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'copytrading_statistics',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def crypto_config(self, args=None):
-        """
-        The request for cryptocurrencies configuration.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                crypto_config : int
-                    Must be 1
-                currency_code : str
-                    [Optional] Cryptocurrency code. Sending request with currency_code provides crypto config for the sent cryptocurrency code only.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'crypto_config': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'currency_code': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'crypto_config',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def document_upload(self, args=None):
-        """
-        Request KYC information from client
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                document_format : str
-                    Document file format
-                document_id : str
-                    [Optional] Document ID (required for Passport, Proof of ID and Driver's License)
-                document_issuing_country : str
-                    2-letter country code, mandatory for POI only
-                document_type : str
-                    Document type
-                document_upload : int
-                    Must be 1
-                expected_checksum : str
-                    The checksum of the file to be uploaded
-                expiration_date : str
-                    [Optional] Document expiration date (required for Passport, Proof of ID and Driver's License)
-                file_size : int
-                    Document size (should be less than 10MB)
-                lifetime_valid : int
-                    [Optional] Boolean value that indicates whether this document is lifetime valid (only applies to POI document types, cancels out the expiration_date given if any)
-                page_type : str
-                    [Optional] To determine document side
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                proof_of_ownership : Any
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'document_format': {
-                'required': 1,
-                'type': 'string'
-            },
-            'document_id': {
-                'type': 'string'
-            },
-            'document_issuing_country': {
-                'type': 'string'
-            },
-            'document_type': {
-                'required': 1,
-                'type': 'string'
-            },
-            'document_upload': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'expected_checksum': {
-                'required': 1,
-                'type': 'string'
-            },
-            'expiration_date': {
-                'type': 'string'
-            },
-            'file_size': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'lifetime_valid': {
-                'type': 'integer'
-            },
-            'page_type': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'proof_of_ownership': {
-                'details': {
-                    'required': 1
-                },
-                'id': {
-                    'required': 1,
-                    'type': 'numeric'
-                }
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'document_upload',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def economic_calendar(self, args=None):
-        """
-        Specify a currency to receive a list of events related to that specific currency. For example, specifying USD will return a list of USD-related events. If the currency is omitted, you will receive a list for all currencies.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                currency : str
-                    [Optional] Currency symbol.
-                economic_calendar : int
-                    Must be 1
-                end_date : int
-                    [Optional] End date.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                start_date : int
-                    [Optional] Start date.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'currency': {
-                'type': 'string'
-            },
-            'economic_calendar': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'end_date': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'start_date': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'economic_calendar',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def exchange_rates(self, args=None):
-        """
-        Retrieves the exchange rates from a base currency to all currencies supported by the system.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                base_currency : str
-                    Base currency (can be obtained from payout_currencies call)
-                exchange_rates : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] 1 - to initiate a realtime stream of exchange rates relative to base currency.
-                target_currency : str
-                    [Optional] Local currency
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'base_currency': {
-                'required': 1,
-                'type': 'string'
-            },
-            'exchange_rates': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            },
-            'target_currency': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'exchange_rates',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def forget(self, args=None):
-        """
-        Immediately cancel the real-time stream of messages with a specific ID.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                forget : str
-                    ID of the real-time stream of messages to cancel.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'forget': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'forget',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def forget_all(self, args=None):
-        """
-        Immediately cancel the real-time streams of messages of given type.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                forget_all : Any
-                    Cancel all streams by type. The value can be either a single type e.g. "ticks", or an array of multiple types e.g. ["candles", "ticks"].
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'forget_all': {
-                'required': 1
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'forget_all',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def get_account_status(self, args=None):
-        """
-        Get Account Status
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                get_account_status : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'get_account_status': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'get_account_status',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def get_financial_assessment(self, args=None):
-        """
-        This call gets the financial assessment details. The 'financial assessment' is a questionnaire that clients of certain Landing Companies need to complete, due to regulatory and KYC (know your client) requirements.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                get_financial_assessment : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'get_financial_assessment': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'get_financial_assessment',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def get_limits(self, args=None):
-        """
-        Trading and Withdrawal Limits for a given user
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                get_limits : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'get_limits': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'get_limits',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def get_self_exclusion(self, args=None):
-        """
-        Allows users to exclude themselves from the website for certain periods of time, or to set limits on their trading activities. This facility is a regulatory requirement for certain Landing Companies.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                get_self_exclusion : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'get_self_exclusion': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'get_self_exclusion',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def get_settings(self, args=None):
-        """
-        Get User Settings (email, date of birth, address etc)
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                get_settings : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'get_settings': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'get_settings',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def identity_verification_document_add(self, args=None):
-        """
-        Adds document information such as issuing country, id and type for identity verification processes.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                document_additional : str
-                    [Optional] Additional info required by some document types.
-                document_number : str
-                    The identification number of the document.
-                document_type : str
-                    The type of the document based on provided issuing_country (can obtained from residence_list call).
-                identity_verification_document_add : int
-                    Must be 1
-                issuing_country : str
-                    2-letter country code (can obtained from residence_list call).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'document_additional': {
-                'type': 'string'
-            },
-            'document_number': {
-                'required': 1,
-                'type': 'string'
-            },
-            'document_type': {
-                'required': 1,
-                'type': 'string'
-            },
-            'identity_verification_document_add': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'issuing_country': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'identity_verification_document_add',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def kyc_auth_status(self, args=None):
-        """
-        Get KYC Authentication Status
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                kyc_auth_status : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'kyc_auth_status': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'kyc_auth_status',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def landing_company(self, args=None):
-        """
-        The company has a number of licensed subsidiaries in various jurisdictions, which are called Landing Companies. This call will return the appropriate Landing Company for clients of a given country. The landing company may differ for Gaming contracts (Synthetic Indices) and Financial contracts (Forex, Stock Indices, Commodities).
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                landing_company : str
-                    Client's 2-letter country code (obtained from residence_list call).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'landing_company': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'landing_company',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def landing_company_details(self, args=None):
-        """
-        The company has a number of licensed subsidiaries in various jurisdictions, which are called Landing Companies (and which are wholly owned subsidiaries of the Deriv Group). This call provides information about each Landing Company.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                country : str
-                    [Optional] Will return an extra field tin_not_mandatory indicating if the landing company does not require tax identification number for the provided country.
-                landing_company_details : str
-                    Landing company shortcode.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'country': {
-                'type': 'string'
-            },
-            'landing_company_details': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'landing_company_details',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def login_history(self, args=None):
-        """
-        Retrieve a summary of login history for user.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                limit : int
-                    [Optional] Apply limit to count of login history records.
-                login_history : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'limit': {
-                'type': 'integer'
-            },
-            'login_history': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'login_history',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def logout(self, args=None):
-        """
-        Logout the session
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                logout : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'logout': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'logout',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_deposit(self, args=None):
-        """
-        This call allows deposit into MT5 account from Binary account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                amount : Number
-                    Amount to deposit (in the currency of from_binary); min = $1 or an equivalent amount, max = $20000 or an equivalent amount
-                from_binary : str
-                    Binary account loginid to transfer money from
-                mt5_deposit : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                to_mt5 : str
-                    MT5 account login to deposit money to
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'amount': {
-                'type': 'numeric'
-            },
-            'from_binary': {
-                'type': 'string'
-            },
-            'mt5_deposit': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'to_mt5': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_deposit',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_get_settings(self, args=None):
-        """
-        Get MT5 user account settings
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                login : str
-                    MT5 user login
-                mt5_get_settings : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'login': {
-                'required': 1,
-                'type': 'string'
-            },
-            'mt5_get_settings': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_get_settings',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_login_list(self, args=None):
-        """
-        Get list of MT5 accounts for client
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                mt5_login_list : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'mt5_login_list': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_login_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_new_account(self, args=None):
-        """
-        This call creates new MT5 user, either demo or real money user.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_type : str
-                    Account type. If set to 'financial', setting 'mt5_account_type' is also required.
-                address : str
-                    [Optional] The address of the user. The maximum length of this address field is 128 characters.
-                city : str
-                    [Optional] User's city of residence.
-                company : str
-                    [Optional] Name of the client's company. The maximum length of the company name is 64 characters.
-                country : str
-                    [Optional] 2-letter country code (value received from residence_list call).
-                currency : str
-                    [Optional] MT5 account currency, the default value will be the qualified account currency.
-                dry_run : int
-                    [Optional] If set to 1, only validation is performed.
-                email : str
-                    Email address
-                investPassword : str
-                    [Optional] The investor password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
-                leverage : Number
-                    Client leverage (from 1 to 1000).
-                mainPassword : str
-                    The master password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address). This field is required.
-                mt5_account_category : str
-                    [Optional] To choose whether account is conventional or swap_free. Unavailable for financial_stp MT5_account_type
-                mt5_account_type : str
-                    [Optional] Financial: Variable spreads, High leverage. Financial STP: Variable spreads, Medium Leverage, more products. If 'account_type' set to 'financial', setting 'mt5_account_type' is also required.
-                mt5_new_account : int
-                    Must be 1
-                name : str
-                    Client's name. The maximum length here is 101 characters.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                phone : Any
-                    [Optional] User's phone number.
-                phonePassword : str
-                    [Optional] The user's phone password.
-                req_id : int
-                    [Optional] Used to map request to response.
-                server : Any
-                    [Optional] Trade server.
-                state : str
-                    [Optional] User's state (region) of residence.
-                sub_account_category : str
-                    [Optional] Indicate the sub account category that we have in the cfd group naming convention.
-                zipCode : str
-                    [Optional] User's zip code.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_type': {
-                'required': 1,
-                'type': 'string'
-            },
-            'address': {
-                'type': 'string'
-            },
-            'city': {
-                'type': 'string'
-            },
-            'company': {
-                'type': 'string'
-            },
-            'country': {
-                'type': 'string'
-            },
-            'currency': {
-                'type': 'string'
-            },
-            'dry_run': {
-                'type': 'integer'
-            },
-            'email': {
-                'required': 1,
-                'type': 'string'
-            },
-            'investPassword': {
-                'type': 'string'
-            },
-            'leverage': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'mainPassword': {
-                'required': 1,
-                'type': 'string'
-            },
-            'mt5_account_category': {
-                'type': 'string'
-            },
-            'mt5_account_type': {
-                'type': 'string'
-            },
-            'mt5_new_account': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'phone': {},
-            'phonePassword': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'server': {},
-            'state': {
-                'type': 'string'
-            },
-            'sub_account_category': {
-                'type': 'string'
-            },
-            'zipCode': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_new_account',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_password_change(self, args=None):
-        """
-        To change passwords of the MT5 account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                login : str
-                    MT5 user login
-                mt5_password_change : int
-                    Must be 1
-                new_password : str
-                    New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
-                old_password : str
-                    Old password for validation (non-empty string, accepts any printable ASCII character)
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                password_type : str
-                    [Optional] Type of the password to change.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'login': {
-                'required': 1,
-                'type': 'string'
-            },
-            'mt5_password_change': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'new_password': {
-                'required': 1,
-                'type': 'string'
-            },
-            'old_password': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'password_type': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_password_change',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_password_check(self, args=None):
-        """
-        This call validates the main password for the MT5 user
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                login : str
-                    MT5 user login
-                mt5_password_check : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                password : str
-                    The password of the account.
-                password_type : str
-                    [Optional] Type of the password to check.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'login': {
-                'required': 1,
-                'type': 'string'
-            },
-            'mt5_password_check': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'password': {
-                'required': 1,
-                'type': 'string'
-            },
-            'password_type': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_password_check',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_password_reset(self, args=None):
-        """
-        To reset the password of MT5 account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                login : str
-                    MT5 user login
-                mt5_password_reset : int
-                    Must be 1
-                new_password : str
-                    New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                password_type : str
-                    [Optional] Type of the password to reset.
-                req_id : int
-                    [Optional] Used to map request to response.
-                verification_code : str
-                    Email verification code (received from a verify_email call, which must be done first)
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'login': {
-                'required': 1,
-                'type': 'string'
-            },
-            'mt5_password_reset': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'new_password': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'password_type': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'verification_code': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_password_reset',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def mt5_withdrawal(self, args=None):
-        """
-        This call allows withdrawal from MT5 account to Binary account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                amount : Number
-                    Amount to withdraw (in the currency of the MT5 account); min = $1 or an equivalent amount, max = $20000 or an equivalent amount.
-                from_mt5 : str
-                    MT5 account login to withdraw money from
-                mt5_withdrawal : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                to_binary : str
-                    Binary account loginid to transfer money to
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'from_mt5': {
-                'required': 1,
-                'type': 'string'
-            },
-            'mt5_withdrawal': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'to_binary': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'mt5_withdrawal',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def new_account_maltainvest(self, args=None):
-        """
-        This call opens a new real-money account with the `maltainvest` Landing Company. This call can be made from a virtual-money account or real-money account at Deriv (Europe) Limited. If it is the latter, client information fields in this call will be ignored and data from your existing real-money account will be used.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                accept_risk : int
-                    Show whether client has accepted risk disclaimer.
-                account_opening_reason : str
-                    [Optional] Purpose and reason for requesting the account opening.
-                account_turnover : str
-                    [Optional] The anticipated account turnover.
-                address_city : str
-                    Within 100 characters
-                address_line_1 : str
-                    Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-
-                address_line_2 : str
-                    [Optional] Within 70 characters.
-                address_postcode : str
-                    [Optional] Within 20 characters and may not contain '+'.
-                address_state : str
-                    [Optional] Possible value receive from states_list call.
-                affiliate_token : str
-                    [Optional] Affiliate token, within 32 characters.
-                cfd_experience : str
-                    How much experience do you have in CFD trading?
-                cfd_frequency : str
-                    How many CFD trades have you placed in the past 12 months?
-                cfd_trading_definition : str
-                    In your understanding, CFD trading allows you to:
-                citizen : str
-                    [Optional] Country of legal citizenship, 2-letter country code. Possible value receive from residence_list call.
-                client_type : str
-                    [Optional] Indicates whether this is for a client requesting an account with professional status.
-                currency : str
-                    [Optional] To set currency of the account. List of supported currencies can be acquired with payout_currencies call.
-                date_of_birth : str
-                    Date of birth format: yyyy-mm-dd.
-                education_level : str
-                    Level of Education
-                employment_industry : str
-                    Industry of Employment.
-                employment_status : str
-                    Employment Status.
-                estimated_worth : str
-                    Estimated Net Worth.
-                first_name : str
-                    Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
-                income_source : str
-                    Income Source.
-                last_name : str
-                    Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
-                leverage_impact_trading : str
-                    How does leverage affect CFD trading?
-                leverage_trading_high_risk_stop_loss : str
-                    Leverage trading is high-risk, so it's a good idea to use risk management features such as stop loss. Stop loss allows you to
-                net_income : str
-                    Net Annual Income.
-                new_account_maltainvest : int
-                    Must be 1
-                non_pep_declaration : int
-                    [Optional] Indicates client's self-declaration of not being a PEP/RCA.
-                occupation : str
-                    Occupation.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                phone : Any
-                    [Optional] Starting with + followed by 9-35 digits, hyphens or space.
-                place_of_birth : str
-                    [Optional] Place of birth, 2-letter country code.
-                req_id : int
-                    [Optional] Used to map request to response.
-                required_initial_margin : str
-                    When would you be required to pay an initial margin?
-                residence : str
-                    2-letter country code, possible value receive from residence_list call.
-                risk_tolerance : str
-                    Do you understand that you could potentially lose 100% of the money you use to trade?
-                salutation : str
-                    Accept any value in enum list.
-                secret_answer : str
-                    [Optional] Answer to secret question, within 4-50 characters.
-                secret_question : str
-                    [Optional] Accept any value in enum list.
-                source_of_experience : str
-                    How much knowledge and experience do you have in relation to online trading?
-                source_of_wealth : str
-                    [Optional] Source of wealth.
-                tax_identification_number : str
-                    Tax identification number. Only applicable for real money account. Required for maltainvest landing company.
-                tax_residence : str
-                    Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company.
-                trading_experience_financial_instruments : str
-                    How much experience do you have with other financial instruments?
-                trading_frequency_financial_instruments : str
-                    How many trades have you placed with other financial instruments in the past 12 months?
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'accept_risk': {
-                'type': 'integer'
-            },
-            'account_opening_reason': {
-                'type': 'string'
-            },
-            'account_turnover': {
-                'type': 'string'
-            },
-            'address_city': {
-                'required': 1,
-                'type': 'string'
-            },
-            'address_line_1': {
-                'required': 1,
-                'type': 'string'
-            },
-            'address_line_2': {
-                'type': 'string'
-            },
-            'address_postcode': {
-                'type': 'string'
-            },
-            'address_state': {
-                'type': 'string'
-            },
-            'affiliate_token': {
-                'type': 'string'
-            },
-            'cfd_experience': {
-                'type': 'string'
-            },
-            'cfd_frequency': {
-                'type': 'string'
-            },
-            'cfd_trading_definition': {
-                'type': 'string'
-            },
-            'citizen': {
-                'type': 'string'
-            },
-            'client_type': {
-                'type': 'string'
-            },
-            'currency': {
-                'type': 'string'
-            },
-            'date_of_birth': {
-                'required': 1,
-                'type': 'string'
-            },
-            'education_level': {
-                'type': 'string'
-            },
-            'employment_industry': {
-                'type': 'string'
-            },
-            'employment_status': {
-                'required': 1,
-                'type': 'string'
-            },
-            'estimated_worth': {
-                'type': 'string'
-            },
-            'first_name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'income_source': {
-                'type': 'string'
-            },
-            'last_name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'leverage_impact_trading': {
-                'type': 'string'
-            },
-            'leverage_trading_high_risk_stop_loss': {
-                'type': 'string'
-            },
-            'net_income': {
-                'type': 'string'
-            },
-            'new_account_maltainvest': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'non_pep_declaration': {
-                'type': 'integer'
-            },
-            'occupation': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'phone': {},
-            'place_of_birth': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'required_initial_margin': {
-                'type': 'string'
-            },
-            'residence': {
-                'required': 1,
-                'type': 'string'
-            },
-            'risk_tolerance': {
-                'type': 'string'
-            },
-            'salutation': {
-                'required': 1,
-                'type': 'string'
-            },
-            'secret_answer': {
-                'type': 'string'
-            },
-            'secret_question': {
-                'type': 'string'
-            },
-            'source_of_experience': {
-                'type': 'string'
-            },
-            'source_of_wealth': {
-                'type': 'string'
-            },
-            'tax_identification_number': {
-                'required': 1,
-                'type': 'string'
-            },
-            'tax_residence': {
-                'required': 1,
-                'type': 'string'
-            },
-            'trading_experience_financial_instruments': {
-                'type': 'string'
-            },
-            'trading_frequency_financial_instruments': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'new_account_maltainvest',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def new_account_real(self, args=None):
-        """
-        This call opens a new real-money account. This call can be made from a virtual-money or a real-money account. If it is the latter, client information fields in this call will be ignored and data from your existing real-money account will be used.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_opening_reason : str
-                    [Optional] Purpose and reason for requesting the account opening.
-                account_turnover : str
-                    [Optional] The anticipated account turnover.
-                address_city : str
-                    [Optional] Within 100 characters.
-                address_line_1 : str
-                    Within 70 characters, with no leading whitespaces and may contain letters/numbers and/or any of following characters '.,:;()@#/-
-                address_line_2 : str
-                    [Optional] Within 70 characters.
-                address_postcode : str
-                    [Optional] Within 20 characters and may not contain '+'.
-                address_state : str
-                    [Optional] Possible value receive from states_list call.
-                affiliate_token : str
-                    [Optional] Affiliate token, within 32 characters.
-                citizen : Any
-                    [Optional] Country of legal citizenship, 2-letter country code.
-                client_type : str
-                    [Optional] Indicates whether this is for a client requesting an account with professional status.
-                currency : str
-                    [Optional] To set currency of the account. List of supported currencies can be acquired with payout_currencies call.
-                date_of_birth : str
-                    Date of birth format: yyyy-mm-dd.
-                first_name : str
-                    Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
-                last_name : str
-                    Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes.
-                new_account_real : int
-                    Must be 1
-                non_pep_declaration : int
-                    [Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                phone : Any
-                    [Optional] Starting with + followed by 9-35 digits, hyphens or space.
-                place_of_birth : str
-                    [Optional] Place of birth, 2-letter country code.
-                req_id : int
-                    [Optional] Used to map request to response.
-                residence : str
-                    2-letter country code, possible value receive from residence_list call.
-                salutation : str
-                    [Optional] Accept any value in enum list.
-                secret_answer : str
-                    [Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client open another account.
-                secret_question : str
-                    [Optional] Accept any value in enum list. Required for new account and existing client details will be used if client open another account.
-                tax_identification_number : str
-                    [Optional] Tax identification number. Only applicable for real money account. Required for maltainvest landing company.
-                tax_residence : str
-                    [Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_opening_reason': {
-                'type': 'string'
-            },
-            'account_turnover': {
-                'type': 'string'
-            },
-            'address_city': {
-                'type': 'string'
-            },
-            'address_line_1': {
-                'type': 'string'
-            },
-            'address_line_2': {
-                'type': 'string'
-            },
-            'address_postcode': {
-                'type': 'string'
-            },
-            'address_state': {
-                'type': 'string'
-            },
-            'affiliate_token': {
-                'type': 'string'
-            },
-            'citizen': {},
-            'client_type': {
-                'type': 'string'
-            },
-            'currency': {
-                'type': 'string'
-            },
-            'date_of_birth': {
-                'type': 'string'
-            },
-            'first_name': {
-                'type': 'string'
-            },
-            'last_name': {
-                'type': 'string'
-            },
-            'new_account_real': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'non_pep_declaration': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'phone': {},
-            'place_of_birth': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'residence': {
-                'type': 'string'
-            },
-            'salutation': {
-                'type': 'string'
-            },
-            'secret_answer': {
-                'type': 'string'
-            },
-            'secret_question': {
-                'type': 'string'
-            },
-            'tax_identification_number': {
-                'type': 'string'
-            },
-            'tax_residence': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'new_account_real',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def new_account_virtual(self, args=None):
-        """
-        Create a new virtual-money account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                affiliate_token : str
-                    [Optional] Affiliate token, within 32 characters.
-                client_password : str
-                    Password (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
-                date_first_contact : str
-                    [Optional] Date of first contact, format: yyyy-mm-dd in GMT timezone.
-                email_consent : int
-                    [Optional] Boolean value: 1 or 0, indicating whether the client has given consent for marketing emails.
-                gclid_url : str
-                    [Optional] Google Click Identifier to track source.
-                new_account_virtual : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                residence : str
-                    2-letter country code (obtained from residence_list call).
-                signup_device : str
-                    [Optional] Show whether user has used mobile or desktop.
-                type : str
-                    Account type
-                utm_ad_id : Any
-                    [Optional] Identifier of particular ad. Value must match Regex pattern to be recorded
-                utm_adgroup_id : Any
-                    [Optional] Identifier of ad group in the campaign. Value must match Regex pattern to be recorded
-                utm_adrollclk_id : Any
-                    [Optional] Unique identifier of click on AdRoll ads platform. Value must match Regex pattern to be recorded
-                utm_campaign : Any
-                    [Optional] Identifies a specific product promotion or strategic campaign such as a spring sale or other promotions. Value must match Regex pattern to be recorded
-                utm_campaign_id : Any
-                    [Optional] Identifier of paid ad campaign. Value must match Regex pattern to be recorded
-                utm_content : Any
-                    [Optional] Used to differentiate similar content, or links within the same ad. Value must match Regex pattern to be recorded
-                utm_fbcl_id : Any
-                    [Optional] Unique identifier of click on Facebook ads platform. Value must match Regex pattern to be recorded
-                utm_gl_client_id : Any
-                    [Optional] Unique visitor identifier on Google Ads platform. Value must match Regex pattern to be recorded
-                utm_medium : Any
-                    [Optional] Identifies the medium the link was used upon such as: email, CPC, or other methods of sharing. Value must match Regex pattern to be recorded
-                utm_msclk_id : Any
-                    [Optional] Unique click identifier on Microsoft Bing ads platform. Value must match Regex pattern to be recorded
-                utm_source : Any
-                    [Optional] Identifies the source of traffic such as: search engine, newsletter, or other referral. Value must match Regex pattern to be recorded
-                utm_term : Any
-                    [Optional] Used to send information related to the campaign term like paid search keywords. Value must match Regex pattern to be recorded
-                verification_code : str
-                    Email verification code (received from a verify_email call, which must be done first).
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'affiliate_token': {
-                'type': 'string'
-            },
-            'client_password': {
-                'type': 'string'
-            },
-            'date_first_contact': {
-                'type': 'string'
-            },
-            'email_consent': {
-                'type': 'integer'
-            },
-            'gclid_url': {
-                'type': 'string'
-            },
-            'new_account_virtual': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'residence': {
-                'type': 'string'
-            },
-            'signup_device': {
-                'type': 'string'
-            },
-            'type': {
-                'type': 'string'
-            },
-            'utm_ad_id': {},
-            'utm_adgroup_id': {},
-            'utm_adrollclk_id': {},
-            'utm_campaign': {},
-            'utm_campaign_id': {},
-            'utm_content': {},
-            'utm_fbcl_id': {},
-            'utm_gl_client_id': {},
-            'utm_medium': {},
-            'utm_msclk_id': {},
-            'utm_source': {},
-            'utm_term': {},
-            'verification_code': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'new_account_virtual',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def oauth_apps(self, args=None):
-        """
-        List all my used OAuth applications.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                oauth_apps : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'oauth_apps': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'oauth_apps',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advert_create(self, args=None):
-        """
-        Creates a P2P (Peer to Peer) advert. Can only be used by an approved P2P advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                amount : Number
-                    The total amount of the advert, in advertiser's account currency.
-                block_trade : int
-                    [Optional] Indicates if this is block trade ad or not. Default: 0.
-                contact_info : str
-                    [Optional] Advertiser contact information.
-                description : str
-                    [Optional] General information about the advert.
-                local_currency : str
-                    [Optional] Local currency for this advert. If not provided, will use the currency of client's residence by default.
-                max_order_amount : Number
-                    Maximum allowed amount for the orders of this advert, in advertiser's account_currency. Should be more than or equal to min_order_amount
-                min_order_amount : Number
-                    Minimum allowed amount for the orders of this advert, in advertiser's account_currency. Should be less than or equal to max_order_amount.
-                p2p_advert_create : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_info : str
-                    [Optional] Payment instructions.
-                payment_method : str
-                    [Optional] Payment method name (deprecated).
-                payment_method_ids : Any
-                    IDs of previously saved payment methods as returned from p2p_advertiser_payment_methods, only applicable for sell ads.
-                payment_method_names : Any
-                    Payment method identifiers as returned from p2p_payment_methods, only applicable for buy ads.
-                rate : Number
-                    Conversion rate from advertiser's account currency to local_currency. An absolute rate value (fixed), or percentage offset from current market rate (floating).
-                rate_type : str
-                    Type of rate, fixed or floating.
-                req_id : int
-                    [Optional] Used to map request to response.
-                type : str
-                    The advertisement represents the intention to perform this action on your Deriv account funds.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'block_trade': {
-                'type': 'integer'
-            },
-            'contact_info': {
-                'type': 'string'
-            },
-            'description': {
-                'type': 'string'
-            },
-            'local_currency': {
-                'type': 'string'
-            },
-            'max_order_amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'min_order_amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'p2p_advert_create': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'payment_info': {
-                'type': 'string'
-            },
-            'payment_method': {
-                'type': 'string'
-            },
-            'payment_method_ids': {},
-            'payment_method_names': {},
-            'rate': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'rate_type': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'type': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advert_create',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advert_info(self, args=None):
-        """
-        Retrieve information about a P2P advert.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                id : str
-                    [Optional] The unique identifier for this advert. Optional when subscribe is 1. If not provided, all advertiser adverts will be subscribed.
-                p2p_advert_info : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates when changes occur. Optional when id is provided.
-                use_client_limits : int
-                    [Optional] If set to 1, the maximum order amount will be adjusted to the current balance and turnover limits of the account.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'id': {
-                'type': 'string'
-            },
-            'p2p_advert_info': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            },
-            'use_client_limits': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advert_info',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advert_list(self, args=None):
-        """
-        Returns available adverts for use with `p2p_order_create` .
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                advertiser_id : str
-                    [Optional] ID of the advertiser to list adverts for.
-                advertiser_name : str
-                    [Optional] Search for advertiser by name. Partial matches will be returned.
-                amount : Number
-                    [Optional] How much to buy or sell, used to calculate prices.
-                block_trade : int
-                    [Optional] Return block trade adverts when 1, non-block trade adverts when 0 (default).
-                counterparty_type : str
-                    [Optional] Filter the adverts by counterparty_type.
-                favourites_only : int
-                    [Optional] Only show adverts from favourite advertisers. Default is 0.
-                limit : int
-                    [Optional] Used for paging.
-                local_currency : str
-                    [Optional] Currency to conduct payment transaction in. If not provided, only ads from country of residence will be returned.
-                offset : int
-                    [Optional] Used for paging.
-                p2p_advert_list : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_method : Any
-                    [Optional] Search by supported payment methods.
-                req_id : int
-                    [Optional] Used to map request to response.
-                sort_by : str
-                    [Optional] How the results are sorted.
-                use_client_limits : int
-                    [Optional] If set to 1, ads that exceed this account's balance or turnover limits will not be shown.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'advertiser_id': {
-                'type': 'string'
-            },
-            'advertiser_name': {
-                'type': 'string'
-            },
-            'amount': {
-                'type': 'numeric'
-            },
-            'block_trade': {
-                'type': 'integer'
-            },
-            'counterparty_type': {
-                'type': 'string'
-            },
-            'favourites_only': {
-                'type': 'integer'
-            },
-            'limit': {
-                'type': 'integer'
-            },
-            'local_currency': {
-                'type': 'string'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'p2p_advert_list': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'payment_method': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'sort_by': {
-                'type': 'string'
-            },
-            'use_client_limits': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advert_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advert_update(self, args=None):
-        """
-        Updates a P2P advert. Can only be used by the advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contact_info : str
-                    [Optional] Advertiser contact information.
-                delete : int
-                    [Optional] If set to 1, permanently deletes the advert.
-                description : str
-                    [Optional] General information about the advert.
-                id : str
-                    The unique identifier for this advert.
-                is_active : int
-                    [Optional] Activate or deactivate the advert.
-                local_currency : str
-                    [Optional] Local currency for this advert.
-                max_order_amount : Number
-                    [Optional] Maximum allowed amount for the orders of this advert, in advertiser's account_currency. Should be more than or equal to min_order_amount.
-                min_order_amount : Number
-                    [Optional] Minimum allowed amount for the orders of this advert, in advertiser's account_currency. Should be less than or equal to max_order_amount.
-                p2p_advert_update : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_info : str
-                    [Optional] Payment instructions.
-                payment_method_ids : Any
-                    [Optional] IDs of previously saved payment methods as returned from p2p_advertiser_payment_methods, only applicable for sell ads. Exisiting methods will be replaced.
-                payment_method_names : Any
-                    [Optional] Payment method identifiers as returned from p2p_payment_methods, only applicable for buy ads. Exisiting methods will be replaced.
-                rate : Number
-                    [Optional] Conversion rate from advertiser's account currency to local_currency. An absolute rate value (fixed), or percentage offset from current market rate (floating).
-                rate_type : str
-                    [Optional] Type of rate, fixed or floating.
-                remaining_amount : Number
-                    [Optional] The total available amount of the advert, in advertiser's account currency.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contact_info': {
-                'type': 'string'
-            },
-            'delete': {
-                'type': 'integer'
-            },
-            'description': {
-                'type': 'string'
-            },
-            'id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'is_active': {
-                'type': 'integer'
-            },
-            'local_currency': {
-                'type': 'string'
-            },
-            'max_order_amount': {
-                'type': 'numeric'
-            },
-            'min_order_amount': {
-                'type': 'numeric'
-            },
-            'p2p_advert_update': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'payment_info': {
-                'type': 'string'
-            },
-            'payment_method_ids': {},
-            'payment_method_names': {},
-            'rate': {
-                'type': 'numeric'
-            },
-            'rate_type': {
-                'type': 'string'
-            },
-            'remaining_amount': {
-                'type': 'numeric'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advert_update',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_adverts(self, args=None):
-        """
-        Returns all P2P adverts created by the authorized client. Can only be used by a registered P2P advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                limit : int
-                    [Optional] Used for paging. This value will also apply to subsription responses.
-                offset : int
-                    [Optional] Used for paging. This value will also apply to subsription responses.
-                p2p_advertiser_adverts : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'limit': {
-                'type': 'integer'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'p2p_advertiser_adverts': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_adverts',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_create(self, args=None):
-        """
-        Registers the client as a P2P advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contact_info : str
-                    [Optional] Advertiser's contact information, to be used as a default for new sell adverts.
-                default_advert_description : str
-                    [Optional] Default description that can be used every time an advert is created.
-                name : str
-                    The advertiser's displayed name.
-                p2p_advertiser_create : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_info : str
-                    [Optional] Advertiser's payment information, to be used as a default for new sell adverts.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever there is an update to advertiser
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contact_info': {
-                'type': 'string'
-            },
-            'default_advert_description': {
-                'type': 'string'
-            },
-            'name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_advertiser_create': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'payment_info': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_create',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_info(self, args=None):
-        """
-        Retrieve information about a P2P advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                id : str
-                    [Optional] The unique identifier for this advertiser. If not provided, returns advertiser information about the current account.
-                p2p_advertiser_info : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever there is an update to advertiser
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'id': {
-                'type': 'string'
-            },
-            'p2p_advertiser_info': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_info',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_list(self, args=None):
-        """
-        Retrieve advertisers has/had trade with the current advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                advertiser_name : str
-                    [Optional] Search for advertiser by name. Partial matches will be returned.
-                is_blocked : int
-                    [Optional] Used to return only blocked or unblocked partners
-                limit : int
-                    [Optional] Used for paging.
-                offset : int
-                    [Optional] Used for paging.
-                p2p_advertiser_list : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                sort_by : str
-                    [Optional] How the results are sorted.
-                trade_partners : int
-                    [Optional] Get all advertisers has/had trade.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'advertiser_name': {
-                'type': 'string'
-            },
-            'is_blocked': {
-                'type': 'integer'
-            },
-            'limit': {
-                'type': 'integer'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'p2p_advertiser_list': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'sort_by': {
-                'type': 'string'
-            },
-            'trade_partners': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_payment_methods(self, args=None):
-        """
-        Manage or list P2P advertiser payment methods.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                create : Any
-                    Contains new payment method entries.
-                delete : Any
-                    Contains payment methods to delete.
-                p2p_advertiser_payment_methods : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                update : Any
-                    Contains payment methods to update.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'create': {},
-            'delete': {},
-            'p2p_advertiser_payment_methods': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'update': {}
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_payment_methods',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_relations(self, args=None):
-        """
-        Updates and returns favourite and blocked advertisers of the current user.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                add_blocked : Any
-                    IDs of advertisers to block.
-                add_favourites : Any
-                    IDs of advertisers to add as favourites.
-                p2p_advertiser_relations : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                remove_blocked : Any
-                    IDs of advertisers to remove from blocked.
-                remove_favourites : Any
-                    IDs of advertisers to remove from favourites.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'add_blocked': {},
-            'add_favourites': {},
-            'p2p_advertiser_relations': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'remove_blocked': {},
-            'remove_favourites': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_relations',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_advertiser_update(self, args=None):
-        """
-        Update the information of the P2P advertiser for the current account. Can only be used by an approved P2P advertiser.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contact_info : str
-                    [Optional] Advertiser's contact information, to be used as a default for new sell adverts.
-                default_advert_description : str
-                    [Optional] Default description that can be used every time an advert is created.
-                is_listed : int
-                    [Optional] Used to set if the advertiser's adverts could be listed. When 0, adverts won't be listed regardless of they are active or not. This doesn't change the is_active of each individual advert.
-                p2p_advertiser_update : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_info : str
-                    [Optional] Advertiser's payment information, to be used as a default for new sell adverts.
-                req_id : int
-                    [Optional] Used to map request to response.
-                show_name : int
-                    [Optional] When 1, the advertiser's real name will be displayed on to other users on adverts and orders.
-                upgrade_limits : int
-                    [Optional] Used to upgrade daily limits of eligible advertiser.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contact_info': {
-                'type': 'string'
-            },
-            'default_advert_description': {
-                'type': 'string'
-            },
-            'is_listed': {
-                'type': 'integer'
-            },
-            'p2p_advertiser_update': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'payment_info': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'show_name': {
-                'type': 'integer'
-            },
-            'upgrade_limits': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_advertiser_update',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_chat_create(self, args=None):
-        """
-        Creates a P2P chat for the specified order.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                order_id : str
-                    The unique identifier for the order to create the chat for.
-                p2p_chat_create : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'order_id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_chat_create': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_chat_create',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_cancel(self, args=None):
-        """
-        Cancel a P2P order.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                id : str
-                    The unique identifier for this order.
-                p2p_order_cancel : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_order_cancel': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_cancel',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_confirm(self, args=None):
-        """
-        Confirm a P2P order.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                dry_run : int
-                    [Optional] If set to 1, only validation is performed.
-                id : str
-                    The unique identifier for this order.
-                p2p_order_confirm : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                verification_code : str
-                    [Optional] Verification code received from email.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'dry_run': {
-                'type': 'integer'
-            },
-            'id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_order_confirm': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'verification_code': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_confirm',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_create(self, args=None):
-        """
-        Creates a P2P order for the specified advert.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                advert_id : str
-                    The unique identifier for the advert to create an order against.
-                amount : Number
-                    The amount of currency to be bought or sold.
-                contact_info : str
-                    [Optional] Seller contact information. Only applicable for 'sell orders'.
-                p2p_order_create : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_info : str
-                    [Optional] Payment instructions, only applicable for sell orders.
-                payment_method_ids : Any
-                    IDs of payment methods, only applicable for sell orders.
-                rate : Number
-                    [Optional] Conversion rate from account currency to local currency, only applicable for floating rate adverts.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever there is an update to the order.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'advert_id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'contact_info': {
-                'type': 'string'
-            },
-            'p2p_order_create': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'payment_info': {
-                'type': 'string'
-            },
-            'payment_method_ids': {},
-            'rate': {
-                'type': 'numeric'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_create',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_dispute(self, args=None):
-        """
-        Dispute a P2P order.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                dispute_reason : str
-                    The predefined dispute reason
-                id : str
-                    The unique identifier for this order.
-                p2p_order_dispute : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'dispute_reason': {
-                'required': 1,
-                'type': 'string'
-            },
-            'id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_order_dispute': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_dispute',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_info(self, args=None):
-        """
-        Retrieves the information about a P2P order.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                id : str
-                    The unique identifier for the order.
-                p2p_order_info : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever there is an update to order
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_order_info': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_info',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_list(self, args=None):
-        """
-        List active orders.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                active : Number
-                    [Optional] Should be 1 to list active, 0 to list inactive (historical).
-                advert_id : str
-                    [Optional] If present, lists orders applying to a specific advert.
-                date_from : str
-                    [Optional] Filter the orders created after this date(included) format(epoch or YYYY-MM-DD)
-                date_to : str
-                    [Optional] Filter the orders created before this date(included) format(epoch or YYYY-MM-DD)
-                limit : int
-                    [Optional] Used for paging.
-                offset : int
-                    [Optional] Used for paging.
-                p2p_order_list : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever there is a change to any order belonging to you.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'active': {
-                'type': 'numeric'
-            },
-            'advert_id': {
-                'type': 'string'
-            },
-            'date_from': {
-                'type': 'string'
-            },
-            'date_to': {
-                'type': 'string'
-            },
-            'limit': {
-                'type': 'integer'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'p2p_order_list': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_order_review(self, args=None):
-        """
-        Creates a review for the specified order.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                order_id : str
-                    The order identification number.
-                p2p_order_review : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                rating : int
-                    Rating for the transaction, 1 to 5.
-                recommended : Any
-                    [Optional] 1 if the counterparty is recommendable to others, otherwise 0.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'order_id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'p2p_order_review': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'rating': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'recommended': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_order_review',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_payment_methods(self, args=None):
-        """
-        List all P2P payment methods.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                p2p_payment_methods : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'p2p_payment_methods': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_payment_methods',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def p2p_ping(self, args=None):
-        """
-        Keeps the connection alive and updates the P2P advertiser's online status. The advertiser will be considered offline 60 seconds after a call is made.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                p2p_ping : int
-                    Must be 1
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'p2p_ping': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'p2p_ping',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def payment_methods(self, args=None):
-        """
-        Will return a list payment methods available for the given country. If the request is authenticated the client's residence country will be used.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                country : str
-                    [Optional] 2-letter country code (ISO standard).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_methods : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'country': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'payment_methods': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'payment_methods',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def paymentagent_create(self, args=None):
-        """
-        Saves client's payment agent details.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                affiliate_id : str
-                    [Optional] Client's My Affiliate id, if exists.
-                code_of_conduct_approval : int
-                    Indicates client's agreement with the Code of Conduct.
-                commission_deposit : Number
-                    Commission  (%) the agent wants to take on deposits
-                commission_withdrawal : Number
-                    Commission  (%) the agent wants to take on withdrawals
-                email : str
-                    Payment agent's email address.
-                information : str
-                    [Optional] Information about payment agent and their proposed service.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payment_agent_name : str
-                    The name with which the payment agent is going to be identified.
-                paymentagent_create : int
-                    Must be 1
-                phone_numbers : Any
-                    Payment agent's phone number(s) with country code.
-                req_id : int
-                    [Optional] Used to map request to response.
-                supported_payment_methods : Any
-                    A list of supported payment methods.
-                urls : Any
-                    The URL(s) of payment agent's website(s).
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'affiliate_id': {
-                'type': 'string'
-            },
-            'code_of_conduct_approval': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'commission_deposit': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'commission_withdrawal': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'email': {
-                'required': 1,
-                'type': 'string'
-            },
-            'information': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'payment_agent_name': {
-                'required': 1,
-                'type': 'string'
-            },
-            'paymentagent_create': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'phone_numbers': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'supported_payment_methods': {
-                'required': 1
-            },
-            'urls': {
-                'required': 1
-            }
-        }
-
-        all_args = {
-            'method': 'paymentagent_create',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def paymentagent_details(self, args=None):
-        """
-        Gets client's payment agent details.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                paymentagent_details : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'paymentagent_details': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'paymentagent_details',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def paymentagent_list(self, args=None):
-        """
-        Will return a list of Payment Agents for a given country for a given currency. Payment agents allow users to deposit and withdraw funds using local payment methods that might not be available via the main website's cashier system.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                currency : str
-                    [Optional] If specified, only payment agents that supports that currency will be returned (obtained from payout_currencies call).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                paymentagent_list : str
-                    Client's 2-letter country code (obtained from residence_list call).
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'currency': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'paymentagent_list': {
-                'required': 1,
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'paymentagent_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def paymentagent_transfer(self, args=None):
-        """
-        Payment Agent Transfer - this call is available only to accounts that are approved Payment Agents.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                amount : Number
-                    The amount to transfer.
-                currency : str
-                    Currency code.
-                description : str
-                    [Optional] Remarks about the transfer.
-                dry_run : int
-                    [Optional] If set to 1, just do validation.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                paymentagent_transfer : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-                transfer_to : str
-                    The loginid of the recipient account.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'currency': {
-                'required': 1,
-                'type': 'string'
-            },
-            'description': {
-                'type': 'string'
-            },
-            'dry_run': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'paymentagent_transfer': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'transfer_to': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'paymentagent_transfer',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def paymentagent_withdraw(self, args=None):
-        """
-        Initiate a withdrawal to an approved Payment Agent.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                amount : Number
-                    The amount to withdraw to the payment agent.
-                currency : str
-                    The currency code.
-                description : str
-                    [Optional] Remarks about the withdraw. Only letters, numbers, space, period, comma, - ' are allowed.
-                dry_run : int
-                    [Optional] If set to 1, just do validation.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                paymentagent_loginid : str
-                    The payment agent loginid received from the paymentagent_list call.
-                paymentagent_withdraw : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-                verification_code : str
-                    Email verification code (received from a verify_email call, which must be done first)
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'amount': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'currency': {
-                'required': 1,
-                'type': 'string'
-            },
-            'description': {
-                'type': 'string'
-            },
-            'dry_run': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'paymentagent_loginid': {
-                'required': 1,
-                'type': 'string'
-            },
-            'paymentagent_withdraw': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'verification_code': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'paymentagent_withdraw',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def paymentagent_withdraw_justification(self, args=None):
-        """
-        Provide justification to perform withdrawal using a Payment Agent.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                message : str
-                    Reasons for needing to withdraw using a Payment Agent.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                paymentagent_withdraw_justification : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'message': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'paymentagent_withdraw_justification': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'paymentagent_withdraw_justification',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def payout_currencies(self, args=None):
-        """
-        Retrieve a list of available option payout currencies. If a user is logged in, only the currencies available for the account will be returned.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                payout_currencies : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'payout_currencies': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'payout_currencies',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def ping(self, args=None):
-        """
-        To send the ping request to the server. Mostly used to test the connection or to keep it alive.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                ping : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'ping': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'ping',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def portfolio(self, args=None):
-        """
-        Receive information about my current portfolio of outstanding options
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contract_type : Any
-                    Return only contracts of the specified types
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                portfolio : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contract_type': {},
-            'passthrough': {},
-            'portfolio': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'portfolio',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def profit_table(self, args=None):
-        """
-        Retrieve a summary of account Profit Table, according to given search criteria
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contract_type : Any
-                    Return only contracts of the specified types
-                date_from : str
-                    [Optional] Start date (epoch or YYYY-MM-DD)
-                date_to : str
-                    [Optional] End date (epoch or YYYY-MM-DD)
-                description : int
-                    [Optional] If set to 1, will return full contracts description.
-                limit : Number
-                    [Optional] Apply upper limit to count of transactions received.
-                offset : int
-                    [Optional] Number of transactions to skip.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                profit_table : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-                sort : str
-                    [Optional] Sort direction.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contract_type': {},
-            'date_from': {
-                'type': 'string'
-            },
-            'date_to': {
-                'type': 'string'
-            },
-            'description': {
-                'type': 'integer'
-            },
-            'limit': {
-                'type': 'numeric'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'profit_table': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'sort': {
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'profit_table',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def proposal(self, args=None):
-        """
-        Gets latest price for a specific contract.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                amount : Number
-                    [Optional] Proposed contract payout or stake, or multiplier (for lookbacks).
-                barrier : str
-                    [Optional] Barrier for the contract (or last digit prediction for digit contracts). Contracts less than 24 hours in duration would need a relative barrier (barriers which need +/-), where entry spot would be adjusted accordingly with that amount to define a barrier, except for Synthetic Indices as they support both relative and absolute barriers. Not needed for lookbacks.
-                barrier2 : str
-                    [Optional] Low barrier for the contract (for contracts with two barriers). Contracts less than 24 hours in duration would need a relative barrier (barriers which need +/-), where entry spot would be adjusted accordingly with that amount to define a barrier, except for Synthetic Indices as they support both relative and absolute barriers. Not needed for lookbacks.
-                barrier_range : str
-                    [Optional] Barrier range for callputspread.
-                basis : str
-                    [Optional] Indicates type of the amount.
-                cancellation : str
-                    Cancellation duration option (only for MULTUP and MULTDOWN contracts).
-                contract_type : str
-                    The proposed contract type
-                currency : str
-                    This can only be the account-holder's currency (obtained from payout_currencies call).
-                date_expiry : int
-                    [Optional] Epoch value of the expiry time of the contract. Either date_expiry or duration is required.
-                date_start : int
-                    [Optional] Indicates epoch value of the starting time of the contract. If left empty, the start time of the contract is now.
-                duration : int
-                    [Optional] Duration quantity. Either date_expiry or duration is required.
-                duration_unit : str
-                    [Optional] Duration unit - s: seconds, m: minutes, h: hours, d: days, t: ticks.
-                growth_rate : Number
-                    [Optional] Growth rate of an accumulator contract.
-                limit_order : Any
-                multiplier : Number
-                    [Optional] The multiplier for non-binary options. E.g. lookbacks.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                product_type : str
-                    [Optional] The product type.
-                proposal : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-                selected_tick : int
-                    [Optional] The tick that is predicted to have the highest/lowest value - for TICKHIGH and TICKLOW contracts.
-                subscribe : int
-                    [Optional] 1 - to initiate a realtime stream of prices. Note that tick trades (without a user-defined barrier), digit trades and less than 24 hours at-the-money contracts for the following underlying symbols are not streamed: R_10, R_25, R_50, R_75, R_100, RDBULL, RDBEAR (this is because their price is constant).
-                symbol : str
-                    The short symbol name (obtained from active_symbols call).
-                trading_period_start : int
-                    [Optional] Required only for multi-barrier trading. Defines the epoch value of the trading period start time.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'amount': {
-                'type': 'numeric'
-            },
-            'barrier': {
-                'type': 'string'
-            },
-            'barrier2': {
-                'type': 'string'
-            },
-            'barrier_range': {
-                'type': 'string'
-            },
-            'basis': {
-                'type': 'string'
-            },
-            'cancellation': {
-                'type': 'string'
-            },
-            'contract_type': {
-                'required': 1,
-                'type': 'string'
-            },
-            'currency': {
-                'required': 1,
-                'type': 'string'
-            },
-            'date_expiry': {
-                'type': 'integer'
-            },
-            'date_start': {
-                'type': 'integer'
-            },
-            'duration': {
-                'type': 'integer'
-            },
-            'duration_unit': {
-                'type': 'string'
-            },
-            'growth_rate': {
-                'type': 'numeric'
-            },
-            'limit_order': {
-                'stop_loss': {
-                    'type': 'numeric'
-                },
-                'take_profit': {
-                    'type': 'numeric'
-                }
-            },
-            'multiplier': {
-                'type': 'numeric'
-            },
-            'passthrough': {},
-            'product_type': {
-                'type': 'string'
-            },
-            'proposal': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'selected_tick': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            },
-            'symbol': {
-                'required': 1,
-                'type': 'string'
-            },
-            'trading_period_start': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'proposal',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def proposal_open_contract(self, args=None):
-        """
-        Get latest price (and other information) for a contract in the user's portfolio
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                contract_id : int
-                    [Optional] Contract ID received from a portfolio request. If not set, you will receive stream of all open contracts.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                proposal_open_contract : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] 1 to stream.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'contract_id': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'proposal_open_contract': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'proposal_open_contract',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def reality_check(self, args=None):
-        """
-        Retrieve summary of client's trades and account for the Reality Check facility. A 'reality check' means a display of time elapsed since the session began, and associated client profit/loss. The Reality Check facility is a regulatory requirement for certain landing companies.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                reality_check : int
-                    Must be 1
-                req_id : int
-                    [Optional] Used to map request to response.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'reality_check': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'req_id': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'reality_check',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def residence_list(self, args=None):
-        """
-        This call returns a list of countries and 2-letter country codes, suitable for populating the account opening form.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                residence_list : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'residence_list': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'residence_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def revoke_oauth_app(self, args=None):
-        """
-        Used for revoking access of particular app.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                revoke_oauth_app : int
-                    The application ID to revoke.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'revoke_oauth_app': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'revoke_oauth_app',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def sell(self, args=None):
-        """
-        Sell a Contract as identified from a previous `portfolio` call.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                price : Number
-                    Minimum price at which to sell the contract, or 0 for 'sell at market'.
-                req_id : int
-                    [Optional] Used to map request to response.
-                sell : int
-                    Pass contract_id received from the portfolio call.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'price': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'sell': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'sell',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def sell_contract_for_multiple_accounts(self, args=None):
-        """
-        Sell contracts for multiple accounts simultaneously. Uses the shortcode response from `buy_contract_for_multiple_accounts` to identify the contract, and authorisation tokens to select which accounts to sell those contracts on. Note that only the accounts identified by the tokens will be affected. This will not sell the contract on the currently-authorised account unless you include the token for the current account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                price : Number
-                    Minimum price at which to sell the contract, or 0 for 'sell at market'.
-                req_id : int
-                    [Optional] Used to map request to response.
-                sell_contract_for_multiple_accounts : int
-                    Must be 1
-                shortcode : str
-                    An internal ID used to identify the contract which was originally bought. This is returned from the buy and buy_contract_for_multiple_accounts calls.
-                tokens : Any
-                    Authorisation tokens which select the accounts to sell use for the affected accounts.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'price': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'sell_contract_for_multiple_accounts': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'shortcode': {
-                'required': 1,
-                'type': 'string'
-            },
-            'tokens': {
-                'required': 1
-            }
-        }
-
-        all_args = {
-            'method': 'sell_contract_for_multiple_accounts',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def sell_expired(self, args=None):
-        """
-        This call will try to sell any expired contracts and return the number of sold contracts.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                sell_expired : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'sell_expired': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'sell_expired',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def set_account_currency(self, args=None):
-        """
-        Set account currency, this will be default currency for your account i.e currency for trading, deposit. Please note that account currency can only be set once, and then can never be changed.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                set_account_currency : str
-                    Currency of the account. List of supported currencies can be acquired with payout_currencies call.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'set_account_currency': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'set_account_currency',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def set_financial_assessment(self, args=None):
-        """
-        This call sets the financial assessment details based on the client's answers to analyze whether they possess the experience and knowledge to understand the risks involved with binary options trading.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_turnover : str
-                    [Optional] The anticipated account turnover.
-                binary_options_trading_experience : str
-                    [Optional] Binary options trading experience.
-                binary_options_trading_frequency : str
-                    [Optional] Binary options trading frequency.
-                cfd_trading_experience : str
-                    [Optional] CFDs trading experience.
-                cfd_trading_frequency : str
-                    [Optional] CFDs trading frequency.
-                education_level : str
-                    [Optional] Level of Education.
-                employment_industry : str
-                    [Optional] Industry of Employment.
-                employment_status : str
-                    [Optional] Employment Status.
-                estimated_worth : str
-                    [Optional] Estimated Net Worth.
-                financial_information : Any
-                forex_trading_experience : str
-                    [Optional] Forex trading experience.
-                forex_trading_frequency : str
-                    [Optional] Forex trading frequency.
-                income_source : str
-                    [Optional] Income Source.
-                net_income : str
-                    [Optional] Net Annual Income.
-                occupation : str
-                    [Optional] Occupation.
-                other_instruments_trading_experience : str
-                    [Optional] Trading experience in other financial instruments.
-                other_instruments_trading_frequency : str
-                    [Optional] Trading frequency in other financial instruments.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                set_financial_assessment : int
-                    Must be 1
-                source_of_wealth : str
-                    [Optional] Source of wealth.
-                trading_experience : Any
-                trading_experience_regulated : Any
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_turnover': {
-                'type': 'string'
-            },
-            'binary_options_trading_experience': {
-                'type': 'string'
-            },
-            'binary_options_trading_frequency': {
-                'type': 'string'
-            },
-            'cfd_trading_experience': {
-                'type': 'string'
-            },
-            'cfd_trading_frequency': {
-                'type': 'string'
-            },
-            'education_level': {
-                'type': 'string'
-            },
-            'employment_industry': {
-                'type': 'string'
-            },
-            'employment_status': {
-                'type': 'string'
-            },
-            'estimated_worth': {
-                'type': 'string'
-            },
-            'financial_information': {
-                'account_turnover': {
-                    'type': 'string'
-                },
-                'education_level': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'employment_industry': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'employment_status': {
-                    'type': 'string'
-                },
-                'estimated_worth': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'income_source': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'net_income': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'occupation': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'source_of_wealth': {
-                    'type': 'string'
-                }
-            },
-            'forex_trading_experience': {
-                'type': 'string'
-            },
-            'forex_trading_frequency': {
-                'type': 'string'
-            },
-            'income_source': {
-                'type': 'string'
-            },
-            'net_income': {
-                'type': 'string'
-            },
-            'occupation': {
-                'type': 'string'
-            },
-            'other_instruments_trading_experience': {
-                'type': 'string'
-            },
-            'other_instruments_trading_frequency': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'set_financial_assessment': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'source_of_wealth': {
-                'type': 'string'
-            },
-            'trading_experience': {
-                'binary_options_trading_experience': {
-                    'type': 'string'
-                },
-                'binary_options_trading_frequency': {
-                    'type': 'string'
-                },
-                'cfd_trading_experience': {
-                    'type': 'string'
-                },
-                'cfd_trading_frequency': {
-                    'type': 'string'
-                },
-                'forex_trading_experience': {
-                    'type': 'string'
-                },
-                'forex_trading_frequency': {
-                    'type': 'string'
-                },
-                'other_instruments_trading_experience': {
-                    'type': 'string'
-                },
-                'other_instruments_trading_frequency': {
-                    'type': 'string'
-                }
-            },
-            'trading_experience_regulated': {
-                'cfd_experience': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'cfd_frequency': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'cfd_trading_definition': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'leverage_impact_trading': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'leverage_trading_high_risk_stop_loss': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'required_initial_margin': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'risk_tolerance': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'source_of_experience': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'trading_experience_financial_instruments': {
-                    'required': 1,
-                    'type': 'string'
-                },
-                'trading_frequency_financial_instruments': {
-                    'required': 1,
-                    'type': 'string'
-                }
-            }
-        }
-
-        all_args = {
-            'method': 'set_financial_assessment',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def set_self_exclusion(self, args=None):
-        """
-        Set Self-Exclusion (this call should be used in conjunction with `get_self_exclusion`)
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                exclude_until : Any
-                    [Optional] Exclude me from the website (for a minimum of 6 months, up to a maximum of 5 years). Note: uplifting this self-exclusion may require contacting the company.
-                max_30day_deposit : Any
-                    [Optional] 7-day limit on deposits.
-                max_30day_losses : Any
-                    [Optional] 30-day limit on losses.
-                max_30day_turnover : Any
-                    [Optional] 30-day turnover limit.
-                max_7day_deposit : Any
-                    [Optional] 7-day limit on deposits.
-                max_7day_losses : Any
-                    [Optional] 7-day limit on losses.
-                max_7day_turnover : Any
-                    [Optional] 7-day turnover limit.
-                max_balance : Any
-                    [Optional] Maximum account cash balance.
-                max_deposit : Any
-                    [Optional] Daily deposit limit.
-                max_losses : Any
-                    [Optional] Daily limit on losses.
-                max_open_bets : Any
-                    [Optional] Maximum number of open positions.
-                max_turnover : Any
-                    [Optional] Daily turnover limit.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                session_duration_limit : Any
-                    [Optional] Session duration limit, in minutes.
-                set_self_exclusion : int
-                    Must be 1
-                timeout_until : Any
-                    [Optional] Exclude me from the website (for up to 6 weeks). Requires time in epoch format. Note: unlike exclude_until, this self-exclusion will be lifted automatically at the expiry of the timeout period.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'exclude_until': {},
-            'max_30day_deposit': {},
-            'max_30day_losses': {},
-            'max_30day_turnover': {},
-            'max_7day_deposit': {},
-            'max_7day_losses': {},
-            'max_7day_turnover': {},
-            'max_balance': {},
-            'max_deposit': {},
-            'max_losses': {},
-            'max_open_bets': {},
-            'max_turnover': {},
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'session_duration_limit': {},
-            'set_self_exclusion': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'timeout_until': {}
-        }
-
-        all_args = {
-            'method': 'set_self_exclusion',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def set_settings(self, args=None):
-        """
-        Set User Settings (this call should be used in conjunction with `get_settings`)
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_opening_reason : str
-                    [Optional] Purpose and reason for requesting the account opening. Only applicable for real money account. Required for clients that have not set it yet. Can only be set once.
-                address_city : str
-                    [Optional] Note: not applicable for virtual account. Required field for real money account.
-                address_line_1 : str
-                    [Optional] Note: not applicable for virtual account. Required field for real money account.
-                address_line_2 : Any
-                    [Optional] Note: not applicable for virtual account. Optional field for real money account.
-                address_postcode : str
-                    [Optional] Note: not applicable for virtual account. Optional field for real money account.
-                address_state : str
-                    [Optional] Note: not applicable for virtual account. Optional field for real money account.
-                allow_copiers : int
-                    [Optional] Boolean value 1 or 0, indicating permission to allow others to follow your trades. Note: not applicable for Virtual account. Only allow for real money account.
-                citizen : Any
-                    [Optional] Country of legal citizenship, 2-letter country code.
-                date_of_birth : str
-                    [Optional] Date of birth format: yyyy-mm-dd (can only be changed on unauthenticated svg accounts).
-                dxtrade_user_exception : int
-                    Boolean value 1 or 0, indicating if user email belong to dxtrade exception list.
-                email_consent : int
-                    [Optional] Boolean value 1 or 0, indicating permission to use email address for any contact which may include marketing
-                employment_status : str
-                    [Optional] Employment Status.
-                feature_flag : Any
-                first_name : str
-                    [Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes (can only be changed on unauthenticated svg accounts).
-                last_name : str
-                    [Optional] Within 2-50 characters, use only letters, spaces, hyphens, full-stops or apostrophes (can only be changed on unauthenticated svg accounts).
-                non_pep_declaration : int
-                    [Optional] Indicates client's self-declaration of not being a PEP/RCA (Politically Exposed Person/Relatives and Close Associates). Effective for real accounts only.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                phone : Any
-                    [Optional] Note: not applicable for virtual account. Starting with + followed by 9-35 digits, hyphens or space.
-                place_of_birth : str
-                    [Optional] Place of birth, 2-letter country code.
-                preferred_language : Any
-                    [Optional] User's preferred language, ISO standard language code
-                req_id : int
-                    [Optional] Used to map request to response.
-                request_professional_status : int
-                    [Optional] Required when client wants to be treated as professional. Applicable for financial accounts only.
-                residence : Any
-                    [Optional] 2-letter country code. Note: not applicable for real money account. Only allow for Virtual account without residence set.
-                salutation : str
-                    [Optional] Accept any value in enum list (can only be changed on unauthenticated svg accounts).
-                secret_answer : str
-                    [Optional] Answer to secret question, within 4-50 characters. Required for new account and existing client details will be used if client opens another account.
-                secret_question : str
-                    [Optional] Accept any value in enum list. Required for new account and existing client details will be used if client opens another account.
-                set_settings : int
-                    Must be 1
-                tax_identification_number : str
-                    [Optional] Tax identification number. Only applicable for real money account. Required for maltainvest landing company.
-                tax_residence : str
-                    [Optional] Residence for tax purpose. Comma separated iso country code if multiple jurisdictions. Only applicable for real money account. Required for maltainvest landing company.
-                trading_hub : int
-                    [Optional] Enable/Disable Trading Hub dashboard
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_opening_reason': {
-                'type': 'string'
-            },
-            'address_city': {
-                'type': 'string'
-            },
-            'address_line_1': {
-                'type': 'string'
-            },
-            'address_line_2': {},
-            'address_postcode': {
-                'type': 'string'
-            },
-            'address_state': {
-                'type': 'string'
-            },
-            'allow_copiers': {
-                'type': 'integer'
-            },
-            'citizen': {},
-            'date_of_birth': {
-                'type': 'string'
-            },
-            'dxtrade_user_exception': {
-                'type': 'integer'
-            },
-            'email_consent': {
-                'type': 'integer'
-            },
-            'employment_status': {
-                'type': 'string'
-            },
-            'feature_flag': {
-                'wallet': {
-                    'type': 'integer'
-                }
-            },
-            'first_name': {
-                'type': 'string'
-            },
-            'last_name': {
-                'type': 'string'
-            },
-            'non_pep_declaration': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'phone': {},
-            'place_of_birth': {
-                'type': 'string'
-            },
-            'preferred_language': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'request_professional_status': {
-                'type': 'integer'
-            },
-            'residence': {},
-            'salutation': {
-                'type': 'string'
-            },
-            'secret_answer': {
-                'type': 'string'
-            },
-            'secret_question': {
-                'type': 'string'
-            },
-            'set_settings': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'tax_identification_number': {
-                'type': 'string'
-            },
-            'tax_residence': {
-                'type': 'string'
-            },
-            'trading_hub': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'set_settings',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def statement(self, args=None):
-        """
-        Retrieve a summary of account transactions, according to given search criteria
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                action_type : str
-                    [Optional] To filter the statement according to the type of transaction.
-                date_from : int
-                    [Optional] Start date (epoch)
-                date_to : int
-                    [Optional] End date (epoch)
-                description : int
-                    [Optional] If set to 1, will return full contracts description.
-                limit : Number
-                    [Optional] Maximum number of transactions to receive.
-                offset : int
-                    [Optional] Number of transactions to skip.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                statement : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'action_type': {
-                'type': 'string'
-            },
-            'date_from': {
-                'type': 'integer'
-            },
-            'date_to': {
-                'type': 'integer'
-            },
-            'description': {
-                'type': 'integer'
-            },
-            'limit': {
-                'type': 'numeric'
-            },
-            'offset': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'statement': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'statement',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def states_list(self, args=None):
-        """
-        For a given country, returns a list of States of that country. This is useful to populate the account opening form.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                states_list : str
-                    Client's 2-letter country code (obtained from residence_list call)
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'states_list': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'states_list',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def ticks(self, args=None):
-        """
-        Initiate a continuous stream of spot price updates for a given symbol.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] If set to 1, will send updates whenever a new tick is received.
-                ticks : Any
-                    The short symbol name or array of symbols (obtained from active_symbols call).
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            },
-            'ticks': {
-                'required': 1
-            }
-        }
-
-        all_args = {
-            'method': 'ticks',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def ticks_history(self, args=None):
-        """
-        Get historic tick data for a given symbol.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                adjust_start_time : int
-                    [Optional] 1 - if the market is closed at the end time, or license limit is before end time, adjust interval backwards to compensate.
-                count : int
-                    [Optional] An upper limit on ticks to receive.
-                end : str
-                    Epoch value representing the latest boundary of the returned ticks. If latest is specified, this will be the latest available timestamp.
-                granularity : int
-                    [Optional] Only applicable for style: candles. Candle time-dimension width setting. (default: 60).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                start : int
-                    [Optional] Epoch value representing the earliest boundary of the returned ticks. 
-- For "style": "ticks": this will default to 1 day ago.
-- For "style": "candles": it will default to 1 day ago if count or granularity is undefined.
-                style : str
-                    [Optional] The tick-output style.
-                subscribe : int
-                    [Optional] 1 - to send updates whenever a new tick is received.
-                ticks_history : str
-                    Short symbol name (obtained from the active_symbols call).
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'adjust_start_time': {
-                'type': 'integer'
-            },
-            'count': {
-                'type': 'integer'
-            },
-            'end': {
-                'required': 1,
-                'type': 'string'
-            },
-            'granularity': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'start': {
-                'type': 'integer'
-            },
-            'style': {
-                'type': 'string'
-            },
-            'subscribe': {
-                'type': 'integer'
-            },
-            'ticks_history': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'ticks_history',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def time(self, args=None):
-        """
-        Request back-end server epoch time.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                time : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'time': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'time',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def tnc_approval(self, args=None):
-        """
-        To approve the latest version of terms and conditions.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                affiliate_coc_agreement : int
-                    [Optional] For Affiliate's Code of Conduct Agreement.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                tnc_approval : Number
-                    Must be 1
-                ukgc_funds_protection : int
-                    [Optional] For ASK_UK_FUNDS_PROTECTION in cashier.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'affiliate_coc_agreement': {
-                'type': 'integer'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'tnc_approval': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'ukgc_funds_protection': {
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'tnc_approval',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def topup_virtual(self, args=None):
-        """
-        When a virtual-money's account balance becomes low, it can be topped up using this call.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                topup_virtual : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'topup_virtual': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'topup_virtual',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def trading_durations(self, args=None):
-        """
-        Retrieve a list of all available underlyings and the corresponding contract types and trading duration boundaries. If the user is logged in, only the assets available for that user's landing company will be returned.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                landing_company : str
-                    Deprecated - Replaced by landing_company_short.
-                landing_company_short : str
-                    [Optional] If specified, will return only the underlyings for the specified landing company.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                trading_durations : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'landing_company': {
-                'type': 'string'
-            },
-            'landing_company_short': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'trading_durations': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'trading_durations',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def trading_platform_investor_password_reset(self, args=None):
-        """
-        Reset the investor password of a Trading Platform Account
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_id : str
-                    Trading account ID.
-                new_password : str
-                    New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                platform : str
-                    Name of trading platform.
-                req_id : int
-                    [Optional] Used to map request to response.
-                trading_platform_investor_password_reset : int
-                    Must be 1
-                verification_code : str
-                    Email verification code (received from a verify_email call, which must be done first)
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_id': {
-                'required': 1,
-                'type': 'string'
-            },
-            'new_password': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'platform': {
-                'required': 1,
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'trading_platform_investor_password_reset': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'verification_code': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'trading_platform_investor_password_reset',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def trading_platform_password_reset(self, args=None):
-        """
-        Reset the password of a Trading Platform Account
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                new_password : str
-                    New password of the account. For validation (Accepts any printable ASCII character. Must be within 8-25 characters, and include numbers, lowercase and uppercase letters. Must not be the same as the user's email address).
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                platform : str
-                    Name of trading platform.
-                req_id : int
-                    [Optional] Used to map request to response.
-                trading_platform_password_reset : int
-                    Must be 1
-                verification_code : str
-                    Email verification code (received from a verify_email call, which must be done first)
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'new_password': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'platform': {
-                'required': 1,
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'trading_platform_password_reset': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'verification_code': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'trading_platform_password_reset',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def trading_servers(self, args=None):
-        """
-        Get the list of servers for a trading platform.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_type : str
-                    [Optional] Trading account type.
-                environment : str
-                    [Optional] Pass the environment (installation) instance. Currently, there are one demo and two real environments. Defaults to 'all'.
-                market_type : str
-                    [Optional] Market type.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                platform : str
-                    [Optional] Pass the trading platform name, default to mt5
-                req_id : int
-                    [Optional] Used to map request to response.
-                trading_servers : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_type': {
-                'type': 'string'
-            },
-            'environment': {
-                'type': 'string'
-            },
-            'market_type': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'platform': {
-                'type': 'string'
-            },
-            'req_id': {
-                'type': 'integer'
-            },
-            'trading_servers': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'trading_servers',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def trading_times(self, args=None):
-        """
-        Receive a list of market opening times for a given date.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                trading_times : str
-                    Date to receive market opening times for. (yyyy-mm-dd format. today can also be specified).
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'trading_times': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'trading_times',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def transaction(self, args=None):
-        """
-        Subscribe to transaction notifications
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    If set to 1, will send updates whenever there is an update to transactions. If not to 1 then it will not return any records.
-                transaction : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'required': 1,
-                'type': 'integer'
-            },
-            'transaction': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'transaction',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def transfer_between_accounts(self, args=None):
-        """
-        This call allows transfers between accounts held by a given user. Transfer funds between your fiat and cryptocurrency accounts (for a fee). Please note that account_from should be same as current authorized account.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                account_from : str
-                    [Optional] The loginid of the account to transfer funds from.
-                account_to : str
-                    [Optional] The loginid of the account to transfer funds to.
-                accounts : str
-                    [Optional] To control the list of accounts returned when account_from or account_to is not provided. brief (default value) means that accounts with mt5 account_type will be excluded; it will run faster. all means that all accounts with any account_type (including mt5) will be returned.
-                amount : Number
-                    [Optional] The amount to transfer.
-                currency : str
-                    [Optional] Currency code.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                transfer_between_accounts : int
-                    If account_from or account_to is not provided, it just returns the available accounts.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'account_from': {
-                'type': 'string'
-            },
-            'account_to': {
-                'type': 'string'
-            },
-            'accounts': {
-                'type': 'string'
-            },
-            'amount': {
-                'type': 'numeric'
-            },
-            'currency': {
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'transfer_between_accounts': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'transfer_between_accounts',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def unsubscribe_email(self, args=None):
-        """
-        It unsubscribe user from the email subscription.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                binary_user_id : Number
-                    Customer User ID.
-                checksum : str
-                    The generated checksum for the customer.
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                unsubscribe_email : int
-                    Must be 1
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'binary_user_id': {
-                'required': 1,
-                'type': 'numeric'
-            },
-            'checksum': {
-                'required': 1,
-                'type': 'string'
-            },
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'unsubscribe_email': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
-
-        all_args = {
-            'method': 'unsubscribe_email',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def verify_email(self, args=None):
-        """
-        Verify an email address for various purposes. The system will send an email to the address containing a security code for verification.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                type : str
-                    Purpose of email verification, request_email and reset_password are the only two types restricted from all unoffical apps
-                url_parameters : Any
-                verify_email : str
-                    Email address to be verified.
-        """
-
-        if args is None:
-            args = {}
-
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'type': {
-                'required': 1,
-                'type': 'string'
-            },
-            'url_parameters': {
-                'affiliate_token': {
-                    'type': 'string'
-                },
-                'date_first_contact': {
-                    'type': 'string'
-                },
-                'gclid_url': {
-                    'type': 'string'
-                },
-                'pa_amount': {
-                    'type': 'numeric'
-                },
-                'pa_currency': {
-                    'type': 'string'
-                },
-                'pa_loginid': {
-                    'type': 'string'
-                },
-                'pa_remarks': {
-                    'type': 'string'
-                },
-                'redirect_to': {
-                    'type': 'integer'
-                },
-                'signup_device': {
-                    'type': 'string'
-                },
-                'utm_ad_id': {},
-                'utm_adgroup_id': {},
-                'utm_adrollclk_id': {},
-                'utm_campaign': {},
-                'utm_campaign_id': {},
-                'utm_content': {},
-                'utm_fbcl_id': {},
-                'utm_gl_client_id': {},
-                'utm_medium': {},
-                'utm_msclk_id': {},
-                'utm_source': {},
-                'utm_term': {}
-            },
-            'verify_email': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
-
-        all_args = {
-            'method': 'verify_email',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
-
-        return await self.process_request(all_args)
-
-    async def verify_email_cellxpert(self, args=None):
-        """
-        Verify an email address for Cellxpert. The system will send an email to the address containing a security code for verification.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                type : str
-                    Purpose of the email verification call.
-                url_parameters : Any
-                verify_email_cellxpert : str
-                    Email address to be verified.
-        """
-
-        if args is None:
-            args = {}
+    def __getattr__(cls, name):
+        if name not in _api_method_rows:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        for owner in cls.__mro__:
+            if '_make_api_method' in vars(owner):
+                break
+        method = owner._make_api_method(name)
+        setattr(owner, name, method)
+        return method
 
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'type': {
-                'required': 1,
-                'type': 'string'
-            },
-            'url_parameters': {
-                'affiliate_token': {
-                    'type': 'string'
-                },
-                'bta': {
-                    'type': 'integer'
-                },
-                'date_first_contact': {
-                    'type': 'string'
-                },
-                'gclid_url': {
-                    'type': 'string'
-                },
-                'pa_amount': {
-                    'type': 'numeric'
-                },
-                'pa_currency': {
-                    'type': 'string'
-                },
-                'pa_loginid': {
-                    'type': 'string'
-                },
-                'pa_remarks': {
-                    'type': 'string'
-                },
-                'redirect_to': {
-                    'type': 'integer'
-                },
-                'signup_device': {
-                    'type': 'string'
-                },
-                'utm_ad_id': {},
-                'utm_adgroup_id': {},
-                'utm_adrollclk_id': {},
-                'utm_campaign': {},
-                'utm_campaign_id': {},
-                'utm_content': {},
-                'utm_fbcl_id': {},
-                'utm_gl_client_id': {},
-                'utm_medium': {},
-                'utm_msclk_id': {},
-                'utm_source': {},
-                'utm_term': {}
-            },
-            'verify_email_cellxpert': {
-                'required': 1,
-                'type': 'string'
-            }
-        }
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(_api_method_rows))
 
-        all_args = {
-            'method': 'verify_email_cellxpert',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
 
-        return await self.process_request(all_args)
+class APIMethods(metaclass=APIMethodsType):
+    """
+    Base of the classes with the API methods. `_make_api_method` builds a method from its name, the built methods
+    are set on the class that defines `_make_api_method`
+    """
 
-    async def website_status(self, args=None):
+    @staticmethod
+    @abstractmethod
+    def _make_api_method(name):
         """
-        Request server status.
-
-        Parameters:
-        -----------
-            args : dict with following keys
-                passthrough : Any
-                    [Optional] Used to pass data through the websocket, which may be retrieved via the echo_req output field. Maximum size is 3500 bytes.
-                req_id : int
-                    [Optional] Used to map request to response.
-                subscribe : int
-                    [Optional] 1 to stream the server/website status updates.
-                website_status : int
-                    Must be 1
+        Build the API method of the given name
         """
 
-        if args is None:
-            args = {}
+    def __getattr__(self, name):
+        if name not in _api_method_rows:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return getattr(type(self), name).__get__(self, type(self))
 
-        config = {
-            'passthrough': {},
-            'req_id': {
-                'type': 'integer'
-            },
-            'subscribe': {
-                'type': 'integer'
-            },
-            'website_status': {
-                'required': 1,
-                'type': 'integer'
-            }
-        }
 
-        all_args = {
-            'method': 'website_status',
-            'needs_method_arg': '1',
-            'args': args,
-            'config': config,
-        }
+class DerivAPICalls(APIMethods):
 
-        return await self.process_request(all_args)
+    @staticmethod
+    def _make_api_method(name):
+        return async_api_method(name)
 
     async def process_request(self, all_args):
         """
         Process request
         """
 
-        config = all_args['config']
-        parsed_args = parse_args(all_args)
-        error = validate_args(config=config, args=parsed_args)
+        parsed_args, error = all_args['check'](all_args['args'])
         if error:
             raise ValueError(error)
         return await self.send(parsed_args)
@@ -6981,6 +1208,14 @@ class DerivAPICalls:
 __pdoc__ = {
     'parse_args' : False,
     'validate_args' : False,
+    'api_method_of' : False,
+    'takes_loginid' : False,
+    'api_method_doc' : False,
+    'api_method_check' : False,
+    'async_api_method' : False,
+    'APIMethodsType' : False,
+    'APIMethods' : False,
+    '_check_generic' : False,
     'deriv_api.deriv_api_calls.DerivAPICalls.process_request' : False
 }
 
@@ -6991,12 +1226,12 @@ def parse_args(all_args):
 
     parsed_args = all_args['args']
     method = all_args['method']
-    
+
     if all_args['needs_method_arg'] and not(isinstance(parsed_args, dict)):
         parsed_args = {method: parsed_args}
 
     parsed_args[method] = parsed_args.get(method, 1)
-    
+
     config = all_args['config']
     for param in parsed_args:
         value = parsed_args[param]
@@ -7008,7 +1243,7 @@ def parse_args(all_args):
             parsed_args[param] = f'{value}'
         elif ptype and (ptype == 'numeric' or ptype == 'boolean'):
             parsed_args[param] = int(float(value))
-            
+
     return parsed_args
 
 
@@ -7048,3 +1283,125 @@ def validate_args(config, args):
             error_messages.append(f'{expected_type} value expected but found {type(value)}: {param}')
 
     return ' - '.join(error_messages) if len(error_messages) else ''
+
+
+def _check_generic(method, args, config):
+    """
+    Parse and validate request args with parse_args and validate_args
+    """
+
+    parsed_args = parse_args({'method': method, 'needs_method_arg': '1', 'args': args, 'config': config})
+    return parsed_args, validate_args(config=config, args=parsed_args)
+
+
+def api_method_of(request):
+    """
+    Find the API method of a request from its keys. A key that is an API method and also a parameter of another method
+    of the request, like landing_company of active_symbols, is taken as the parameter
+    """
+
+    names = [key for key in request if key in _api_method_rows]
+    if len(names) > 1:
+        params = {param for name in names for param, _, _, _ in _api_method_rows[name][3] if param != name}
+        names = [name for name in names if name not in params] or names
+    return names[0] if names else None
+
+
+def takes_loginid(request):
+    """
+    Check if the API method of a request acts on an account, so the request takes the loginid of the account
+    """
+
+    return api_method_of(request) in _account_methods
+
+
+def api_method_doc(name):
+    """
+    Build the docstring of an API method from its row
+    """
+
+    _, description, _, params = _api_method_rows[name]
+    lines = ['', f'        {description}', '', '        Parameters:', '        -----------',
+             '            args : dict ' + ('with following keys' if params else '')]
+    for param, ptype, _, param_description in params:
+        lines.append(f'                {param} : {_py_types.get(ptype, "Any")}')
+        if param_description:
+            lines.append(f'                    {param_description}')
+    lines.append('        ')
+    return '\n'.join(lines)
+
+
+def api_method_check(name):
+    """
+    Build the config of an API method and its argument checker. The checker is parse_args and validate_args
+    specialised for the method. Unknown arguments, coercion errors and invalid arguments take the generic path, so the
+    results and the error messages are the same.
+    """
+
+    if name in _api_method_checks:
+        return _api_method_checks[name]
+
+    _, _, _, params = _api_method_rows[name]
+    config = {}
+    for param, ptype, required, _ in params:
+        config[param] = MappingProxyType({**({'required': 1} if required else {}), **({'type': ptype} if ptype else {})})
+    config = MappingProxyType(config)
+    known = frozenset(config)
+    required = frozenset(param for param, value in config.items() if 'required' in value)
+    ptypes = {param: value['type'] for param, value in config.items() if 'type' in value}
+
+    def check(args):
+        if not isinstance(args, dict):
+            args = {name: args}
+        args[name] = args.get(name, 1)
+        if not known.issuperset(args):
+            return _check_generic(name, args, config)
+        valid = required.issubset(args)
+        try:
+            for param, value in args.items():
+                ptype = ptypes.get(param)
+                if ptype == 'string':
+                    if type(value) is not str:
+                        args[param] = f'{value}'
+                elif ptype == 'numeric' or ptype == 'boolean':
+                    value = args[param] = int(float(value))
+                    if ptype == 'boolean' and value not in (0, 1):
+                        valid = False
+                elif ptype == 'integer' and not isinstance(value, int):
+                    valid = False
+        except Exception:
+            return _check_generic(name, args, config)
+        if not valid:
+            return args, validate_args(config=config, args=args)
+        return args, ''
+
+    _api_method_checks[name] = (config, check)
+    return _api_method_checks[name]
+
+
+def async_api_method(name):
+    """
+    Build the coroutine function of an API method
+    """
+
+    _, _, needs_method_arg, _ = _api_method_rows[name]
+    config, check = api_method_check(name)
+
+    async def api_method(self, args=None):
+        if args is None:
+            args = {}
+
+        all_args = {
+            'method': name,
+            'needs_method_arg': needs_method_arg,
+            'args': args,
+            'config': config,
+            'check': check,
+        }
+
+        return await self.process_request(all_args)
+
+    api_method.__name__ = name
+    api_method.__qualname__ = f'DerivAPICalls.{name}'
+    api_method.__doc__ = api_method_doc(name)
+    return api_method
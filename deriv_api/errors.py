@@ -19,6 +19,10 @@ class ConstructionError(error_factory('ConstructionError')):
     pass
 
 
+class RequestTimeoutError(error_factory('RequestTimeoutError')):
+    pass
+
+
 class ResponseError(Exception):
     def __init__(self, response: dict):
         super().__init__(response['error']['message'])
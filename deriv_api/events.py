@@ -0,0 +1,97 @@
+from typing import Any, Dict, Optional
+
+from reactivex import Observable, abc
+from reactivex.subject import Subject
+
+__pdoc__ = {
+    'deriv_api.events.Events.emit': False,
+    'deriv_api.events.Events.on_next': False,
+}
+
+
+class Events(Observable):
+    """
+        Events - the event bus of the API
+
+        Subscribing to it directly receives every event. Each event name also has its own channel, so a listener of one
+        event is not called for the others. An event is only built and dispatched when somebody observes it.
+
+        Example
+        -------
+        - print all events
+        >>> api.events.subscribe(print)
+
+        - print the sent requests only
+        >>> api.events.on('send').subscribe(print)
+        """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.all: Subject = Subject()
+        self.channels: Dict[str, Subject] = {}
+
+    def _subscribe_core(self, observer: abc.ObserverBase, scheduler: Optional[abc.SchedulerBase] = None
+                        ) -> abc.DisposableBase:
+        return self.all.subscribe(observer, scheduler=scheduler)
+
+    def on(self, name: str) -> Observable:
+        """
+        The channel of one event
+
+        Parameters
+        ----------
+        name : str
+            Event name, e.g. 'connect', 'send', 'message'
+
+        Returns
+        -------
+            Observable that receives the events with this name only
+        """
+        if name not in self.channels:
+            self.channels[name] = Subject()
+        return self.channels[name]
+
+    def has_observers(self, name: str) -> bool:
+        """
+        Check if an event is observed
+
+        Parameters
+        ----------
+        name : str
+            Event name
+
+        Returns
+        -------
+            True if there is a listener of all events or of this event
+        """
+        channel = self.channels.get(name)
+        return bool(self.all.observers or (channel and channel.observers))
+
+    def emit(self, name: str, data: Any = None) -> None:
+        """
+        Dispatch an event if it is observed
+
+        Parameters
+        ----------
+        name : str
+            Event name
+        data : Any
+            Event data
+        """
+        channel = self.channels.get(name)
+        if not (self.all.observers or (channel and channel.observers)):
+            return
+        event = {'name': name} if data is None else {'name': name, 'data': data}
+        if channel:
+            channel.on_next(event)
+        self.all.on_next(event)
+
+    def on_next(self, event: dict) -> None:
+        """
+        Dispatch an event dict with `name` and optional `data` keys
+
+        Parameters
+        ----------
+        event : dict
+        """
+        self.emit(event['name'], event.get('data'))
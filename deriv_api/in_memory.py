@@ -14,13 +14,13 @@ class InMemory:
         self.store = {}
         self.type_store = {}
 
-    def has(self, key: bytes) -> bool:
+    def has(self, key: tuple) -> bool:
         """
         Check the key exists in the store and returns true if exists.
 
         Parameters
         ----------
-        key : bytes
+        key : tuple
             Request object key
 
         Returns
@@ -29,18 +29,18 @@ class InMemory:
         """
         return key in self.store
 
-    # we should serialize key (utils/dict_to_cache_key) before we store it
+    # we should make the key (utils/request_key) before we store it
     # At first I want to use it directly here.
     # But from js version of deriv-api logic, user can choose cache object freely.
     # So we shouldn't suppose other cache module will serialize the key.
     # So we should always call serialize in the caller module
-    def get(self, key: bytes) -> dict:
+    def get(self, key: tuple) -> dict:
         """
         Get the response stored in for the given request by key
 
         Parameters
         ----------
-        key : bytes
+        key : tuple
             Request of object key
 
         Returns
@@ -64,13 +64,13 @@ class InMemory:
         """
         return self.type_store.get(msg_type)
 
-    def set(self, key: bytes, value: dict) -> None:
+    def set(self, key: tuple, value: dict) -> None:
         """
         Stores the response of the given request
 
         Parameters
         ----------
-        key : bytes
+        key : tuple
             Request object key
         value : dict
             Response object received from api
@@ -0,0 +1,140 @@
+import re
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, Optional
+
+__pdoc__ = {
+    'deriv_api.lazy_response.peek_req_id': False,
+    'deriv_api.lazy_response.peek_msg_type': False,
+}
+
+_req_id_re = re.compile(r'"req_id"\s*:\s*(\d+)')
+_msg_type_re = re.compile(r'"msg_type"\s*:\s*"([^"]*)"')
+_subscription_id_re = re.compile(r'"subscription"\s*:\s*\{\s*"id"\s*:\s*"([^"]*)"')
+
+
+def peek_req_id(data: str) -> Optional[int]:
+    """
+    Find the req_id of a response frame without decoding it
+
+    Parameters
+    ----------
+    data : str
+        Raw response frame
+
+    Returns
+    -------
+        The req_id, or None if the frame should be fully decoded: no req_id, different req_id values (e.g. in
+        passthrough) or an error response
+    """
+    req_ids = _req_id_re.findall(data)
+    if not req_ids or '"error"' in data:
+        return None
+    req_id = req_ids[0]
+    for other in req_ids:
+        if other != req_id:
+            return None
+    return int(req_id)
+
+
+def peek_msg_type(data: str) -> Optional[str]:
+    """
+    Find the msg_type of a response frame without decoding it
+
+    Parameters
+    ----------
+    data : str
+        Raw response frame
+
+    Returns
+    -------
+        The msg_type, or None if it is not found or there are different msg_type values (e.g. in passthrough)
+    """
+    msg_types = set(_msg_type_re.findall(data))
+    if len(msg_types) != 1:
+        return None
+    return msg_types.pop()
+
+
+class LazyResponse(Mapping):
+    """
+        LazyResponse - a response that is decoded on first read
+
+        It behaves as a read-only dict of the response. The raw frame is kept in `raw`, so consumers that forward the
+        frames somewhere else never pay for decoding them. `msg_type` and `subscription_id` are peeked from the raw
+        frame without decoding it, unless the frame has more than one value for them.
+
+        Parameters
+        ----------
+            raw : str
+                Raw response frame
+            loads : Callable
+                Decoder of the frame
+            req_id : int
+                req_id of the frame
+
+        Example
+        -------
+        >>> api = DerivAPI(app_id=1234, lazy_decode=True)
+        >>> ticks = await api.subscribe({'ticks': 'R_100'})
+        >>> ticks.subscribe(lambda response: downstream.send(response.raw))
+        """
+
+    __slots__ = ('raw', 'req_id', '_loads', '_data')
+
+    def __init__(self, raw: str, loads: Callable[[str], dict], req_id: Optional[int] = None) -> None:
+        self.raw = raw
+        self.req_id = req_id
+        self._loads = loads
+        self._data: Optional[dict] = None
+
+    def decode(self) -> dict:
+        """
+        Decode the frame
+
+        Returns
+        -------
+            The response dict
+        """
+        if self._data is None:
+            self._data = self._loads(self.raw)
+        return self._data
+
+    @property
+    def msg_type(self) -> Optional[str]:
+        if self._data is not None:
+            return self._data.get('msg_type')
+        msg_type = peek_msg_type(self.raw)
+        if msg_type is None:
+            # missing or ambiguous (e.g. in passthrough), only the decoded frame knows
+            return self.decode().get('msg_type')
+        return msg_type
+
+    @property
+    def subscription_id(self) -> Optional[str]:
+        if self._data is not None:
+            return (self._data.get('subscription') or {}).get('id')
+        subscription_ids = set(_subscription_id_re.findall(self.raw))
+        if len(subscription_ids) == 1:
+            return subscription_ids.pop()
+        if not subscription_ids and '"subscription"' not in self.raw:
+            return None
+        # ambiguous (e.g. in passthrough) or written in a way the pattern does not match, decode it
+        return (self.decode().get('subscription') or {}).get('id')
+
+    def __getitem__(self, key: str) -> Any:
+        return self.decode()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.decode())
+
+    def __len__(self) -> int:
+        return len(self.decode())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.decode()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.decode().get(key, default)
+
+    def __repr__(self) -> str:
+        return f'LazyResponse({self.raw})'
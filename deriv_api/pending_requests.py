@@ -0,0 +1,242 @@
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+from asyncio import Future
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple, Union
+
+from reactivex.subject import Subject
+
+from deriv_api.errors import RequestTimeoutError
+
+if TYPE_CHECKING:
+    from deriv_api import DerivAPI
+
+__pdoc__ = {
+    'deriv_api.pending_requests.PendingRequests.add': False,
+    'deriv_api.pending_requests.PendingRequests.get': False,
+    'deriv_api.pending_requests.PendingRequests.remove': False,
+    'deriv_api.pending_requests.PendingRequests.response_received': False,
+    'deriv_api.pending_requests.PendingRequests.reject_all': False,
+    'deriv_api.pending_requests.reject_source': False,
+    'deriv_api.pending_requests.source_done': False,
+}
+
+Source = Union[Subject, Future]
+
+
+class PendingRequests:
+    """
+        PendingRequests - the registry of requests waiting for responses
+
+        Every request sent by the API is registered here by its req_id. One-shot requests are backed by a Future and
+        removed as soon as their response arrives, subscriptions are backed by a Subject and removed when it completes
+        or fails. A request that does not get its first response within its timeout is failed with a
+        RequestTimeoutError. All the deadlines are kept in a single heap which is served by one timer handle, so there
+        is no task per request.
+
+        Parameters
+        ----------
+            api : deriv_api.DerivAPI
+            timeout : float
+                Default number of seconds to wait for the first response of a request. None means wait forever.
+
+        Example
+        -------
+        - number of requests waiting for a response
+        >>> len(api.pending_requests)
+        """
+
+    def __init__(self, api: DerivAPI, timeout: Optional[float] = None) -> None:
+        self.api = api
+        self.timeout = timeout
+        self.entries: Dict[int, Source] = {}
+        self.one_shot: set = set()
+        self.deadlines: Dict[int, Tuple[float, int]] = {}
+        self.timer_heap: list = []
+        self.timer_handle: Optional[asyncio.TimerHandle] = None
+        self.sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, req_id: int) -> bool:
+        return req_id in self.entries
+
+    def __getitem__(self, req_id: int) -> Source:
+        return self.entries[req_id]
+
+    def size(self) -> int:
+        """
+        Number of requests waiting for a response or still streaming
+
+        Returns
+        -------
+            int
+        """
+        return len(self.entries)
+
+    def add(self, req_id: int, source: Source, subscription: bool = False, timeout: Optional[float] = None) -> None:
+        """
+        Register a request source
+
+        Parameters
+        ----------
+        req_id : int
+            Request id
+        source : Subject or Future
+            The source that the responses are pushed to
+        subscription : bool
+            True if the request is a subscription and stays registered after the first response
+        timeout : float
+            Seconds to wait for the first response, defaults to the registry timeout
+        """
+        self.entries[req_id] = source
+        if not subscription:
+            self.one_shot.add(req_id)
+
+        if not isinstance(source, Future):
+            def on_done(*_args) -> None:
+                if self.entries.get(req_id) is source:
+                    self.remove(req_id)
+
+            source.subscribe(on_error=on_done, on_completed=on_done)
+
+        timeout = self.timeout if timeout is None else timeout
+        if timeout is not None:
+            self.__set_deadline(req_id, timeout)
+
+    def get(self, req_id: int) -> Optional[Source]:
+        """
+        Get the source registered for the req_id
+
+        Parameters
+        ----------
+        req_id : int
+
+        Returns
+        -------
+            The source or None if no request is waiting with this req_id
+        """
+        return self.entries.get(req_id)
+
+    def response_received(self, req_id: int) -> Optional[Source]:
+        """
+        Mark that a response arrived for the req_id. The deadline is cleared and one-shot requests are removed.
+
+        Parameters
+        ----------
+        req_id : int
+
+        Returns
+        -------
+            The source registered for the req_id
+        """
+        self.deadlines.pop(req_id, None)
+        if req_id in self.one_shot:
+            return self.remove(req_id)
+        return self.entries.get(req_id)
+
+    def remove(self, req_id: int) -> Optional[Source]:
+        """
+        Remove the req_id from the registry
+
+        Parameters
+        ----------
+        req_id : int
+
+        Returns
+        -------
+            The removed source or None
+        """
+        self.deadlines.pop(req_id, None)
+        self.one_shot.discard(req_id)
+        return self.entries.pop(req_id, None)
+
+    def reject_all(self, err: Exception, keep: Iterable[Subject] = ()) -> None:
+        """
+        Fail all the registered requests with the given error and remove them from the registry
+
+        Parameters
+        ----------
+        err : Exception
+        keep : Iterable[Subject]
+            Sources that stay registered, e.g. the subscriptions to be revived after reconnecting
+        """
+        keep = set(keep)
+        for req_id, source in list(self.entries.items()):
+            if source not in keep:
+                self.__reject(req_id, err)
+
+    def __reject(self, req_id: int, err: Exception) -> None:
+        source = self.remove(req_id)
+        if source is None:
+            return
+        # noinspection PyBroadException
+        try:
+            reject_source(source, err)
+        except Exception as error:
+            self.api.sanity_errors.on_next(error)
+
+    def __set_deadline(self, req_id: int, timeout: float) -> None:
+        loop = asyncio.get_event_loop()
+        deadline = (loop.time() + timeout, next(self.sequence))
+        self.deadlines[req_id] = deadline
+        heapq.heappush(self.timer_heap, (deadline, req_id))
+        # deadlines of answered requests stay in the heap until they expire, rebuild it when they pile up
+        if len(self.timer_heap) > 2 * len(self.deadlines) + 64:
+            self.timer_heap = [(d, r) for r, d in self.deadlines.items()]
+            heapq.heapify(self.timer_heap)
+        if self.timer_heap[0][0] == deadline:
+            self.__arm_timer(loop)
+
+    def __arm_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self.timer_handle:
+            self.timer_handle.cancel()
+            self.timer_handle = None
+        if self.timer_heap:
+            self.timer_handle = loop.call_at(self.timer_heap[0][0][0], self.__expire)
+
+    def __expire(self) -> None:
+        self.timer_handle = None
+        loop = asyncio.get_event_loop()
+        now = loop.time()
+        while self.timer_heap and self.timer_heap[0][0][0] <= now:
+            deadline, req_id = heapq.heappop(self.timer_heap)
+            if self.deadlines.get(req_id) != deadline:
+                continue
+            self.__reject(req_id, RequestTimeoutError(f'No response received for req_id {req_id}'))
+        self.__arm_timer(loop)
+
+
+def source_done(source: Source) -> bool:
+    """
+    Check if a request source can not receive responses anymore
+
+    Parameters
+    ----------
+    source : Subject or Future
+
+    Returns
+    -------
+        True if the Future is done or the Subject is stopped or disposed
+    """
+    if isinstance(source, Future):
+        return source.done()
+    return source.is_stopped or source.is_disposed
+
+
+def reject_source(source: Source, err: Exception) -> None:
+    """
+    Push the error to a request source
+
+    Parameters
+    ----------
+    source : Subject or Future
+    err : Exception
+    """
+    if isinstance(source, Future):
+        if not source.done():
+            source.set_exception(err)
+    else:
+        source.on_error(err)
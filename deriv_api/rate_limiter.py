@@ -0,0 +1,176 @@
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+__pdoc__ = {
+    'deriv_api.rate_limiter.TokenBucket.try_take': False,
+    'deriv_api.rate_limiter.RateLimiter.acquire': False,
+    'deriv_api.rate_limiter.RateLimiter.categories': False,
+}
+
+# api_call_limits categories of the calls that are not counted as general calls
+_call_categories = {
+    'portfolio': ['max_requestes_outcome'],
+    'statement': ['max_requestes_outcome'],
+    'proposal': ['max_requestes_outcome', 'max_requestes_pricing'],
+    'proposal_open_contract': ['max_requestes_pricing'],
+}
+_general_categories = ['max_requestes_general']
+# seconds of every limit window of api_call_limits
+_windows = {'minutely': 60, 'hourly': 3600}
+
+
+class TokenBucket:
+    """
+        TokenBucket - allows `capacity` calls per `period` seconds
+
+        The bucket starts full and is refilled continuously, so a burst of `capacity` calls goes out at once and the
+        rest are spread over the period.
+
+        Parameters
+        ----------
+            capacity : int
+                Number of calls in the period
+            period : float
+                Length of the period in seconds
+        """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock: Optional[asyncio.Lock] = None
+
+    def level(self) -> float:
+        """
+        The number of calls that can be made now
+
+        Returns
+        -------
+            float
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return self.tokens
+
+    def try_take(self) -> bool:
+        """
+        Take a token if there is one
+
+        Returns
+        -------
+            True if the token is taken
+        """
+        if self.level() < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    async def take(self) -> None:
+        """
+        Take a token, wait for it if the bucket is empty. The waiting callers get the tokens in arrival order.
+        """
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        if not self.lock.locked() and self.try_take():
+            return
+        async with self.lock:
+            while not self.try_take():
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """
+        RateLimiter - keeps the calls within the limits of `website_status.api_call_limits`
+
+        Every limit category has a token bucket for each of its windows. A request takes a token from all the buckets
+        of its categories before it is sent, so the requests over the limit wait instead of being rejected by the
+        server with a RateLimit error. The limiter does nothing until it is configured.
+
+        Example
+        -------
+        >>> status = await api.website_status({'website_status': 1})
+        >>> api.rate_limiter.configure(status['website_status']['api_call_limits'])
+        >>> api.rate_limiter.levels()
+        {'max_requestes_general': {'hourly': 14399.0, 'minutely': 179.0}, ...}
+
+        Parameters
+        ----------
+            api_call_limits : dict
+                The `api_call_limits` of a website_status response
+
+        Properties
+        ----------
+        buckets : Dict[str, Dict[str, TokenBucket]]
+            The buckets of every category by window
+        """
+
+    def __init__(self, api_call_limits: Optional[dict] = None) -> None:
+        self.buckets: Dict[str, Dict[str, TokenBucket]] = {}
+        if api_call_limits:
+            self.configure(api_call_limits)
+
+    def configure(self, api_call_limits: dict) -> None:
+        """
+        Set the limits. The buckets of the limits that did not change are kept with their levels.
+
+        Parameters
+        ----------
+        api_call_limits : dict
+            The `api_call_limits` of a website_status response
+        """
+        buckets: Dict[str, Dict[str, TokenBucket]] = {}
+        for category, limits in api_call_limits.items():
+            for window, period in _windows.items():
+                capacity = limits.get(window)
+                if not capacity:
+                    continue
+                bucket = self.buckets.get(category, {}).get(window)
+                if bucket is None or bucket.capacity != capacity:
+                    bucket = TokenBucket(capacity, period)
+                buckets.setdefault(category, {})[window] = bucket
+        self.buckets = buckets
+
+    def categories(self, request: dict) -> List[str]:
+        """
+        Find the limit categories of a request
+
+        Parameters
+        ----------
+        request : dict
+            API request
+
+        Returns
+        -------
+            The category names
+        """
+        for call, categories in _call_categories.items():
+            if call in request:
+                return categories
+        return _general_categories
+
+    async def acquire(self, request: dict) -> None:
+        """
+        Wait until the request can be sent within the limits
+
+        Parameters
+        ----------
+        request : dict
+            API request
+        """
+        for category in self.categories(request):
+            for bucket in self.buckets.get(category, {}).values():
+                await bucket.take()
+
+    def levels(self) -> Dict[str, Dict[str, float]]:
+        """
+        The current levels of the buckets
+
+        Returns
+        -------
+            The number of calls that can be made now by category and window
+        """
+        return {category: {window: bucket.level() for window, bucket in windows.items()}
+                for category, windows in self.buckets.items()}
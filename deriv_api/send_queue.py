@@ -0,0 +1,179 @@
+from __future__ import annotations
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, Optional
+
+from deriv_api.pending_requests import Source, reject_source, source_done
+
+if TYPE_CHECKING:
+    from deriv_api import DerivAPI
+
+__pdoc__ = {
+    'deriv_api.send_queue.priorities': False,
+    'deriv_api.send_queue.SendQueue.put': False,
+    'deriv_api.send_queue.SendQueue.discard': False,
+    'deriv_api.send_queue.SendQueue.run': False,
+    'deriv_api.send_queue.SendQueue.priority_of': False,
+}
+
+# priority classes in the order they are written
+priorities = ['trade', 'pricing', 'normal', 'bulk']
+# priority class of the calls that are not 'normal'
+_call_priorities = {
+    'buy': 'trade',
+    'sell': 'trade',
+    'cancel': 'trade',
+    'contract_update': 'trade',
+    'proposal': 'pricing',
+    'proposal_open_contract': 'pricing',
+    'active_symbols': 'bulk',
+    'asset_index': 'bulk',
+    'contracts_for': 'bulk',
+    'profit_table': 'bulk',
+    'statement': 'bulk',
+    'ticks_history': 'bulk',
+    'trading_times': 'bulk',
+}
+
+
+class SendQueue:
+    """
+        SendQueue - the outbound request queue of a connection
+
+        Requests are appended to the queue and written to the connection by one long-lived writer coroutine, so sending
+        a request costs a queue append instead of a new task. The writer drains everything queued on every wakeup.
+
+        Every priority class has its own lane, a lane is only written when the lanes before it are empty:
+
+        - `trade`: buy, sell, cancel and contract_update
+        - `pricing`: proposal and proposal_open_contract
+        - `normal`: the other calls
+        - `bulk`: active_symbols, asset_index, contracts_for, profit_table, statement, ticks_history and trading_times
+
+        Parameters
+        ----------
+            api : deriv_api.DerivAPI
+            call_priorities : dict
+                Priority classes by call name, they override the defaults above
+        """
+
+    def __init__(self, api: DerivAPI, call_priorities: Optional[Dict[str, str]] = None) -> None:
+        self.api = api
+        self.lanes = tuple(deque() for _ in priorities)
+        self.lane_index: Dict[str, int] = {priority: index for index, priority in enumerate(priorities)}
+        self.call_lanes: Dict[str, int] = {}
+        for call, priority in {**_call_priorities, **(call_priorities or {})}.items():
+            if priority not in self.lane_index:
+                raise ValueError(f'Unknown priority {priority} for {call}, expected one of: {", ".join(priorities)}')
+            self.call_lanes[call] = self.lane_index[priority]
+        self.normal_lane = self.lane_index['normal']
+        self.wakeup: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self.lanes)
+
+    def priority_of(self, request: dict) -> str:
+        """
+        Find the priority class of a request by its call
+
+        Parameters
+        ----------
+        request : dict
+            API request
+
+        Returns
+        -------
+            The priority class
+        """
+        return priorities[self.__lane_of(request)]
+
+    def __lane_of(self, request: dict) -> int:
+        call_lanes = self.call_lanes
+        for name in request:
+            lane = call_lanes.get(name)
+            if lane is not None:
+                return lane
+        return self.normal_lane
+
+    def put(self, request: dict, source: Source, priority: Optional[str] = None) -> None:
+        """
+        Queue the request to be written to the connection
+
+        Parameters
+        ----------
+        request : dict
+            API request with the req_id
+        source : Subject or Future
+            The source registered for the request, writing errors are pushed to it
+        priority : str
+            Priority class, one of 'trade', 'pricing', 'normal' and 'bulk'. Default is the class of the call
+        """
+        lane = self.__lane_of(request) if priority is None else self.lane_index[priority]
+        self.lanes[lane].append((request, source))
+        if self.wakeup and not self.wakeup.done():
+            self.wakeup.set_result(None)
+
+    def discard(self, sources: Iterable[Source]) -> None:
+        """
+        Remove the queued requests of the given sources, they are not written
+
+        Parameters
+        ----------
+        sources : Iterable[Subject or Future]
+            The sources of the requests to remove
+        """
+        sources = set(sources)
+        for lane in self.lanes:
+            kept = [entry for entry in lane if entry[1] not in sources]
+            if len(kept) != len(lane):
+                lane.clear()
+                lane.extend(kept)
+
+    async def run(self) -> None:
+        """
+        The writer coroutine. Waits for the connection and writes the queued requests in order of priority.
+        """
+        loop = asyncio.get_event_loop()
+        lanes = self.lanes
+        while True:
+            if not len(self):
+                self.wakeup = loop.create_future()
+                await self.wakeup
+            try:
+                await self.api.connected
+            except Exception as err:
+                self.__fail_all(err)
+                continue
+
+            connection = self.api.wsconnection
+            dumps = self.api.codec.dumps
+            while connection is self.api.wsconnection and self.api.connected.is_resolved():
+                for lane in lanes:
+                    if lane:
+                        break
+                else:
+                    break
+                request, source = lane.popleft()
+                # the request is failed or cancelled already, e.g. rejected when the connection dropped
+                if source_done(source):
+                    continue
+                try:
+                    await connection.send(dumps(request))
+                except Exception as err:
+                    self.__fail(request, source, err)
+
+    def __fail_all(self, err: Exception) -> None:
+        for lane in self.lanes:
+            while lane:
+                self.__fail(*lane.popleft(), err)
+
+    def __fail(self, request: dict, source: Source, err: Exception) -> None:
+        # the request is never answered, Futures are not removed from the registry by their own callbacks
+        pending_requests = self.api.pending_requests
+        if pending_requests.get(request.get('req_id')) is source:
+            pending_requests.remove(request['req_id'])
+        # noinspection PyBroadException
+        try:
+            reject_source(source, err)
+        except Exception as error:
+            self.api.sanity_errors.on_next(error)
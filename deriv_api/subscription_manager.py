@@ -1,18 +1,34 @@
-from deriv_api.utils import dict_to_cache_key
+import asyncio
+from collections import deque
+from deriv_api.backpressure import BufferedSource
+from deriv_api.utils import request_key
 from deriv_api.errors import APIError
 from deriv_api.streams_list import streams_list
+from deriv_api.tick_history import TickHistory
+import reactivex
+from reactivex import abc
 from reactivex import operators as op
+from reactivex.disposable import Disposable
 from reactivex.subject import Subject
 from reactivex import Observable
 from typing import Optional, Union
 __pdoc__ = {
+    'deriv_api.subscription_manager.SubscriptionManager.attach': False,
+    'deriv_api.subscription_manager.SubscriptionManager.detach': False,
+    'deriv_api.subscription_manager.SubscriptionManager.release': False,
     'deriv_api.subscription_manager.SubscriptionManager.complete_subs_by_ids': False,
     'deriv_api.subscription_manager.SubscriptionManager.complete_subs_by_key': False,
     'deriv_api.subscription_manager.SubscriptionManager.create_new_source': False,
     'deriv_api.subscription_manager.SubscriptionManager.get_source': False,
     'deriv_api.subscription_manager.SubscriptionManager.remove_key_on_error': False,
+    'deriv_api.subscription_manager.SubscriptionManager.replay_source': False,
+    'deriv_api.subscription_manager.SubscriptionManager.save_message': False,
+    'deriv_api.subscription_manager.SubscriptionManager.source_key': False,
+    'deriv_api.subscription_manager.SubscriptionManager.resubscribe': False,
+    'deriv_api.subscription_manager.SubscriptionManager.revive': False,
     'deriv_api.subscription_manager.SubscriptionManager.save_subs_id': False,
     'deriv_api.subscription_manager.SubscriptionManager.save_subs_per_msg_type': False,
+    'deriv_api.subscription_manager.SubscriptionManager.save_tick': False,
     'deriv_api.subscription_manager.SubscriptionManager.source_exists': False,
     'deriv_api.subscription_manager.SubscriptionManager.forget': False,
     'deriv_api.subscription_manager.SubscriptionManager.forget_all': False,
@@ -29,9 +45,21 @@ class SubscriptionManager:
         do not have subscribers. It also ensures that subscriptions are revived after connection
         drop/account changed.
 
+        The observers of every channel are counted. When the last one is disposed the channel lingers for `linger`
+        seconds before it is forgotten, a subscribe in that time reattaches to the live channel.
+
+        The last message of every channel is kept, more if a subscriber asks for a longer replay. A subscriber that
+        joins a live channel with `replay` gets the kept messages at once instead of waiting for the next push.
+
+        If `tick_history` is set, the last ticks of every symbol of the `ticks` channels are kept in a TickHistory.
+
         Parameters
         ----------
             api : deriv_api.DerivAPI
+            linger : float
+                Seconds to keep a channel without observers before forgetting it. Default is 0, forget at once
+            tick_history : int
+                The number of ticks to keep per symbol. Default is 0, no ticks are kept
 
         Example
         -------
@@ -51,16 +79,25 @@ class SubscriptionManager:
         >>> await api.forget(subscription_id)
         """
 
-    def __init__(self, api):
+    def __init__(self, api, linger: float = 0, tick_history: int = 0):
         self.api = api
+        self.linger = linger
+        self.tick_history_size = tick_history
+        self.tick_histories: dict = {}
+        self.replays: dict = {}
+        self.refcounts: dict = {}
+        self.linger_handles: dict = {}
         self.sources: dict = {}
         self.orig_sources: dict = {}
+        self.requests: dict = {}
         self.subs_id_to_key: dict = {}
         self.key_to_subs_id: dict = {}
         self.buy_key_to_contract_id: dict = {}
+        self.contract_id_to_key: dict = {}
         self.subs_per_msg_type: dict = {}
 
-    async def subscribe(self, request: dict) -> Observable:
+    async def subscribe(self, request: dict, policy: Optional[str] = None, buffer_size: int = 100,
+                        replay: int = 0) -> Observable:
         """
         Subscribe to a given request, returns a stream of new responses,
         Errors should be handled by the user of the stream
@@ -74,6 +111,14 @@ class SubscriptionManager:
         ----------
         request : dict
             A request object acceptable by the API
+        policy : str
+            Buffer policy for slow consumers: 'latest-only', 'drop-oldest' or 'block'. The returned stream is a
+            BufferedSource of the shared subscription
+        buffer_size : int
+            The buffer bound of the 'drop-oldest' and 'block' policies
+        replay : int
+            The number of the last messages of the subscription that are delivered to every observer when it
+            subscribes, before the new messages. Default is 0, only the new messages
 
         Returns
         -------
@@ -83,12 +128,23 @@ class SubscriptionManager:
         if not get_msg_type(request):
             raise APIError('Subscription type is not found in deriv-api')
 
-        if self.source_exists(request):
-            return self.get_source(request)
+        if not self.source_exists(request) and self.api.rate_limiter.buckets:
+            await self.api.rate_limiter.acquire(request)
 
-        new_request: dict = request.copy()
-        new_request['subscribe'] = 1
-        return await self.create_new_source(new_request)
+        key = self.source_key(request)
+        if key is not None:
+            source = self.sources[key]
+        else:
+            new_request: dict = request.copy()
+            new_request['subscribe'] = 1
+            source = await self.create_new_source(new_request)
+            key = request_key(new_request)
+
+        if replay:
+            source = self.replay_source(key, source, replay)
+        if policy:
+            return BufferedSource(self.api, source, policy, buffer_size)
+        return source
 
     def get_source(self, request: dict) -> Optional[Subject]:
         """
@@ -103,14 +159,30 @@ class SubscriptionManager:
         -------
             Returns source observable if exists, otherwise returns None
         """
-        key: bytes = dict_to_cache_key(request)
+        key = self.source_key(request)
+        return None if key is None else self.sources[key]
+
+    def source_key(self, request: dict) -> Optional[tuple]:
+        """
+        Find the key of the source of a request
+
+        Parameters
+        ----------
+        request : dict
+            Request object
+
+        Returns
+        -------
+            The key of the source in the source list if it exists, otherwise None
+        """
+        key: tuple = request_key(request)
         if key in self.sources:
-            return self.sources[key]
+            return key
 
         # if we have a buy subscription reuse that for poc
-        for c in self.buy_key_to_contract_id.values():
-            if c['contract_id'] == request['contract_id']:
-                return self.sources[c['buy_key']]
+        contract_id = request.get('contract_id')
+        if contract_id is not None and contract_id in self.contract_id_to_key:
+            return self.contract_id_to_key[contract_id]
 
         return None
 
@@ -143,35 +215,45 @@ class SubscriptionManager:
         -------
             Returns source observable
         """
-        key: bytes = dict_to_cache_key(request)
-
-        def forget_old_source() -> None:
-            if key not in self.key_to_subs_id:
-                return
-            # noinspection PyBroadException
-            try:
-                self.api.add_task(self.forget(self.key_to_subs_id[key]), 'forget old subscription')
-            except Exception as err:
-                self.api.sanity_errors.on_next(err)
-            return
-
-        self.orig_sources[key]: Observable = self.api.send_and_get_source(request)
-        source: Observable = self.orig_sources[key].pipe(
-            op.finally_action(forget_old_source),
-            op.share()
-        )
+        key: tuple = request_key(request)
+        orig_source: Subject = self.api.send_and_get_source(request)
+
+        def subscribe(observer: abc.ObserverBase, scheduler: Optional[abc.SchedulerBase] = None) \
+                -> abc.DisposableBase:
+            self.attach(key, orig_source)
+            disposable = orig_source.subscribe(observer, scheduler=scheduler)
+
+            def dispose() -> None:
+                disposable.dispose()
+                self.detach(key, orig_source)
+
+            return Disposable(dispose)
+
+        self.orig_sources[key] = orig_source
+        self.refcounts[key] = 0
+        self.replays[key] = deque(maxlen=1)
+        # the messages are kept from the original source, so it is not counted as an observer
+        orig_source.subscribe(lambda message: self.save_message(key, message), lambda _: None)
+        if self.tick_history_size and get_msg_type(request) == 'ticks':
+            # the history is written from the original source, so it is not counted as an observer
+            orig_source.subscribe(self.save_tick, lambda _: None)
+        source: Observable = reactivex.create(subscribe)
         self.sources[key] = source
+        self.requests[key] = request
         self.save_subs_per_msg_type(request, key)
 
         async def process_response() -> None:
             # noinspection PyBroadException
             try:
-                response = await source.pipe(op.first(), op.to_future())
+                # the first response is read from the original source, so it is not counted as an observer
+                response = await orig_source.pipe(op.first(), op.to_future())
                 if request.get('buy'):
+                    contract_id = response['buy']['contract_id']
                     self.buy_key_to_contract_id[key] = {
-                        'contract_id': response['buy']['contract_id'],
+                        'contract_id': contract_id,
                         'buy_key': key
                     }
+                    self.contract_id_to_key[contract_id] = key
                 self.save_subs_id(key, response['subscription'])
             except Exception:
                 self.remove_key_on_error(key)
@@ -179,6 +261,173 @@ class SubscriptionManager:
         self.api.add_task(process_response(), 'subs manager: process_response')
         return source
 
+    def attach(self, key: tuple, orig_source: Subject) -> None:
+        """
+        Count a new observer of a channel and keep the channel if it is lingering
+
+        Parameters
+        ----------
+        key : tuple
+            API call request key
+        orig_source : Subject
+            The original source of the observed channel
+        """
+        if self.orig_sources.get(key) is not orig_source:
+            return
+        self.refcounts[key] += 1
+        handle = self.linger_handles.pop(key, None)
+        if handle:
+            handle.cancel()
+
+    def detach(self, key: tuple, orig_source: Subject) -> None:
+        """
+        Count a disposed observer of a channel, the channel is forgotten after `linger` seconds if it has no observers
+
+        Parameters
+        ----------
+        key : tuple
+            API call request key
+        orig_source : Subject
+            The original source of the observed channel
+        """
+        if self.orig_sources.get(key) is not orig_source:
+            return
+        self.refcounts[key] -= 1
+        if self.refcounts[key] > 0:
+            return
+        if self.linger > 0:
+            self.linger_handles[key] = asyncio.get_event_loop().call_later(self.linger, self.release, key)
+        else:
+            self.release(key)
+
+    def release(self, key: tuple) -> None:
+        """
+        Forget a channel that has no observers
+
+        Parameters
+        ----------
+        key : tuple
+            API call request key
+        """
+        self.linger_handles.pop(key, None)
+        if self.refcounts.get(key) or key not in self.key_to_subs_id:
+            return
+        # noinspection PyBroadException
+        try:
+            self.api.add_task(self.forget(self.key_to_subs_id[key]), 'forget old subscription')
+        except Exception as err:
+            self.api.sanity_errors.on_next(err)
+
+    def save_message(self, key: tuple, message: dict) -> None:
+        """
+        Keep a message of a channel for replay
+
+        Parameters
+        ----------
+        key : tuple
+            API call request key
+        message : dict
+            A message of the channel
+        """
+        replay = self.replays.get(key)
+        if replay is not None:
+            replay.append(message)
+
+    def replay_source(self, key: tuple, source: Observable, replay: int) -> Observable:
+        """
+        A source that starts with the last kept messages of a channel
+
+        Parameters
+        ----------
+        key : tuple
+            API call request key
+        source : Observable
+            The source of the channel
+        replay : int
+            The number of the kept messages to start with
+
+        Returns
+        -------
+            Observable
+        """
+        if self.replays[key].maxlen < replay:
+            self.replays[key] = deque(self.replays[key], maxlen=replay)
+
+        def start(_scheduler: Optional[abc.SchedulerBase] = None) -> Observable:
+            # the kept messages are read when an observer subscribes, so it gets the latest ones
+            messages = list(self.replays.get(key, ()))[-replay:]
+            return source.pipe(op.start_with(*messages))
+
+        return reactivex.defer(start)
+
+    def save_tick(self, response: dict) -> None:
+        """
+        Write the tick of a ticks response into the history of its symbol
+
+        Parameters
+        ----------
+        response : dict
+            A response of a ticks subscription
+        """
+        if response.get('msg_type') != 'tick':
+            return
+        tick = response['tick']
+        symbol = tick['symbol']
+        if symbol not in self.tick_histories:
+            self.tick_histories[symbol] = TickHistory(self.tick_history_size)
+        self.tick_histories[symbol].append(tick)
+
+    def resubscribe(self) -> None:
+        """
+        Send the requests of all the live subscriptions again after reconnecting. Every request keeps its req_id, so
+        the responses on the new connection are pushed to the same sources and the consumers keep their Observables.
+        The new subscription ids are saved when the first responses arrive.
+
+        A `buy` subscription is revived as a `proposal_open_contract` subscription of the bought contract. The
+        subscriptions that create something on the server can not be sent again and are failed.
+        """
+        for key in list(self.sources):
+            request: dict = self.requests[key]
+            if request.get('buy'):
+                if key not in self.buy_key_to_contract_id:
+                    self.complete_subs_by_key(key, APIError('Subscription can not be revived after reconnecting'))
+                    continue
+                request = {
+                    'proposal_open_contract': 1,
+                    'contract_id': self.buy_key_to_contract_id[key]['contract_id'],
+                    'subscribe': 1,
+                    'req_id': request['req_id']
+                }
+            elif get_msg_type(request) in _not_revivable:
+                self.complete_subs_by_key(key, APIError('Subscription can not be revived after reconnecting'))
+                continue
+
+            self.api.add_task(self.revive(key, request), 'subs manager: revive')
+
+    async def revive(self, key: tuple, request: dict) -> None:
+        """
+        Send the request of a subscription again and save its new subscription id
+
+        Parameters
+        ----------
+        key : tuple
+            API call request key
+        request : dict
+            The request to send, with the req_id of the subscription
+        """
+        orig_source: Subject = self.orig_sources[key]
+        response_future = orig_source.pipe(op.first(), op.to_future())
+        self.api.write_request(request, orig_source, priority='trade')
+        # noinspection PyBroadException
+        try:
+            response = await response_future
+        except Exception:
+            # errors are delivered to the consumers by the source
+            return
+        if key in self.key_to_subs_id:
+            del self.subs_id_to_key[self.key_to_subs_id.pop(key)]
+        self.save_subs_id(key, response.get('subscription'))
+
     async def forget(self, subs_id: str) -> dict:
         """
         Delete the source from source list, clears the subscription detail from subs_id_to_key and key_to_subs_id and
@@ -234,13 +483,13 @@ class SubscriptionManager:
                 key = self.subs_id_to_key[subs_id]
                 self.complete_subs_by_key(key)
 
-    def save_subs_id(self, key: bytes, subscription: Union[dict, None]):
+    def save_subs_id(self, key: tuple, subscription: Union[dict, None]):
         """
         Saves the subscription detail in subs_id_to_key and key_to_subs_id
 
         Parameters
         ----------
-        key : bytes
+        key : tuple
             API call request key. Key for key_to_subs_id
         subscription : dict or None
             subscription details - subscription id
@@ -256,7 +505,7 @@ class SubscriptionManager:
 
         return None
 
-    def save_subs_per_msg_type(self, request: dict, key: bytes):
+    def save_subs_per_msg_type(self, request: dict, key: tuple):
         """
         Save the request's key in subscription per message type
 
@@ -264,7 +513,7 @@ class SubscriptionManager:
         ----------
         request : dict
             API request object
-        key : bytes
+        key : tuple
             API request key
 
         """
@@ -275,28 +524,30 @@ class SubscriptionManager:
         else:
             self.api.sanity_errors.next(APIError('Subscription type is not found in deriv-api'))
 
-    def remove_key_on_error(self, key: bytes):
+    def remove_key_on_error(self, key: tuple):
         """
         Remove ths source from source list,  clears the subscription detail from subs_id_to_key and key_to_subs_id.
         Mark the original source as complete.
 
         Parameters
         ----------
-        key : bytes
-            Request object key in bytes. Used to identify the subscription stored in key_to_subs_id
+        key : tuple
+            Request object key. Used to identify the subscription stored in key_to_subs_id
 
         """
         return lambda: self.complete_subs_by_key(key)
 
-    def complete_subs_by_key(self, key: bytes):
+    def complete_subs_by_key(self, key: tuple, error: Optional[Exception] = None):
         """
         Identify the source from source list based on request object key and removes it. Clears the subscription detail
         from subs_id_to_key and key_to_subs_id. Mark the original source as complete.
 
         Parameters
         ----------
-        key : bytes
+        key : tuple
             Request object key to identify the subscription stored in key_to_subs_id
+        error : Exception
+            If given, the original source is failed with it instead of being completed
 
         """
         if not key or not self.sources[key]:
@@ -304,7 +555,13 @@ class SubscriptionManager:
 
         # Delete the source
         del self.sources[key]
+        self.requests.pop(key, None)
         orig_source: Subject = self.orig_sources.pop(key)
+        self.refcounts.pop(key, None)
+        self.replays.pop(key, None)
+        handle = self.linger_handles.pop(key, None)
+        if handle:
+            handle.cancel()
 
         try:
             # Delete the subs id if exist
@@ -313,17 +570,30 @@ class SubscriptionManager:
                 del self.subs_id_to_key[subs_id]
                 # Delete the key
                 del self.key_to_subs_id[key]
-
-            # Delete the buy key to contract_id mapping
-            del self.buy_key_to_contract_id[key]
         except KeyError:
             pass
 
+        # Delete the buy key to contract_id mapping and its index
+        buy = self.buy_key_to_contract_id.pop(key, None)
+        if buy and self.contract_id_to_key.get(buy['contract_id']) == key:
+            del self.contract_id_to_key[buy['contract_id']]
+
         # Mark the source complete
-        orig_source.on_completed()
+        if error:
+            # noinspection PyBroadException
+            try:
+                orig_source.on_error(error)
+            except Exception as err:
+                self.api.sanity_errors.on_next(err)
+        else:
+            orig_source.on_completed()
         orig_source.dispose()
 
 
+# subscriptions created by these calls would create the object again if they are resent
+_not_revivable = ['p2p_advertiser_create', 'p2p_order_create']
+
+
 def get_msg_type(request: dict) -> str:
     """
     Get message type by request
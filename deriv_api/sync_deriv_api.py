@@ -0,0 +1,271 @@
+import asyncio
+import queue
+import threading
+from typing import Any, Coroutine, Optional
+
+from reactivex import Observable
+
+from deriv_api.deriv_api import DerivAPI
+from deriv_api.deriv_api_calls import APIMethods, api_method_doc
+
+__pdoc__ = {
+    'deriv_api.sync_deriv_api.SyncDerivAPI.run': False,
+}
+
+
+class SyncSubscription:
+    """
+        SyncSubscription - the messages of a subscription in a thread-safe queue
+
+        Example
+        -------
+        >>> ticks = api.subscribe({'ticks': 'R_100'})
+        >>> for tick in ticks:
+        ...     print(tick['tick']['quote'])
+
+        Parameters
+        ----------
+            api : SyncDerivAPI
+            source : Observable
+                The subscription stream
+            maxsize : int
+                The queue bound, the oldest message is dropped when it is full. Default is 0, no bound
+
+        Properties
+        ----------
+        queue : queue.Queue
+            The received messages
+        """
+
+    # marks the end of the stream in the queue
+    _end = object()
+
+    def __init__(self, api: 'SyncDerivAPI', source: Observable, maxsize: int = 0) -> None:
+        self.api = api
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.closed = False
+        # set when the end or the error of the stream is put, the messages that arrive after it are ignored
+        self.ended = False
+        self.lock = threading.Lock()
+        self.disposable = source.subscribe(self.__put, self.__put, lambda: self.__put(self._end))
+
+    def __put(self, item: Any) -> None:
+        with self.lock:
+            if self.ended:
+                return
+            self.ended = item is self._end or isinstance(item, Exception)
+            while True:
+                try:
+                    self.queue.put_nowait(item)
+                    return
+                except queue.Full:
+                    # the oldest message is dropped. Nothing is put after the end of the stream, so it is never lost
+                    try:
+                        self.queue.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    def get(self, timeout: Optional[float] = None) -> dict:
+        """
+        Wait for the next message
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait, raises queue.Empty if no message is received. Default is None, wait forever
+
+        Returns
+        -------
+            The next message. Raises StopIteration when the subscription is completed and the error of the
+            subscription if it is failed
+        """
+        item = self.queue.get(timeout=timeout)
+        if item is self._end:
+            self.queue.put(item)
+            raise StopIteration
+        if isinstance(item, Exception):
+            self.queue.put(item)
+            raise item
+        return item
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> dict:
+        return self.get()
+
+    def close(self) -> None:
+        """
+        Stop receiving messages and forget the subscription when it has no other consumers
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.api.loop.call_soon_threadsafe(self.disposable.dispose)
+        self.__put(self._end)
+
+
+class SyncDerivAPI(APIMethods):
+    """
+        SyncDerivAPI - blocking API calls for synchronous code
+
+        It owns a background thread that runs an event loop with a DerivAPI, so the connection stays open between the
+        calls. Every API method blocks until its response is received. It can be called from several threads at the
+        same time, all the calls share the connection.
+
+        Examples
+        --------
+        >>> api = SyncDerivAPI(app_id=1234)
+        >>> api.authorize(token)
+        >>> print(api.balance()['balance']['balance'])
+        >>> api.close()
+
+        Parameters
+        ----------
+            timeout : float
+                Seconds to wait for a blocking call, raises TimeoutError if it is not done. Default is None, wait
+                forever
+            options : dict
+                The options of DerivAPI
+
+        Properties
+        ----------
+        api : DerivAPI
+            The API object in the background thread, it should only be used in that thread
+        loop : asyncio.AbstractEventLoop
+            The event loop of the background thread
+        """
+
+    @staticmethod
+    def _make_api_method(name: str):
+        # every API method blocks until it is done
+        return _blocking_call(name)
+
+    def __init__(self, timeout: Optional[float] = None, **options) -> None:
+        self.timeout = timeout
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='deriv_api', daemon=True)
+        self.thread.start()
+
+        async def create_api() -> DerivAPI:
+            return DerivAPI(**options)
+
+        try:
+            self.api: DerivAPI = self.run(create_api())
+        except Exception:
+            self.__stop()
+            raise
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Run a coroutine in the background thread and wait for its result
+
+        Parameters
+        ----------
+        coroutine : Coroutine
+            Coroutine object
+
+        Returns
+        -------
+            The result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(self.timeout)
+
+    def send(self, request: dict) -> dict:
+        """
+        Send the API call and returns response
+
+        Parameters
+        ----------
+        request : dict
+            API request
+
+        Returns
+        -------
+            API response
+        """
+        return self.run(self.api.send(request))
+
+    def subscribe(self, request: dict, maxsize: int = 0, replay: int = 0) -> SyncSubscription:
+        """
+        Subscribe to a given request
+
+        Parameters
+        ----------
+            request : dict
+                Subscribe request
+            maxsize : int
+                The bound of the message queue, the oldest message is dropped when it is full. Default is 0, no bound
+            replay : int
+                The number of the last messages of the subscription that are queued first, see DerivAPI.subscribe
+
+        Returns
+        -------
+            SyncSubscription
+        """
+
+        async def subscribe() -> SyncSubscription:
+            return SyncSubscription(self, await self.api.subscribe(request, replay=replay), maxsize)
+
+        return self.run(subscribe())
+
+    def forget(self, subs_id: str) -> dict:
+        """
+        Forget / unsubscribe the specific subscription.
+
+        Parameters
+        ----------
+            subs_id : str
+                subscription id
+
+        Returns
+        -------
+            Returns dict
+        """
+        return self.run(self.api.forget(subs_id))
+
+    def forget_all(self, *types) -> dict:
+        """
+        Forget / unsubscribe the subscriptions of given types.
+
+        Parameter
+        ---------
+            *types : Any number of non-keyword arguments
+
+        Returns
+        -------
+            Returns the dict
+        """
+        return self.run(self.api.forget_all(*types))
+
+    def close(self) -> None:
+        """
+        Disconnect and stop the background thread
+        """
+        if not self.thread.is_alive():
+            return
+        try:
+            self.run(self.api.clear())
+        finally:
+            self.__stop()
+
+    def __stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def __enter__(self) -> 'SyncDerivAPI':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def _blocking_call(name: str):
+    def call(self: SyncDerivAPI, args=None):
+        return self.run(getattr(self.api, name)(args))
+
+    call.__name__ = name
+    call.__qualname__ = f'SyncDerivAPI.{name}'
+    call.__doc__ = api_method_doc(name)
+    return call
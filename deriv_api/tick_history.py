@@ -0,0 +1,83 @@
+from array import array
+from typing import Dict, Mapping, Optional
+
+__pdoc__ = {
+    'deriv_api.tick_history.TickHistory.append': False,
+}
+
+# the fields of a tick that are kept and their array type codes
+_fields = {'epoch': 'q', 'quote': 'd', 'bid': 'd', 'ask': 'd'}
+
+
+class TickHistory:
+    """
+        TickHistory - the last ticks of a symbol in a fixed-size ring buffer
+
+        Every field is kept in its own preallocated array: epoch as 64 bit integers, quote, bid and ask as doubles.
+        Appending a tick writes its values into the arrays, the tick response itself is not kept. When the buffer is
+        full the oldest tick is overwritten. A missing bid or ask is kept as NaN.
+
+        Example
+        -------
+        >>> api = DerivAPI(app_id=1234, tick_history=1000)
+        >>> ticks = await api.subscribe({'ticks': 'R_100'})
+        >>> ticks.subscribe(lambda _: print(sum(api.tick_history('R_100').last(20)['quote']) / 20))
+
+        Parameters
+        ----------
+            size : int
+                The number of ticks to keep
+
+        Properties
+        ----------
+        size : int
+            The number of ticks that can be kept
+        """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.arrays: Dict[str, array] = {field: array(code, bytes(8 * size)) for field, code in _fields.items()}
+        # the index of the next tick and the number of kept ticks
+        self.position = 0
+        self.count = 0
+
+    def append(self, tick: Mapping) -> None:
+        """
+        Write a tick into the buffer
+
+        Parameters
+        ----------
+        tick : Mapping
+            The `tick` of a ticks response
+        """
+        position = self.position
+        arrays = self.arrays
+        arrays['epoch'][position] = int(tick['epoch'])
+        arrays['quote'][position] = float(tick['quote'])
+        arrays['bid'][position] = float(tick.get('bid', 'nan'))
+        arrays['ask'][position] = float(tick.get('ask', 'nan'))
+        self.position = (position + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def last(self, n: Optional[int] = None) -> Dict[str, array]:
+        """
+        Copy the last ticks out of the buffer
+
+        Parameters
+        ----------
+        n : int
+            The number of ticks. Default is None, all the kept ticks
+
+        Returns
+        -------
+            The arrays of epoch, quote, bid and ask of the ticks, oldest first
+        """
+        n = self.count if n is None else max(0, min(n, self.count))
+        start = self.position - n
+        if start >= 0:
+            return {field: values[start:self.position] for field, values in self.arrays.items()}
+        return {field: values[start:] + values[:self.position] for field, values in self.arrays.items()}
@@ -1,9 +1,40 @@
-import pickle
 import re
+from operator import itemgetter
+from typing import Callable, Dict, Tuple
+
+# these fields do not change the response, requests that differ only in them share a cache key
+_ignored_keys = frozenset(['req_id', 'passthrough', 'subscribe'])
+# the values that can not be hashed, they are converted before they are put in the key
+_nested_types = frozenset([dict, list])
+# the layouts of the dicts seen so far by their field order: the sorted field names, a getter of the values in that
+# order and whether the values were nested. Requests are built by a few code paths, so there are few field orders.
+_request_layouts: Dict[tuple, Tuple[tuple, Callable, bool]] = {}
+_nested_layouts: Dict[tuple, Tuple[tuple, Callable, bool]] = {}
+_max_layouts = 1024
+
+
+def request_key(obj: dict) -> tuple:
+    """convert the dictionary object to a canonical hashable key
+
+    The key does not depend on the order of the fields, so the same request built in a different order gets the same
+    key. Nested dicts are converted the same way, lists keep their order. The values are compared as python
+    compares them, so requests that are equal as dicts get the same key.
+
+    Parameter
+    ---------
+    obj : dict
+        Request arguments
+    Returns
+    -------
+        tuple
+            The sorted field names and the values of the request object, without req_id, passthrough and subscribe
+    """
+
+    return _layout_key(obj, _request_layouts, _ignored_keys)
 
 
 def dict_to_cache_key(obj: dict) -> bytes:
-    """convert the dictionary object to Pickled representation of object as bytes
+    """convert the dictionary object to a canonical key as bytes, for the storages that persist the keys
 
     Parameter
     ---------
@@ -12,14 +43,58 @@ def dict_to_cache_key(obj: dict) -> bytes:
     Returns
     ------- 
         bytes
-            Pickled representation of request object as bytes
+            The request_key of the request object as bytes
     """
 
-    cloned_obj: dict = obj.copy()
-    for key in ['req_id', 'passthrough', 'subscribe']:
-        cloned_obj.pop(key, None)
+    # the repr of the key depends only on the values, not on the objects that hold them
+    return repr(request_key(obj)).encode()
+
+
+def _layout_key(obj: dict, layouts: dict, ignored: frozenset = frozenset()) -> tuple:
+    order = tuple(obj)
+    names, getter, nested = layouts.get(order) or _new_layout(order, layouts, ignored)
+    values = getter(obj)
+    if not nested:
+        try:
+            # most requests are flat, only nested values can not be hashed
+            hash(values)
+        except TypeError:
+            # a field order with nested values keeps them, convert them without trying the hash next time
+            layouts[order] = names, getter, True
+        else:
+            return names, values
+    return names, _converted(values)
+
+
+def _converted(values: tuple) -> tuple:
+    values = list(values)
+    for index, value in enumerate(values):
+        if type(value) in _nested_types:
+            values[index] = _canonical(value)
+    return tuple(values)
+
+
+def _canonical(value) -> tuple:
+    # the type comes first, so a converted dict is never equal to a converted list
+    if type(value) is dict:
+        return (dict,) + _layout_key(value, _nested_layouts)
+    return list, _converted(value)
+
 
-    return pickle.dumps(cloned_obj)
+def _new_layout(order: tuple, layouts: dict, ignored: frozenset) -> Tuple[tuple, Callable, bool]:
+    if len(layouts) >= _max_layouts:
+        layouts.clear()
+    fields = tuple(sorted(field for field in order if field not in ignored))
+    if len(fields) > 1:
+        getter = itemgetter(*fields)
+    elif fields:
+        # itemgetter of one field returns the value itself, not a tuple. Asking for the field twice keeps it in C.
+        getter = itemgetter(fields[0], fields[0])
+    else:
+        def getter(_value: dict) -> tuple:
+            return ()
+    layout = layouts[order] = (fields, getter, False)
+    return layout
 
 
 def is_valid_url(url: str) -> bool:
@@ -58,7 +58,7 @@ sub emit_functions {
         # NOTE: Some type definitions use arrays, we don't support that yet
 
         my $send_props = parse_properties($send);
-        chomp(my $encoded_props = $json->encode($send_props));
+        my $props      = parse_properties($send, full => 1);
 
         push @methods, {
             # the real api method name e.g. proposal_open_contract
@@ -69,12 +69,35 @@ sub emit_functions {
             needs_method_arg => needs_method_arg($method, $send_props),
             description      => $send->{description},
             is_method        => exists $send_props->{$method},
-            encoded_props    => $encoded_props =~ s/"/'/rg =~ s/\n/\n        /rg =~ s/ :/:/rg,
-            props            => parse_properties($send, full => 1),
+            # the method acts on an account, it takes the loginid of the account
+            auth_required    => $send->{auth_required} ? 1 : 0,
+            props            => $props,
+            # the row of the method in the _api_methods table, as Python literals
+            literal => {
+                method      => py_literal($method),
+                description => py_literal($send->{description}),
+            },
+            params => [
+                map { {
+                    name        => py_literal($_),
+                    type        => py_literal($props->{$_}{type}),
+                    required    => $props->{$_}{required} ? 1 : 0,
+                    description => py_literal($props->{$_}{description}),
+                } } sort keys %$props
+            ],
         };
     }
 }
 
+# A string as a Python literal, JSON strings are valid Python strings. undef is None
+my $literal_json = JSON::MaybeXS->new(allow_nonref => 1);
+
+sub py_literal {
+    my ($value) = @_;
+    return 'None' unless defined $value;
+    return $literal_json->encode("$value");
+}
+
 sub parse_properties {
     my $schema   = shift;
     my %options  = @_;
@@ -9,6 +9,7 @@ setup(
     author_email='learning+python@deriv.com',
     license='MIT',
     install_requires=['websockets==10.3', 'reactivex==4.0.*'],
+    extras_require={'orjson': ['orjson']},
     test_suite='tests',
     url='https://github.com/binary-com/python-deriv-api',
     project_urls={
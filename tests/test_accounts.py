@@ -0,0 +1,58 @@
+import pytest
+from reactivex.subject import Subject
+
+from deriv_api.accounts import Accounts
+from deriv_api.errors import APIError
+
+
+class API:
+    def __init__(self):
+        self.sent = []
+        self.subscribed = []
+        self.balance = Subject()
+        self.sanity_errors = Subject()
+
+    async def send(self, request):
+        self.sent.append(request)
+        if 'authorize' in request:
+            return {'authorize': {'loginid': 'CR1', 'account_list': [{'loginid': 'CR1'}, {'loginid': 'CR2'}]}}
+        return {'echo_req': request}
+
+    async def subscribe(self, request, policy=None, buffer_size=100, replay=0):
+        self.subscribed.append(request)
+        if 'balance' in request:
+            return self.balance
+        return Subject()
+
+
+@pytest.mark.asyncio
+async def test_accounts():
+    api = API()
+    accounts = Accounts(api)
+    await accounts.authorize('token1', 'token2')
+    assert api.sent == [{'authorize': 'token1', 'tokens': ['token2']}]
+    assert accounts.loginids == ['CR1', 'CR2']
+    with pytest.raises(APIError, match='Account CR3 is not authorized'):
+        accounts.account('CR3')
+
+    account = accounts.account('CR2')
+    assert accounts.account('CR2') is account
+    response = await account.statement({'limit': 10})
+    assert response['echo_req'] == {'statement': 1, 'limit': 10, 'loginid': 'CR2'}, \
+        'account calls are sent with the loginid'
+    response = await account.ping()
+    assert response['echo_req'] == {'ping': 1}, 'the other calls do not take a loginid'
+    response = await account.send({'landing_company': 'svg', 'active_symbols': 'brief'})
+    assert response['echo_req'] == {'landing_company': 'svg', 'active_symbols': 'brief'}
+
+    await account.subscribe({'transaction': 1})
+    await account.subscribe({'ticks': 'R_100'})
+    assert api.subscribed == [{'transaction': 1, 'loginid': 'CR2'}, {'ticks': 'R_100'}]
+
+    balances = []
+    (await account.subscribe({'balance': 1})).subscribe(lambda response: balances.append(response))
+    await accounts.account('CR1').subscribe({'balance': 1})
+    assert api.subscribed[2:] == [{'balance': 1, 'account': 'all'}] * 2, 'the accounts subscribe to one balance stream'
+    api.balance.on_next({'balance': {'loginid': 'CR1', 'balance': 10}})
+    api.balance.on_next({'balance': {'loginid': 'CR2', 'balance': 20}})
+    assert balances == [{'balance': {'loginid': 'CR2', 'balance': 20}}]
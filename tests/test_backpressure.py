@@ -0,0 +1,70 @@
+import asyncio
+import pytest
+from reactivex.subject import Subject
+
+from deriv_api.backpressure import BufferedSource
+
+
+class API:
+    def __init__(self):
+        self.blocked_streams = set()
+        self.sanity_errors = Subject()
+
+
+def test_policy_validation():
+    with pytest.raises(ValueError, match='Unknown buffer policy'):
+        BufferedSource(API(), Subject(), 'keep-all')
+    with pytest.raises(ValueError, match='buffer_size must be a positive number'):
+        BufferedSource(API(), Subject(), 'block', 0)
+
+
+@pytest.mark.asyncio
+async def test_latest_only():
+    source = Subject()
+    stream = BufferedSource(API(), source, 'latest-only')
+    received = []
+    completed = []
+    stream.subscribe(received.append, on_completed=lambda: completed.append(True))
+    for i in range(5):
+        source.on_next(i)
+    await asyncio.sleep(0.01)
+    assert received == [4], 'only the newest message is delivered'
+    assert stream.conflated == 4
+    source.on_next(5)
+    source.on_completed()
+    await asyncio.sleep(0.01)
+    assert received == [4, 5] and completed == [True], 'completion is delivered after the buffered messages'
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest():
+    source = Subject()
+    stream = BufferedSource(API(), source, 'drop-oldest', 3)
+    received = []
+    stream.subscribe(received.append)
+    for i in range(5):
+        source.on_next(i)
+    await asyncio.sleep(0.01)
+    assert received == [2, 3, 4]
+    assert stream.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_block():
+    api = API()
+    source = Subject()
+    stream = BufferedSource(api, source, 'block', 2)
+    received = []
+    disposable = stream.subscribe(received.append)
+    source.on_next(1)
+    assert not api.blocked_streams
+    source.on_next(2)
+    assert len(api.blocked_streams) == 1, 'receive loop is blocked when the buffer is full'
+    blocked = next(iter(api.blocked_streams))
+    await blocked
+    assert not api.blocked_streams, 'released when the consumer catches up'
+    await asyncio.sleep(0.01)
+    assert received == [1, 2]
+    assert stream.blocked == 1
+    disposable.dispose()
+    assert not source.observers, 'disposing the consumer unsubscribes the source'
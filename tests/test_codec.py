@@ -0,0 +1,15 @@
+import json
+import pytest
+
+from deriv_api.codec import OrjsonCodec, default_codec
+
+
+def test_orjson_codec():
+    pytest.importorskip('orjson')
+    codec = OrjsonCodec()
+    request = {'ticks': 'R_50', 'req_id': 1}
+    assert isinstance(codec.dumps(request), str), 'encoded as text frame'
+    assert codec.loads(codec.dumps(request)) == request
+    assert json.loads(codec.dumps({'passthrough': {1: 'a'}})) == {'passthrough': {'1': 'a'}}, \
+        'fall back to json for data orjson can not encode'
+    assert isinstance(default_codec(), OrjsonCodec)
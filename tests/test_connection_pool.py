@@ -0,0 +1,62 @@
+import asyncio
+import json
+import pytest
+import reactivex.operators as op
+
+from deriv_api import ConnectionPool, DerivAPI
+from deriv_api.errors import ConstructionError
+
+
+class Connection:
+    """A connection that answers pings and streams ticks"""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.sent = []
+
+    async def send(self, data):
+        request = json.loads(data)
+        self.sent.append(request)
+        response = {'echo_req': request, 'req_id': request['req_id']}
+        if 'ticks' in request:
+            response.update({'msg_type': 'tick', 'subscription': {'id': f"{request['ticks']}-{id(self)}"}})
+        elif 'forget' in request:
+            response.update({'msg_type': 'forget', 'forget': 1})
+        else:
+            response.update({'msg_type': 'ping', 'ping': 'pong'})
+        self.queue.put_nowait(json.dumps(response))
+
+    async def recv(self):
+        return await self.queue.get()
+
+
+def test_construction():
+    with pytest.raises(ConstructionError, match='can not be shared'):
+        ConnectionPool(connection=Connection())
+    with pytest.raises(ConstructionError, match='pool_size must be a positive number'):
+        ConnectionPool(pool_size=0, app_id=1234)
+
+
+@pytest.mark.asyncio
+async def test_connection_pool():
+    connections = [Connection() for _ in range(3)]
+    pool = ConnectionPool(connections=connections)
+    assert len(pool.apis) == 3 and all(isinstance(api, DerivAPI) for api in pool.apis)
+
+    await asyncio.gather(*[pool.ping() for _ in range(6)])
+    assert all(connection.sent for connection in connections), 'one-shot calls are spread over the connections'
+
+    symbols = [f'R_{i}' for i in range(30)]
+    sources = [await pool.subscribe({'ticks': symbol}) for symbol in symbols]
+    await asyncio.gather(*[source.pipe(op.first(), op.to_future()) for source in sources])
+    owners = [[c for c in connections if {'ticks': s, 'subscribe': 1} in
+               [{k: v for k, v in r.items() if k != 'req_id'} for r in c.sent]] for s in symbols]
+    assert all(len(owner) == 1 for owner in owners), 'every subscription is sent on one connection'
+    assert len({id(owner[0]) for owner in owners}) == 3, 'subscriptions are spread over the connections'
+    assert (await pool.subscribe({'ticks': 'R_0'})) is sources[0], 'the same request goes to the same connection'
+
+    subs_id = f'R_0-{id(owners[0][0])}'
+    response = await pool.forget(subs_id)
+    assert response['forget'] == 1
+    assert owners[0][0].sent[-1]['forget'] == subs_id, 'forget is sent on the connection of the subscription'
+    await pool.clear()
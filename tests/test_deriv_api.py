@@ -1,12 +1,15 @@
 import asyncio
+import concurrent.futures
+import threading
 import pytest
 import pytest_mock
 import reactivex
 from websockets.frames import Close
 
 import deriv_api
-from deriv_api.errors import APIError, ConstructionError, ResponseError
+from deriv_api.errors import APIError, ConstructionError, RequestTimeoutError, ResponseError
 from deriv_api.easy_future import EasyFuture
+from deriv_api.lazy_response import LazyResponse
 from reactivex.subject import Subject
 import reactivex.operators as op
 import pickle
@@ -231,11 +234,11 @@ async def test_subscription():
     result = await asyncio.gather(f1, f2)
     assert result == [[r50_data, r50_data], [r100_data, r100_data]]
     await asyncio.sleep(0.01)  # wait sending 'forget' finished
-    assert wsconnection.called['send'] == [
-        '{"ticks": "R_50", "subscribe": 1, "req_id": 1}',
-        '{"ticks": "R_100", "subscribe": 1, "req_id": 2}',
-        '{"forget": "A11111", "req_id": 3}',
-        '{"forget": "A22222", "req_id": 4}']
+    assert [json.loads(r) for r in wsconnection.called['send']] == [
+        {"ticks": "R_50", "subscribe": 1, "req_id": 1},
+        {"ticks": "R_100", "subscribe": 1, "req_id": 2},
+        {"forget": "A11111", "req_id": 3},
+        {"forget": "A22222", "req_id": 4}]
     wsconnection.clear()
     await api.clear()
 
@@ -310,7 +313,7 @@ async def test_response_error():
     wsconnection.data.append(r50_data) # add back r50 again
     #will send a `forget` if get a response again
     await asyncio.sleep(0.1)
-    assert wsconnection.called['send'][-1] == '{"forget": "A111111", "req_id": 2}'
+    assert json.loads(wsconnection.called['send'][-1]) == {"forget": "A111111", "req_id": 2}
     poc_data = {
         'echo_req': {'proposal_open_contract': 1, 'subscribe': 1},
         'msg_type': 'proposal_open_contract',
@@ -369,9 +372,9 @@ async def test_can_subscribe_one_source_many_times():
     result = await asyncio.gather(f1,f2)
     assert result == [[r50_data, r50_data],[r50_data, r50_data]]
     await asyncio.sleep(0.01)  # wait sending 'forget' finished
-    assert wsconnection.called['send'] == [
-        '{"ticks": "R_50", "subscribe": 1, "req_id": 1}',
-        '{"forget": "A11111", "req_id": 2}']
+    assert [json.loads(r) for r in wsconnection.called['send']] == [
+        {"ticks": "R_50", "subscribe": 1, "req_id": 1},
+        {"forget": "A11111", "req_id": 2}]
     wsconnection.clear()
     await api.clear()
 
@@ -491,3 +494,450 @@ async def test_eventgs():
     assert event_data == [{'name': 'send', 'data': {'ping': 1, 'req_id': 1}}, {'name': 'message', 'data': wsdata}]
     wsconnection.clear()
     await api.clear()
+
+@pytest.mark.asyncio
+async def test_pending_requests_cleanup():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, request_timeout=0.1)
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    await api.ping({'ping': 1})
+    assert len(api.pending_requests) == 0, 'one-shot request is removed after the response'
+    with pytest.raises(RequestTimeoutError):
+        await api.send({'time': 1})
+    assert len(api.pending_requests) == 0, 'expired request is removed'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_reconnect(mocker):
+    class MockedWs3(MockedWs):
+        def __init__(self):
+            self.closed = EasyFuture()
+            super().__init__()
+        async def recv(self):
+            data_future = asyncio.ensure_future(super().recv())
+            await asyncio.wait([data_future, self.closed], return_when=asyncio.FIRST_COMPLETED)
+            if self.closed.done():
+                data_future.cancel()
+                raise ConnectionClosedError(Close(1006, 'network error'), None, None)
+            return data_future.result()
+        async def close(self):
+            pass
+
+    wsconnection1 = MockedWs3()
+    wsconnection2 = MockedWs3()
+    connections = iter([wsconnection1, wsconnection2])
+    async def connect(url):
+        return next(connections)
+    mocker.patch('websockets.connect', connect)
+    api = deriv_api.DerivAPI(app_id=1234, endpoint='localhost', reconnect_delay=0.01)
+    wsconnection1.add_data({'echo_req': {'authorize': 'token'}, 'msg_type': 'authorize', 'authorize': {'loginid': 'CR1'}})
+    await api.authorize('token')
+    wsconnection1.add_data({
+        'echo_req': {'ticks': 'R_50', 'subscribe': 1},
+        'msg_type': 'tick',
+        'subscription': {'id': 'A11111'}
+    })
+    ticks = await api.subscribe({'ticks': 'R_50'})
+    received = []
+    ticks.subscribe(lambda data: received.append(data['subscription']['id']))
+    await asyncio.sleep(0.05)
+    assert received and received[-1] == 'A11111'
+
+    wsconnection2.add_data({'echo_req': {'authorize': 'token'}, 'msg_type': 'authorize', 'authorize': {'loginid': 'CR1'}})
+    wsconnection2.add_data({
+        'echo_req': {'ticks': 'R_50', 'subscribe': 1},
+        'msg_type': 'tick',
+        'subscription': {'id': 'A22222'}
+    })
+    wsconnection1.closed.resolve(True)
+    await asyncio.sleep(0.2)
+    assert received[-1] == 'A22222', 'the same observable receives data from the new connection'
+    assert [json.loads(r) for r in wsconnection2.called['send']] == [
+        {'authorize': 'token', 'req_id': 3},
+        {'ticks': 'R_50', 'subscribe': 1, 'req_id': 2}], 'authorize again and resubscribe with the same req_id'
+    assert list(api.subscription_manager.subs_id_to_key) == ['A22222'], 'the new subscription id is saved'
+    assert api.connected.is_resolved()
+    wsconnection1.clear()
+    wsconnection2.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_codec():
+    class Codec:
+        def __init__(self):
+            self.called = {'loads': 0, 'dumps': 0}
+        def loads(self, data):
+            self.called['loads'] += 1
+            return json.loads(data)
+        def dumps(self, obj):
+            self.called['dumps'] += 1
+            return json.dumps(obj)
+
+    codec = Codec()
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, codec=codec)
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    await api.ping({'ping': 1})
+    assert codec.called == {'loads': 1, 'dumps': 1}
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_lazy_decode():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, lazy_decode=True)
+    r50_data = {
+        'echo_req': {'ticks': 'R_50', 'subscribe': 1},
+        'msg_type': 'tick',
+        'subscription': {'id': 'A11111'}
+    }
+    wsconnection.add_data(r50_data)
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    sub1 = await api.subscribe({'ticks': 'R_50'})
+    result = await sub1.pipe(op.take(2), op.to_list(), op.to_future())
+    assert isinstance(result[1], LazyResponse)
+    assert json.loads(result[1].raw) == r50_data
+    assert result[1] == r50_data
+    response = await api.ping({'ping': 1})
+    assert isinstance(response, dict), 'one-shot responses are decoded'
+
+    r100_data = {'echo_req': {'ticks': 'R_100', 'subscribe': 1}, 'msg_type': 'tick', 'subscription': {'id': 'A22222'}}
+    wsconnection.add_data(r100_data)
+    ticks = []
+    (await api.subscribe({'ticks': 'R_100'})).subscribe(ticks.append)
+    expected_tick = api.expect_response('tick')
+    wsconnection.add_data(r100_data)
+    assert await asyncio.wait_for(expected_tick, 1) == r100_data
+    assert not isinstance(ticks[-1], LazyResponse), 'a response that is expected is decoded'
+    wsconnection.add_data(r100_data)
+    await asyncio.sleep(0.05)
+    assert len(ticks) == 3
+    assert isinstance(ticks[-1], LazyResponse), 'lazy decoding goes on once the expected response is received'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_subscribe_with_policy():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    r50_data = {
+        'echo_req': {'ticks': 'R_50', 'subscribe': 1},
+        'msg_type': 'tick',
+        'subscription': {'id': 'A11111'}
+    }
+    wsconnection.add_data(r50_data)
+    sub1 = await api.subscribe({'ticks': 'R_50'}, policy='latest-only')
+    result = await sub1.pipe(op.take(2), op.to_list(), op.to_future())
+    assert result == [r50_data, r50_data]
+    assert sub1.conflated == 0
+    with pytest.raises(ValueError, match='Unknown buffer policy'):
+        await api.subscribe({'ticks': 'R_50'}, policy='no such policy')
+    await asyncio.sleep(0.01)  # wait sending 'forget' finished
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_coalesce():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    wsconnection.add_data({'echo_req': {'contracts_for': 'R_50'}, 'msg_type': 'contracts_for',
+                           'contracts_for': {'available': []}})
+    responses = await asyncio.gather(*[api.contracts_for({'contracts_for': 'R_50'}) for _ in range(5)])
+    assert len(wsconnection.called['send']) == 1, 'identical requests in flight share one round trip'
+    assert all(response is responses[0] for response in responses)
+    assert api.in_flight == {}
+
+    wsconnection.add_data({'echo_req': {'contracts_for': 'R_50'}, 'msg_type': 'contracts_for',
+                           'contracts_for': {'available': []}})
+    await api.contracts_for({'contracts_for': 'R_50'})
+    assert len(wsconnection.called['send']) == 2, 'a finished request is not reused'
+
+    api.coalesce_calls = set()
+    first = asyncio.create_task(api.contracts_for({'contracts_for': 'R_50'}))
+    second = asyncio.create_task(api.contracts_for({'contracts_for': 'R_50'}))
+    await asyncio.sleep(0.01)
+    assert len(wsconnection.called['send']) == 4, 'coalescing can be disabled'
+    first.cancel()
+    second.cancel()
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_rate_limit():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, rate_limit={'max_requestes_general': {'minutely': 600}})
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    await api.ping({'ping': 1})
+    assert api.rate_limiter.levels()['max_requestes_general']['minutely'] == pytest.approx(599, abs=1)
+    api.rate_limiter.buckets['max_requestes_general']['minutely'].tokens = 0
+    wsconnection.add_data({'time': 1, 'msg_type': 'time', 'echo_req': {'time': 1}})
+    time_task = asyncio.create_task(api.time())
+    await asyncio.sleep(0.05)
+    assert len(wsconnection.called['send']) == 1, 'the request waits for the limit'
+    await time_task
+    assert len(wsconnection.called['send']) == 2
+    wsconnection.clear()
+    await api.clear()
+
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, rate_limit=True)
+    wsconnection.add_data({'website_status': {'api_call_limits': {
+        'max_requestes_general': {'hourly': 14400, 'minutely': 180}}}, 'msg_type': 'website_status',
+        'echo_req': {'website_status': 1}})
+    await asyncio.sleep(0.1)
+    assert list(api.rate_limiter.levels()) == ['max_requestes_general'], 'the limits are read from website_status'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_send_priority():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, coalesce=[])
+    wsconnection.add_data({'echo_req': {'ticks_history': 'R_50', 'end': 'latest'}, 'msg_type': 'history', 'history': {}})
+    wsconnection.add_data({'echo_req': {'time': 1}, 'msg_type': 'time', 'time': 1})
+    wsconnection.add_data({'echo_req': {'sell': 1, 'price': 10}, 'msg_type': 'sell', 'sell': {}})
+    await asyncio.gather(api.ticks_history({'ticks_history': 'R_50', 'end': 'latest'}), api.time(),
+                         api.sell({'sell': 1, 'price': 10}))
+    assert [next(iter(json.loads(request))) for request in wsconnection.called['send']] == \
+           ['sell', 'time', 'ticks_history'], 'trade calls are sent first, bulk data calls last'
+    with pytest.raises(ValueError, match='Unknown priority urgent'):
+        await api.send({'ping': 1}, priority='urgent')
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_send_many():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    symbols = ['R_10', 'R_25', 'R_50', 'R_75', 'R_100']
+    for symbol in symbols:
+        if symbol != 'R_25':
+            wsconnection.add_data({'echo_req': {'contracts_for': symbol}, 'msg_type': 'contracts_for',
+                                   'contracts_for': {'symbol': symbol}})
+    wsconnection.add_data({'echo_req': {'contracts_for': 'R_25'}, 'msg_type': 'contracts_for',
+                           'error': {'code': 'InvalidSymbol', 'message': 'Invalid symbol'}})
+    sent = []
+    api.events.on('send').subscribe(lambda event: sent.append(len(api.pending_requests)))
+    requests = [{'contracts_for': symbol} for symbol in symbols] + [{'ticks_history': 'R_50'}, {'symbol': 'R_50'}]
+    responses = await api.send_many(requests, concurrency=2)
+    assert [r['contracts_for']['symbol'] for r in responses[:5] if not isinstance(r, Exception)] == \
+           ['R_10', 'R_50', 'R_75', 'R_100']
+    assert isinstance(responses[1], ResponseError)
+    assert isinstance(responses[5], ValueError), 'requests are validated by their API method'
+    assert isinstance(responses[6], APIError)
+    assert max(sent) < 2, 'at most concurrency requests are in flight'
+    assert requests[0] == {'contracts_for': 'R_10'}, 'the requests are not changed'
+
+    wsconnection.add_data({'echo_req': {'ping': 1}, 'msg_type': 'ping', 'ping': 'pong'})
+    wsconnection.add_data({'echo_req': {'time': 1}, 'msg_type': 'time', 'time': 1})
+    results = [index async for index, response in api.send_many_as_completed([{'ping': 1}, {'time': 1}])]
+    assert sorted(results) == [0, 1]
+
+    wsconnection.add_data({'echo_req': {'landing_company': 'svg', 'active_symbols': 'brief'},
+                           'msg_type': 'active_symbols', 'active_symbols': []})
+    responses = await api.send_many([{'landing_company': 'svg', 'active_symbols': 'brief'},
+                                     {'ticks': 'R_50', 'subscribe': 1}])
+    assert responses[0]['msg_type'] == 'active_symbols', 'the call is not taken from a parameter'
+    assert json.loads(wsconnection.called['send'][-1])['active_symbols'] == 'brief'
+    assert isinstance(responses[1], APIError), 'subscriptions are not sent in a batch'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_submit_threadsafe():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    loop = asyncio.get_running_loop()
+    wsconnection.add_data({'ping': 'pong', 'msg_type': 'ping', 'echo_req': {'ping': 1}})
+    request = {'ping': 1}
+    future = await loop.run_in_executor(None, api.submit_threadsafe, request)
+    assert (await asyncio.wrap_future(future))['ping'] == 'pong'
+    assert request == {'ping': 1}, 'the request is not changed'
+    with pytest.raises(APIError, match='Use subscribe_threadsafe'):
+        api.submit_threadsafe({'ticks': 'R_50', 'subscribe': 1})
+
+    wsconnection.add_data({'ticks': 'R_50', 'subscription': {'id': 'A11111'}, 'msg_type': 'tick',
+                           'echo_req': {'ticks': 'R_50', 'subscribe': 1}})
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    threads = []
+    ticked = asyncio.Event()
+
+    def on_tick(response):
+        threads.append(threading.current_thread())
+        loop.call_soon_threadsafe(ticked.set)
+
+    future = await loop.run_in_executor(None, lambda: api.subscribe_threadsafe({'ticks': 'R_50'}, on_tick,
+                                                                               executor=executor))
+    subscription = await asyncio.wrap_future(future)
+    await asyncio.wait_for(ticked.wait(), 1)
+    assert threads[0] is not threading.current_thread(), 'the callbacks run on the executor'
+    await loop.run_in_executor(None, subscription.dispose)
+    await asyncio.sleep(0.05)
+    executor.shutdown()
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_submit_threadsafe_limits():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, rate_limit={'max_requestes_general': {'minutely': 600}})
+    loop = asyncio.get_running_loop()
+    api.rate_limiter.buckets['max_requestes_general']['minutely'].tokens = 0
+    wsconnection.add_data({'authorize': {'loginid': 'CR90000000'}, 'msg_type': 'authorize',
+                           'echo_req': {'authorize': 'a1-token'}})
+    future = await loop.run_in_executor(None, api.submit_threadsafe, {'authorize': 'a1-token'})
+    await asyncio.sleep(0.05)
+    assert len(wsconnection.called['send']) == 0, 'the request waits for the rate limiter'
+    await asyncio.wait_for(asyncio.wrap_future(future), 1)
+    assert len(wsconnection.called['send']) == 1
+    assert api.authorize_request == {'authorize': 'a1-token'}, 'the authorize request is kept for reconnecting'
+    wsconnection.clear()
+    await api.clear()
+
+@pytest.mark.asyncio
+async def test_validate_modes():
+    wsconnection = MockedWs()
+    with pytest.raises(ConstructionError, match='validate must be one of: full, sampled, off'):
+        deriv_api.DerivAPI(connection=wsconnection, validate='some')
+    wsconnection.clear()
+
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, validate='off')
+    wsconnection.add_data({'echo_req': {'ticks_history': 'R_50'}, 'msg_type': 'history', 'history': {}})
+    response = await api.ticks_history('R_50')
+    assert response['msg_type'] == 'history', 'the arguments are not validated'
+    wsconnection.clear()
+    await api.clear()
+
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, validate='sampled', validate_sample=2)
+    sanity_errors = []
+    api.sanity_errors.subscribe(sanity_errors.append)
+    wsconnection.add_data({'echo_req': {'ticks_history': 'R_50'}, 'msg_type': 'history', 'history': {}})
+    await api.ticks_history('R_50')
+    assert sanity_errors == [], 'the first call is not sampled'
+    wsconnection.add_data({'echo_req': {'ticks_history': 'R_50'}, 'msg_type': 'history', 'history': {}})
+    await api.ticks_history('R_50')
+    assert len(sanity_errors) == 1 and isinstance(sanity_errors[0], APIError)
+    assert str(sanity_errors[0]) == 'APIError:Invalid arguments of ticks_history: Required parameters missing: end'
+    wsconnection.clear()
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_tick_history():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    with pytest.raises(APIError, match='Tick history is not kept'):
+        api.tick_history('R_50')
+    await asyncio.sleep(0.05)
+    wsconnection.clear()
+    await api.clear()
+
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection, tick_history=10)
+    assert api.tick_history('R_50') is None, 'no tick is received yet'
+    wsconnection.add_data({'echo_req': {'ticks': 'R_50', 'subscribe': 1}, 'msg_type': 'tick',
+                           'subscription': {'id': 'A11111'},
+                           'tick': {'epoch': 1, 'quote': 100.5, 'bid': 100.4, 'ask': 100.6, 'symbol': 'R_50'}})
+    ticks = await api.subscribe({'ticks': 'R_50'})
+    await ticks.pipe(op.first(), op.to_future())
+    history = api.tick_history('R_50')
+    assert list(history.last()['quote']) == [100.5]
+    assert list(history.last()['ask']) == [100.6]
+    wsconnection.clear()
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_drops_queued_requests(mocker):
+    class GatedWs(MockedWs):
+        def __init__(self):
+            self.closed = EasyFuture()
+            self.gate = asyncio.get_event_loop().create_future()
+            super().__init__()
+        async def send(self, request):
+            # the writer is held on the ping, the requests after it stay queued
+            if 'ping' in request:
+                await self.gate
+            await super().send(request)
+        async def recv(self):
+            data_future = asyncio.ensure_future(super().recv())
+            await asyncio.wait([data_future, self.closed], return_when=asyncio.FIRST_COMPLETED)
+            if self.closed.done():
+                data_future.cancel()
+                raise ConnectionClosedError(Close(1006, 'network error'), None, None)
+            return data_future.result()
+        async def close(self):
+            pass
+
+    wsconnection1 = GatedWs()
+    wsconnection2 = GatedWs()
+    wsconnection2.gate.set_result(None)
+    connections = iter([wsconnection1, wsconnection2])
+    async def connect(url):
+        return next(connections)
+    mocker.patch('websockets.connect', connect)
+    api = deriv_api.DerivAPI(app_id=1234, endpoint='localhost', reconnect_delay=0.01)
+    ping = asyncio.ensure_future(api.ping({'ping': 1}))
+    await asyncio.sleep(0.05)
+    buy = asyncio.ensure_future(api.buy({'buy': '1', 'price': 10}))
+    await asyncio.sleep(0.05)
+    assert len(api.send_queue) == 1, 'the buy is queued'
+    wsconnection1.closed.resolve(True)
+    with pytest.raises(ConnectionClosedError):
+        await buy
+    with pytest.raises(ConnectionClosedError):
+        await ping
+    assert len(api.send_queue) == 0, 'the rejected buy is removed from the queue'
+    wsconnection1.gate.set_result(None)
+    await asyncio.sleep(0.1)
+    assert api.connected.is_resolved()
+    sent = [json.loads(r) for r in wsconnection1.called['send'] + wsconnection2.called['send']]
+    assert [r for r in sent if 'buy' in r] == [], 'the rejected buy is never written'
+    wsconnection1.clear()
+    wsconnection2.clear()
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_cleanup():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    for _ in range(3):
+        with pytest.raises(TypeError):
+            await api.send({'ping': object()})
+    assert len(api.pending_requests) == 0, 'the requests that could not be written are removed'
+    wsconnection.clear()
+    await api.clear()
+
+
+@pytest.mark.asyncio
+async def test_accounts_balance_resubscribe():
+    wsconnection = MockedWs()
+    api = deriv_api.DerivAPI(connection=wsconnection)
+    wsconnection.add_data({'authorize': {'loginid': 'CR1', 'account_list': [{'loginid': 'CR1'}, {'loginid': 'CR2'}]},
+                           'msg_type': 'authorize', 'echo_req': {'authorize': 'token1', 'tokens': ['token2']}})
+    await api.accounts.authorize('token1', 'token2')
+    balance_data = {'balance': {'loginid': 'CR2', 'balance': 20}, 'msg_type': 'balance',
+                    'subscription': {'id': 'B11111'}, 'echo_req': {'balance': 1, 'account': 'all', 'subscribe': 1}}
+    wsconnection.add_data(balance_data)
+    account = api.accounts.account('CR2')
+    balances = []
+    subscription = (await account.subscribe({'balance': 1})).subscribe(balances.append)
+    await asyncio.sleep(0.05)
+    subscription.dispose()
+    await asyncio.sleep(0.05)
+    assert any(json.loads(request).get('forget') == 'B11111' for request in wsconnection.called['send'])
+
+    wsconnection.add_data({**balance_data, 'subscription': {'id': 'B22222'}})
+    subscription = (await account.subscribe({'balance': 1})).subscribe(balances.append)
+    await asyncio.sleep(0.05)
+    assert [json.loads(request).get('balance') for request in wsconnection.called['send']].count(1) == 2, \
+        'the balance stream is subscribed again after it was forgotten'
+    assert balances[-1]['subscription']['id'] == 'B22222'
+    subscription.dispose()
+    await asyncio.sleep(0.05)
+    wsconnection.clear()
+    await api.clear()
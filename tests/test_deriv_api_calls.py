@@ -1,6 +1,8 @@
+import copy
 import pytest
 import re
-from deriv_api.deriv_api_calls import DerivAPICalls, parse_args, validate_args
+from deriv_api import deriv_api_calls
+from deriv_api.deriv_api_calls import APIMethods, DerivAPICalls, parse_args, validate_args
 
 class DerivedDerivAPICalls(DerivAPICalls):
     async def send(self, args):
@@ -55,3 +57,43 @@ def test_validate_args():
     assert re.search("boolean value expected but found <class 'str'>: k4", error_msg)
     error_msg = validate_args(config, {'k1': {}, 'k2': "string", 'k3': 1, 'k4': True, 'k5': 1})
     assert error_msg == ''
+
+
+@pytest.mark.parametrize('method,args', [
+    ('proposal', {'proposal': 1, 'amount': '10', 'basis': 'stake', 'contract_type': 'CALL', 'currency': 'USD',
+                  'duration': 5, 'duration_unit': 't', 'symbol': 'R_100'}),
+    ('proposal', {'amount': 10, 'duration': '5'}),
+    ('proposal', {'amount': 10, 'unknown': 1}),
+    ('buy', {'buy': '1', 'price': 10, 'parameters': {'amount': 10}}),
+    ('buy', {'price': 'x'}),
+    ('ticks_history', 'R_100'),
+    ('ticks_history', {'ticks_history': 100, 'end': 'latest', 'count': 10.5}),
+    ('ping', {'ping': 2, 'req_id': '1'}),
+])
+def test_method_checks(method, args):
+    config, check = deriv_api_calls.api_method_check(method)
+    generic_args = copy.deepcopy(args)
+    generic_args = {method: generic_args} if not isinstance(generic_args, dict) else generic_args
+    try:
+        expected = deriv_api_calls._check_generic(method, generic_args, config)
+    except Exception as err:
+        with pytest.raises(type(err), match=re.escape(str(err))):
+            check(copy.deepcopy(args))
+        return
+    assert check(copy.deepcopy(args)) == expected, 'same result and error message as the generic path'
+
+
+def test_lazy_api_methods():
+    assert 'proposal' in dir(DerivAPICalls), 'the API methods are listed before they are built'
+    method = DerivAPICalls.exchange_rates
+    assert method is DerivAPICalls.exchange_rates, 'the method is built once'
+    assert method.__name__ == 'exchange_rates'
+    assert 'Retrieves the exchange rates from a base currency to all currencies supported by the system.' in method.__doc__
+    assert 'base_currency : str' in method.__doc__
+    assert DerivedDerivAPICalls().exchange_rates.__func__ is method
+    with pytest.raises(AttributeError):
+        DerivAPICalls.no_such_call
+    with pytest.raises(AttributeError):
+        DerivedDerivAPICalls().no_such_call
+    with pytest.raises(TypeError):
+        APIMethods()
@@ -0,0 +1,22 @@
+from deriv_api.events import Events
+
+
+def test_events():
+    events = Events()
+    assert not events.has_observers('send')
+    all_events = []
+    send_events = []
+    events.on('send').subscribe(send_events.append)
+    assert events.has_observers('send')
+    assert not events.has_observers('message')
+    events.emit('message', {'msg_type': 'ping'})
+    events.emit('send', {'ping': 1})
+    assert send_events == [{'name': 'send', 'data': {'ping': 1}}], "channel only receives its own event"
+
+    disposable = events.subscribe(all_events.append)
+    assert events.has_observers('message')
+    events.emit('message', {'msg_type': 'ping'})
+    events.on_next({'name': 'connect'})
+    assert all_events == [{'name': 'message', 'data': {'msg_type': 'ping'}}, {'name': 'connect'}]
+    disposable.dispose()
+    assert not events.has_observers('message'), "no observers after dispose"
@@ -0,0 +1,53 @@
+import json
+
+from deriv_api.lazy_response import LazyResponse, peek_msg_type, peek_req_id
+
+
+def test_peek_req_id():
+    tick = {'echo_req': {'ticks': 'R_50', 'req_id': 3}, 'msg_type': 'tick', 'req_id': 3,
+            'subscription': {'id': 'A11111'}, 'tick': {'quote': 1.23}}
+    assert peek_req_id(json.dumps(tick)) == 3
+    assert peek_req_id(json.dumps({'msg_type': 'tick'})) is None, 'no req_id'
+    assert peek_req_id(json.dumps({'req_id': 3, 'echo_req': {'passthrough': {'req_id': 4}}})) is None, \
+        'ambiguous req_id'
+    assert peek_req_id(json.dumps({'req_id': 3, 'error': {'code': 'Error'}})) is None, 'errors are decoded'
+
+
+def test_peek_msg_type():
+    assert peek_msg_type(json.dumps({'echo_req': {'ticks': 'R_50'}, 'msg_type': 'tick', 'req_id': 3})) == 'tick'
+    assert peek_msg_type(json.dumps({'req_id': 3})) is None, 'no msg_type'
+    assert peek_msg_type(json.dumps({'msg_type': 'tick', 'echo_req': {'passthrough': {'msg_type': 'ping'}}})) is None, \
+        'ambiguous msg_type'
+
+
+def test_lazy_response():
+    data = {'msg_type': 'tick', 'req_id': 3, 'subscription': {'id': 'A11111'}, 'tick': {'quote': 1.23}}
+    raw = json.dumps(data)
+    decoded = []
+
+    def loads(frame):
+        decoded.append(frame)
+        return json.loads(frame)
+
+    response = LazyResponse(raw, loads, 3)
+    assert response.raw == raw
+    assert response.msg_type == 'tick'
+    assert response.subscription_id == 'A11111'
+    assert decoded == [], 'nothing is decoded before reading the data'
+    assert response['tick']['quote'] == 1.23
+    assert response == data
+    assert dict(response) == data
+    assert response.get('no such key') is None
+    assert len(decoded) == 1, 'decoded only once'
+
+
+def test_lazy_response_ambiguous_frame():
+    data = {'echo_req': {'passthrough': {'msg_type': 'ping', 'subscription': {'id': 'P11111'}}}, 'msg_type': 'tick',
+            'subscription': {'id': 'A11111'}}
+    response = LazyResponse(json.dumps(data), json.loads)
+    assert response.msg_type == 'tick', 'the passthrough is not mistaken for the msg_type'
+    response = LazyResponse(json.dumps(data), json.loads)
+    assert response.subscription_id == 'A11111', 'the passthrough is not mistaken for the subscription'
+    response = LazyResponse(json.dumps({'msg_type': 'ping', 'ping': 'pong'}), json.loads)
+    assert response.subscription_id is None
+    assert response._data is None, 'a frame without subscription is not decoded'
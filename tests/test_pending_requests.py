@@ -0,0 +1,69 @@
+import asyncio
+import pytest
+from reactivex.subject import Subject
+import reactivex.operators as op
+
+from deriv_api.errors import RequestTimeoutError
+from deriv_api.pending_requests import PendingRequests
+
+
+class API:
+    def __init__(self):
+        self.sanity_errors = Subject()
+
+
+@pytest.mark.asyncio
+async def test_pending_requests():
+    pending_requests = PendingRequests(API())
+    one_shot = Subject()
+    subscription = Subject()
+    pending_requests.add(1, one_shot)
+    pending_requests.add(2, subscription, subscription=True)
+    assert len(pending_requests) == 2
+    assert pending_requests.size() == 2
+    assert 1 in pending_requests and 2 in pending_requests
+    assert pending_requests.response_received(1) is one_shot
+    assert 1 not in pending_requests, "one-shot request is removed after the response"
+    assert pending_requests.response_received(2) is subscription
+    assert 2 in pending_requests, "subscription stays after the first response"
+    subscription.on_completed()
+    assert len(pending_requests) == 0, "completed subscription is removed"
+    errored = Subject()
+    pending_requests.add(3, errored, subscription=True)
+    errored.on_error(Exception('an error'))
+    assert len(pending_requests) == 0, "failed subscription is removed"
+
+
+@pytest.mark.asyncio
+async def test_pending_requests_timeout():
+    pending_requests = PendingRequests(API(), timeout=0.05)
+    slow = Subject()
+    answered = Subject()
+    no_timeout = Subject()
+    pending_requests.add(1, slow)
+    pending_requests.add(2, answered, subscription=True)
+    pending_requests.add(3, no_timeout, timeout=10)
+    slow_result = slow.pipe(op.first(), op.to_future())
+    pending_requests.response_received(2)
+    await asyncio.sleep(0.1)
+    with pytest.raises(RequestTimeoutError, match='No response received for req_id 1'):
+        await slow_result
+    assert 1 not in pending_requests, "expired request is removed"
+    assert 2 in pending_requests, "answered request does not expire"
+    assert 3 in pending_requests, "request with a longer timeout is still waiting"
+    pending_requests.reject_all(Exception('closed'))
+    assert len(pending_requests) == 0
+
+
+@pytest.mark.asyncio
+async def test_pending_requests_future():
+    pending_requests = PendingRequests(API(), timeout=0.05)
+    future = asyncio.get_event_loop().create_future()
+    pending_requests.add(1, future)
+    assert pending_requests.response_received(1) is future
+    assert len(pending_requests) == 0
+    future = asyncio.get_event_loop().create_future()
+    pending_requests.add(2, future)
+    with pytest.raises(RequestTimeoutError):
+        await future
+    assert len(pending_requests) == 0, "expired future is removed"
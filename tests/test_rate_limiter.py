@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+import pytest
+
+from deriv_api.rate_limiter import RateLimiter, TokenBucket
+
+api_call_limits = {
+    'max_proposal_subscription': {'applies_to': 'subscribing to proposal concurrently', 'max': 5},
+    'max_requestes_general': {'applies_to': 'rest of calls', 'hourly': 14400, 'minutely': 180},
+    'max_requestes_outcome': {'applies_to': 'portfolio, statement and proposal', 'hourly': 1500, 'minutely': 25},
+    'max_requestes_pricing': {'applies_to': 'proposal and proposal_open_contract', 'hourly': 3600, 'minutely': 80}
+}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket():
+    bucket = TokenBucket(2, 0.1)
+    assert bucket.level() == 2
+    await bucket.take()
+    await bucket.take()
+    assert bucket.level() < 1
+    start = time.monotonic()
+    await asyncio.gather(bucket.take(), bucket.take())
+    assert time.monotonic() - start >= 0.09, "the calls over the limit wait for the refill"
+    await asyncio.sleep(0.2)
+    assert bucket.level() == 2, "the bucket is not filled over its capacity"
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter():
+    rate_limiter = RateLimiter()
+    assert rate_limiter.levels() == {}
+    await rate_limiter.acquire({'ping': 1})
+
+    rate_limiter.configure(api_call_limits)
+    assert set(rate_limiter.levels()) == {'max_requestes_general', 'max_requestes_outcome', 'max_requestes_pricing'}
+    assert rate_limiter.categories({'ping': 1}) == ['max_requestes_general']
+    assert rate_limiter.categories({'proposal': 1, 'amount': 10}) == ['max_requestes_outcome', 'max_requestes_pricing']
+    assert rate_limiter.categories({'proposal_open_contract': 1}) == ['max_requestes_pricing']
+
+    await rate_limiter.acquire({'proposal': 1})
+    levels = rate_limiter.levels()
+    assert levels['max_requestes_outcome']['minutely'] == pytest.approx(24, abs=0.1)
+    assert levels['max_requestes_pricing']['hourly'] == pytest.approx(3599, abs=0.1)
+    assert levels['max_requestes_general']['minutely'] == pytest.approx(180)
+
+    outcome_bucket = rate_limiter.buckets['max_requestes_outcome']['minutely']
+    rate_limiter.configure(api_call_limits)
+    assert rate_limiter.buckets['max_requestes_outcome']['minutely'] is outcome_bucket, "unchanged bucket is kept"
+    rate_limiter.configure({'max_requestes_general': {'minutely': 60}})
+    assert list(rate_limiter.buckets) == ['max_requestes_general']
+    assert list(rate_limiter.buckets['max_requestes_general']) == ['minutely']
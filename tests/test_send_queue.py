@@ -0,0 +1,70 @@
+import asyncio
+import json
+import pytest
+from reactivex.subject import Subject
+import reactivex.operators as op
+
+from deriv_api.easy_future import EasyFuture
+from deriv_api.pending_requests import PendingRequests
+from deriv_api.send_queue import SendQueue
+
+
+class Connection:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+
+class API:
+    def __init__(self):
+        self.connected = EasyFuture()
+        self.wsconnection = Connection()
+        self.sanity_errors = Subject()
+        self.codec = json
+        self.pending_requests = PendingRequests(self)
+
+
+@pytest.mark.asyncio
+async def test_send_queue():
+    api = API()
+    send_queue = SendQueue(api)
+    writer = asyncio.create_task(send_queue.run())
+    send_queue.put({'ticks_history': 'R_50', 'req_id': 1}, Subject())
+    send_queue.put({'contracts_for': 'R_50', 'req_id': 2}, Subject())
+    send_queue.put({'ping': 1, 'req_id': 3}, Subject())
+    send_queue.put({'proposal': 1, 'amount': 10, 'req_id': 4}, Subject())
+    send_queue.put({'buy': 1, 'price': 10, 'req_id': 5}, Subject())
+    send_queue.put({'time': 1, 'req_id': 6}, Subject(), priority='trade')
+    assert len(send_queue) == 6
+    await asyncio.sleep(0.01)
+    assert api.wsconnection.sent == [], 'nothing is written before connected'
+    api.connected.resolve(True)
+    await asyncio.sleep(0.01)
+    assert [r['req_id'] for r in api.wsconnection.sent] == [5, 6, 4, 3, 1, 2], 'higher priority classes go first'
+    assert len(send_queue) == 0
+    send_queue.put({'ping': 1, 'req_id': 4}, Subject())
+    await asyncio.sleep(0.01)
+    assert api.wsconnection.sent[-1] == {'ping': 1, 'req_id': 4}, 'writer wakes up for new requests'
+
+    api.connected = EasyFuture().reject(Exception('disconnected'))
+    source = Subject()
+    error = source.pipe(op.first(), op.to_future())
+    send_queue.put({'ping': 1, 'req_id': 5}, source)
+    with pytest.raises(Exception, match='disconnected'):
+        await error
+    writer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_priority_of():
+    send_queue = SendQueue(API(), {'ticks_history': 'normal', 'ping': 'trade'})
+    assert send_queue.priority_of({'sell': 1, 'price': 0}) == 'trade'
+    assert send_queue.priority_of({'proposal_open_contract': 1}) == 'pricing'
+    assert send_queue.priority_of({'statement': 1}) == 'bulk'
+    assert send_queue.priority_of({'ticks_history': 'R_50'}) == 'normal', 'defaults can be overridden'
+    assert send_queue.priority_of({'ping': 1}) == 'trade'
+    assert send_queue.priority_of({'time': 1}) == 'normal'
+    with pytest.raises(ValueError, match='Unknown priority urgent for ping'):
+        SendQueue(API(), {'ping': 'urgent'})
@@ -5,6 +5,7 @@ from reactivex.subject import Subject
 from reactivex import Observable
 import asyncio
 from deriv_api.errors import APIError
+from deriv_api.rate_limiter import RateLimiter
 
 mocked_response = {}
 
@@ -16,6 +17,7 @@ class API:
         self.send_request = {}
         self.send_and_get_source_called = 0
         self.send_called = 0
+        self.rate_limiter = RateLimiter()
 
     def send_and_get_source(self, request: dict) -> Subject:
         self.subject = Subject()
@@ -100,7 +102,10 @@ async def test_subscribe():
     source2, emit = await asyncio.gather(subscription_manager.subscribe(request), api.emit())
     assert api.send_and_get_source_called == 0 , "send_and_get_source not called"
     assert source is source2, '"buy" source and "proposal_open_contract" source are same one and cached'
+    assert subscription_manager.contract_id_to_key[12345] in subscription_manager.buy_key_to_contract_id
+    assert not subscription_manager.source_exists({'ticks': 'R_50'}), 'a request without contract_id is not a poc'
     await subscription_manager.forget(subs_id)
+    assert subscription_manager.contract_id_to_key == {}, 'the contract_id index is cleared'
     api.__init__()
     source2, emit = await asyncio.gather(subscription_manager.subscribe(request), api.emit())
     assert api.send_and_get_source_called == 1 , "cache is cleared so the new call will get"
@@ -112,3 +117,91 @@ async def test_forget_all():
     subscription_manager = SubscriptionManager(api)
     result = await subscription_manager.forget_all("hello")
     assert result == {'forget_all': ["hello"]}
+
+
+@pytest.mark.asyncio
+async def test_linger():
+    api = API()
+    subscription_manager = SubscriptionManager(api, linger=0.2)
+    api.mocked_response = {"msg_type": "ticks", 'subscription': {'id': 'ID33333'}}
+    source, emit = await asyncio.gather(subscription_manager.subscribe({'ticks': 'R_50'}), api.emit())
+    key = next(iter(subscription_manager.sources))
+    assert subscription_manager.refcounts[key] == 0, 'reading the first response is not counted'
+    first = source.subscribe(lambda _: None)
+    second = source.subscribe(lambda _: None)
+    assert subscription_manager.refcounts[key] == 2
+    first.dispose()
+    second.dispose()
+    await asyncio.sleep(0.1)
+    assert api.send_called == 0, 'the subscription lingers'
+    source2 = await subscription_manager.subscribe({'ticks': 'R_50'})
+    assert source2 is source, 'the lingering subscription is reused'
+    third = source2.subscribe(lambda _: None)
+    await asyncio.sleep(0.2)
+    assert api.send_called == 0, 'the linger is cancelled by the new observer'
+    third.dispose()
+    await asyncio.sleep(0.3)
+    assert api.send_request == {1: {'forget': 'ID33333'}}, 'forgotten after the linger'
+    assert subscription_manager.refcounts == {}
+    assert subscription_manager.linger_handles == {}
+
+
+@pytest.mark.asyncio
+async def test_no_linger():
+    api = API()
+    subscription_manager = SubscriptionManager(api)
+    api.mocked_response = {"msg_type": "ticks", 'subscription': {'id': 'ID44444'}}
+    source, emit = await asyncio.gather(subscription_manager.subscribe({'ticks': 'R_50'}), api.emit())
+    source.subscribe(lambda _: None).dispose()
+    await asyncio.sleep(0.01)
+    assert api.send_request == {1: {'forget': 'ID44444'}}, 'forgotten when the last observer is disposed'
+
+
+@pytest.mark.asyncio
+async def test_tick_history():
+    api = API()
+    subscription_manager = SubscriptionManager(api, tick_history=2)
+    api.mocked_response = {"msg_type": "tick", 'subscription': {'id': 'ID55555'},
+                           'tick': {'epoch': 1, 'quote': 100.5, 'bid': 100.4, 'ask': 100.6, 'symbol': 'R_50'}}
+    source, emit = await asyncio.gather(subscription_manager.subscribe({'ticks': 'R_50'}), api.emit())
+    key = next(iter(subscription_manager.sources))
+    assert subscription_manager.refcounts[key] == 0, 'the history is not counted as an observer'
+    for epoch in [2, 3]:
+        api.subject.on_next({"msg_type": "tick", 'tick': {'epoch': epoch, 'quote': 100 + epoch, 'symbol': 'R_50'}})
+    history = subscription_manager.tick_histories['R_50']
+    assert list(history.last()['epoch']) == [2, 3]
+    assert list(history.last()['quote']) == [102, 103]
+
+    api.__init__()
+    subscription_manager = SubscriptionManager(api)
+    source, emit = await asyncio.gather(subscription_manager.subscribe({'ticks': 'R_50'}), api.emit())
+    assert subscription_manager.tick_histories == {}, 'no history by default'
+
+
+@pytest.mark.asyncio
+async def test_replay():
+    api = API()
+    subscription_manager = SubscriptionManager(api)
+    api.mocked_response = {"msg_type": "balance", 'subscription': {'id': 'ID66666'}, 'balance': {'balance': 1}}
+    source, emit = await asyncio.gather(subscription_manager.subscribe({'balance': 1}), api.emit())
+    first = []
+    source.subscribe(first.append)
+    api.subject.on_next({"msg_type": "balance", 'balance': {'balance': 2}})
+
+    late = []
+    replayed = await subscription_manager.subscribe({'balance': 1}, replay=1)
+    replayed.subscribe(late.append)
+    assert [m['balance']['balance'] for m in late] == [2], 'the last message is delivered at once'
+    api.subject.on_next({"msg_type": "balance", 'balance': {'balance': 3}})
+    assert [m['balance']['balance'] for m in late] == [2, 3]
+    assert [m['balance']['balance'] for m in first] == [2, 3], 'the other observers get no replay'
+
+    longer = await subscription_manager.subscribe({'balance': 1}, replay=3)
+    api.subject.on_next({"msg_type": "balance", 'balance': {'balance': 4}})
+    api.subject.on_next({"msg_type": "balance", 'balance': {'balance': 5}})
+    latest = []
+    longer.subscribe(latest.append)
+    assert [m['balance']['balance'] for m in latest] == [3, 4, 5], 'more messages are kept after a longer replay'
+
+    await subscription_manager.forget('ID66666')
+    assert subscription_manager.replays == {}, 'the kept messages are dropped with the subscription'
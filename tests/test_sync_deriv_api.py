@@ -0,0 +1,77 @@
+import asyncio
+import json
+import queue
+import threading
+
+import pytest
+from reactivex.subject import Subject
+
+from deriv_api import SyncDerivAPI
+from deriv_api.sync_deriv_api import SyncSubscription
+from deriv_api.errors import ResponseError
+
+
+class Connection:
+    """A connection that answers pings, fails time calls and streams ticks"""
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+        self.sent = []
+
+    async def send(self, data):
+        request = json.loads(data)
+        self.sent.append(request)
+        response = {'echo_req': request, 'req_id': request['req_id']}
+        if 'ticks' in request:
+            for quote in range(3):
+                self.queue.put_nowait(json.dumps({**response, 'msg_type': 'tick', 'tick': {'quote': quote},
+                                                  'subscription': {'id': 'ticks-1'}}))
+            return
+        if 'forget' in request:
+            response.update({'msg_type': 'forget', 'forget': 1})
+        elif 'time' in request:
+            response.update({'msg_type': 'time', 'error': {'code': 'Failed', 'message': 'failed'}})
+        else:
+            response.update({'msg_type': 'ping', 'ping': 'pong'})
+        self.queue.put_nowait(json.dumps(response))
+
+    async def recv(self):
+        return await self.queue.get()
+
+
+def test_sync_deriv_api():
+    connection = Connection()
+    with SyncDerivAPI(timeout=5, connection=connection) as api:
+        assert api.ping()['ping'] == 'pong'
+        assert api.ping.__doc__.strip().startswith('To send the ping request to the server')
+        with pytest.raises(ResponseError, match='failed'):
+            api.time()
+
+        responses = []
+        threads = [threading.Thread(target=lambda: responses.append(api.ping({'ping': 1}))) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(responses) == 10, 'calls from several threads share the connection'
+
+        ticks = api.subscribe({'ticks': 'R_100'})
+        assert [ticks.get(timeout=1)['tick']['quote'] for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(queue.Empty):
+            ticks.get(timeout=0.05)
+        ticks.close()
+        assert list(ticks) == []
+    assert not api.thread.is_alive()
+
+
+def test_sync_subscription_end_is_kept():
+    class API:
+        loop = asyncio.new_event_loop()
+
+    source = Subject()
+    ticks = SyncSubscription(API(), source, maxsize=1)
+    source.on_next({'tick': {'quote': 0}})
+    ticks.close()
+    source.on_next({'tick': {'quote': 1}})
+    assert list(ticks) == [], 'a message that arrives after close does not drop the end of the stream'
+    API.loop.close()
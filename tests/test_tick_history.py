@@ -0,0 +1,24 @@
+import math
+
+from deriv_api.tick_history import TickHistory
+
+
+def test_tick_history():
+    history = TickHistory(3)
+    assert len(history) == 0
+    assert list(history.last()['quote']) == []
+    history.append({'epoch': 1, 'quote': 10.5, 'bid': 10.4, 'ask': 10.6, 'symbol': 'R_100'})
+    history.append({'epoch': 2, 'quote': 11})
+    assert len(history) == 2
+    last = history.last()
+    assert list(last['epoch']) == [1, 2]
+    assert list(last['quote']) == [10.5, 11]
+    assert last['bid'][0] == 10.4 and math.isnan(last['bid'][1]), 'a missing bid is NaN'
+    history.append({'epoch': 3, 'quote': 12})
+    history.append({'epoch': 4, 'quote': 13})
+    assert len(history) == 3, 'the oldest tick is overwritten'
+    assert list(history.last()['epoch']) == [2, 3, 4]
+    assert list(history.last(2)['quote']) == [12, 13], 'the last ticks across the end of the arrays'
+    assert list(history.last(10)['epoch']) == [2, 3, 4]
+    assert list(history.last(0)['epoch']) == []
+    assert history.last()['epoch'].typecode == 'q' and history.last()['quote'].typecode == 'd'
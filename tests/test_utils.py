@@ -1,6 +1,38 @@
-from deriv_api.utils import dict_to_cache_key
-import pickle
+from deriv_api.utils import dict_to_cache_key, request_key
+
+
+def test_request_key():
+    assert hash(request_key({'ticks': 'R_100'})) == hash(request_key({'ticks': 'R_100'})), 'the key can be hashed'
+    assert request_key({"hello": "world", "subscribe": 1, "passthrough": 1, "req_id": 1}) == \
+           request_key({"hello": "world"}), 'req_id, passthrough and subscribe are ignored'
+    assert request_key({'ticks': 'R_100', 'style': 'ticks'}) == request_key({'style': 'ticks', 'ticks': 'R_100'}), \
+        'the order of the fields does not matter'
+    assert request_key({'buy': 1, 'parameters': {'amount': 10, 'symbol': 'R_100'}, 'tags': ['a', 'b']}) == \
+           request_key({'tags': ['a', 'b'], 'parameters': {'symbol': 'R_100', 'amount': 10}, 'buy': 1}), \
+        'nested dicts are normalized'
+    assert request_key({'items': [{'a': 1, 'b': 2}]}) == request_key({'items': [{'b': 2, 'a': 1}]}), \
+        'dicts in lists are normalized'
+    assert request_key({'parameters': {'req_id': 1}}) != request_key({'parameters': {}}), \
+        'only the top level fields are ignored'
+    assert request_key({'tags': ['a', 'b']}) != request_key({'tags': ['b', 'a']}), 'lists keep the order'
+    assert request_key({'parameters': {'a': 1}}) != request_key({'parameters': [('a', 1)]})
+    assert request_key({'ticks': 'R_100'}) != request_key({'ticks': 'R_50'})
+    assert request_key({'a': 1, 'b': 1}) != request_key({'ab': 1})
+    assert request_key({'amount': 1.0}) == request_key({'amount': 1}), 'values are compared as python compares them'
+
+
+def test_request_key_nested_field_order():
+    request = {'buy': 1, 'parameters': {'amount': 10}}
+    flat_key = request_key({'parameters': 10, 'buy': 1})
+    assert request_key({'parameters': {'amount': 10}, 'buy': 1}) == request_key(request)
+    assert request_key({'parameters': 10, 'buy': 1}) == flat_key, \
+        'the key of a flat request does not change after the same fields had nested values'
 
 
 def test_dict_to_cache_key():
-    assert(pickle.loads(dict_to_cache_key({"hello": "world", "subscribe": 1, "passthrough": 1, "req_id": 1})) == {"hello": "world"})
+    assert isinstance(dict_to_cache_key({'ticks': 'R_100'}), bytes), 'the key can be stored by any storage'
+    assert dict_to_cache_key({'ticks': 'R_100', 'style': 'ticks', 'req_id': 1}) == \
+           dict_to_cache_key({'style': 'ticks', 'ticks': 'R_100'})
+    assert dict_to_cache_key({'buy': 1, 'parameters': {'amount': 10, 'symbol': 'R_100'}}) == \
+           dict_to_cache_key({'parameters': {'symbol': 'R_100', 'amount': 10}, 'buy': 1})
+    assert dict_to_cache_key({'ticks': 'R_100'}) != dict_to_cache_key({'ticks': 'R_50'})